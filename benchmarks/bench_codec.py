@@ -0,0 +1,144 @@
+"""Micro-benchmarks of the CPU-bound paths of goplus.py: parameter codecs, SysEx construction and address math.
+
+Each benchmark runs over every block model at a realistic batch size (16 parts or zones, one system block)
+and reports operations per second and the peak memory allocated per batch. Results are compared with a
+stored baseline, the run fails if anything got slower by more than the margin.
+
+    python benchmarks/bench_codec.py            # compare with benchmarks/baseline.json
+    python benchmarks/bench_codec.py --save     # store the current results as the baseline
+
+Baselines are machine specific and not kept in the repository: run --save first on the machine that
+runs the comparison, e.g. on the commit a change is compared against.
+"""
+import argparse, json, os, random, sys, time, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import goplus as g
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_MARGIN = 0.25 # fail if ops/sec drops by more than this fraction of the baseline
+MODELS = {
+    "part": (g.PART_MODEL, 16),
+    "zone": (g.ZONE_MODEL, 16),
+    "setup": (g.SETUP_MODEL, 1),
+    "sys_common": (g.SYS_COMMON_MODEL, 1),
+    "sys_ctrl": (g.SYS_CTRL_MODEL, 1),
+    "patch_common": (g.PATCH_COMMON_MODEL, 16),
+}
+MODEL_ID = g.MODEL_IDS['GK']
+
+def model_benchmarks(name, data_model, batch, rng):
+    """Returns (benchmark name, operations per call, function) for one block model."""
+    codec = g.codec_for(data_model)
+    blocks = [list(codec.encode(codec.random_values(rng))) for _ in range(batch)]
+    params = [g.bytes_to_params(block, data_model) for block in blocks]
+    values = codec.decode_many(blocks)
+    addresses = [g.slice_to_7bit(g.reassemble_from_7bit(g.calculate_part_address(1)) + 0x80 * i) for i in range(batch)]
+    changed = [list(block) for block in blocks]
+    for block in changed:
+        block[rng.randrange(len(block))] ^= 1
+        block[rng.randrange(len(block))] ^= 1
+    ranges = [g.diff_ranges(old, new) for old, new in zip(blocks, changed)]
+    address_bytes = [g.convert_address_to_bytes(addr) for addr in addresses]
+    builder = g.sysex_builder(MODEL_ID)
+    return [
+        (f"{name}.bytes_to_params", batch, lambda: [g.bytes_to_params(block, data_model) for block in blocks]),
+        (f"{name}.params_to_bytes", batch, lambda: [g.params_to_bytes(block_params) for block_params in params]),
+        (f"{name}.decode_many", batch, lambda: codec.decode_many(blocks)),
+        (f"{name}.encode", batch, lambda: [codec.encode(block_values) for block_values in values]),
+        (f"{name}.construct_dt1_command", batch, lambda: [g.construct_dt1_command(MODEL_ID, addr, block) for addr, block in zip(addresses, blocks)]),
+        (f"{name}.construct_rq1_command", batch, lambda: [g.construct_rq1_command(MODEL_ID, addr, codec.size) for addr in addresses]),
+        (f"{name}.dt1_ranges", batch, lambda: [builder.dt1_ranges(addr, block, block_ranges) for addr, block, block_ranges in zip(addresses, changed, ranges)]),
+        (f"{name}.checksum", batch, lambda: [g.checksum(addr_bytes, block) for addr_bytes, block in zip(address_bytes, blocks)]),
+    ]
+
+def address_benchmarks(rng):
+    linear = [rng.randrange(1 << 28) for _ in range(256)]
+    sliced = [g.slice_to_7bit(x) for x in linear]
+    return [
+        ("address.slice_to_7bit", len(linear), lambda: [g.slice_to_7bit(x) for x in linear]),
+        ("address.reassemble_from_7bit", len(sliced), lambda: [g.reassemble_from_7bit(x) for x in sliced]),
+    ]
+
+def measure(function, ops, min_time, repeat):
+    """Returns (operations per second, peak bytes allocated per call): best of repeat rounds of at least min_time."""
+    calls = 1
+    while True: # calibrate the number of calls per round
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return ops * calls / best, peak
+
+def run(pattern, min_time, repeat, names=None):
+    """Runs the benchmarks whose name contains pattern (and is in names, if given)."""
+    rng = random.Random(0) # same data on every run
+    benchmarks = address_benchmarks(rng)
+    for name, (data_model, batch) in MODELS.items():
+        benchmarks += model_benchmarks(name, data_model, batch, rng)
+    results = {}
+    for name, ops, function in benchmarks:
+        if (pattern and pattern not in name) or (names is not None and name not in names):
+            continue
+        ops_per_sec, peak = measure(function, ops, min_time, repeat)
+        results[name] = {"ops_per_sec": round(ops_per_sec), "peak_bytes": peak}
+        print(f"{name:<40}{ops_per_sec:>14,.0f} ops/s{peak:>12,} B peak", flush=True)
+    return results
+
+def regressions(results, baseline, margin):
+    """Returns the names of benchmarks slower than the baseline by more than margin."""
+    return [name for name, result in results.items()
+            if name in baseline and result["ops_per_sec"] < (1 - margin) * baseline[name]["ops_per_sec"]]
+
+def main():
+    parser = argparse.ArgumentParser(description="%(prog)s - goplus.py codec and SysEx micro-benchmarks")
+    parser.add_argument('filter', nargs='?', help="Only run benchmarks whose name contains this")
+    parser.add_argument('--baseline', default=BASELINE, help="Baseline file (default: benchmarks/baseline.json)")
+    parser.add_argument('--save', action='store_true', help="Store the results as the new baseline instead of comparing")
+    parser.add_argument('--margin', type=float, default=DEFAULT_MARGIN, help=f"Allowed slowdown as a fraction of the baseline (default: {DEFAULT_MARGIN})")
+    parser.add_argument('--min-time', type=float, default=0.1, help="Seconds per measurement round (default: 0.1)")
+    parser.add_argument('--repeat', type=int, default=7, help="Rounds per benchmark, the best counts (default: 7)")
+    args = parser.parse_args()
+
+    results = run(args.filter, args.min_time, args.repeat)
+    if args.save:
+        baseline = {}
+        if args.filter and os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=1, sort_keys=True)
+        print(f"Saved {len(results)} results to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        sys.exit(f"Error: no baseline {args.baseline}, create one with --save")
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressed = regressions(results, baseline, args.margin)
+    if regressed: # measure again before failing, a busy machine slows single rounds down
+        print(f"Measuring {len(regressed)} slower benchmarks again")
+        results.update(run(None, 2 * args.min_time, 2 * args.repeat, set(regressed)))
+        regressed = regressions(results, baseline, args.margin)
+    for name in regressed:
+        ratio = results[name]["ops_per_sec"] / baseline[name]["ops_per_sec"]
+        print(f"REGRESSION {name}: {results[name]['ops_per_sec']:,} ops/s is {1 - ratio:.0%} below the baseline {baseline[name]['ops_per_sec']:,}")
+    if regressed:
+        sys.exit(f"{len(regressed)} benchmarks regressed by more than {args.margin:.0%}")
+    print(f"No regressions beyond {args.margin:.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
-import argparse, copy, threading, time
+import argparse, asyncio, bisect, collections, contextlib, copy, difflib, fnmatch, importlib, io, itertools, json, os, queue, random, re, socket, socketserver, struct, sys, tempfile, threading, time, traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from operator import itemgetter
 import rtmidi
 from rtmidi.midiutil import open_midiinput, open_midioutput
+try:
+    import goplus_patches # generated patch catalog, see `goplus.py patch build-index`
+except ImportError: # goplus.py also works on its own, without patch names
+    goplus_patches = None
 
 # Constants
 
@@ -19,6 +24,25 @@ SOUND_DEMO_SWITCH = 0x0F002000 # set to 0x00 for turning off, 0x01 1st layer etc
 
 RQ1 = 0x11
 DT1 = 0x12
+MAX_RQ1_SIZE = 0x800 # largest span asked for in a single RQ1, the device answers with one or more DT1 messages
+DEFAULT_TIMEOUT = 1.0 # seconds to wait for a reply before the round-trip time has been measured
+MIN_TIMEOUT = 0.05 # lower bound for the adaptive timeout
+MAX_TIMEOUT = 5.0 # upper bound for the adaptive timeout, including backoff
+DEFAULT_RETRIES = 3 # requests are re-sent this many times before giving up
+BYTE_TRANSFER_TIME = 10 / 31250 # seconds per byte on a DIN MIDI link, allowance for long replies
+DEFAULT_TX_RATE = None # bytes per second sent to the device, None for as fast as the port takes them (USB, BLE)
+DIN_TX_RATE = 3125 # bytes per second of a DIN MIDI link, where `sys calibrate` starts
+TEMPO_STEP_SPACING = 0.04 # seconds between loop mix tempo steps, closer steps may be dropped
+MAX_TEMPO_ROUNDS = 10 # bursts of tempo steps sent by `loopmix tempo --bpm` before giving up
+DT1_OVERHEAD = 14 # bytes in a DT1 message besides the data: header, model ID, command, address, checksum, EOX
+RQ1_OVERHEAD = 18 + DT1_OVERHEAD # bytes another read costs: the RQ1 message and the header of its DT1 reply
+SHADOW_DIR = os.path.join(os.path.expanduser("~"), ".cache", "goplus") # persisted shadows, one file per identity reply and port
+SCENES_FILE = os.path.join(os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config"),
+                           "goplus", "scenes.json") # named part & zone settings, see `goplus scene`
+OSC_PORT = 9000 # UDP port of `goplus osc`
+OSC_TICK = 0.01 # seconds between two flushes of the latest OSC values to the keyboard
+DAEMON_SOCKET = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(),
+                             f"goplus-{os.getuid() if hasattr(os, 'getuid') else 0}.sock") # where `goplus serve` listens
 IDENTITY_REQUEST = [0xF0, 0x7E, 0x10, 0x06, 0x01, 0xF7]
 IDENTITY_REPLY_START = [0xF0, 0x7E, 0x10, 0x06, 0x02, 0x41] 
 
@@ -30,11 +54,13 @@ MODEL_ID_AUX = '00000028' # GO keyboards respond also to this address. Correspon
 
 KEYS = ['C-1', 'C#-1', 'D-1', 'Eb-1', 'E-1', 'F-1', 'F#-1', 'G-1', 'G#-1', 'A-1', 'Bb-1', 'B-1', 'C0', 'C#0','D0', 'Eb0', 'E0', 'F0', 'F#0', 'G0', 'G#0', 'A0', 'Bb0', 'B0', 'C1', 'C#1', 'D1', 'Eb1', 'E1', 'F1', 'F#1', 'G1', 'G#1', 'A1', 'Bb1', 'B1', 'C2', 'C#2', 'D2', 'Eb2', 'E2', 'F2', 'F#2', 'G2', 'G#2', 'A2', 'Bb2', 'B2', 'C3', 'C#3', 'D3', 'Eb3', 'E3', 'F3', 'F#3', 'G 3', 'G#3', 'A3', 'Bb3', 'B3', 'C4', 'C#4', 'D4', 'Eb4', 'E4', 'F4', 'F#4', 'G4', 'G#4', 'A4', 'Bb4', 'B4', 'C5', 'C#5', 'D5', 'Eb5', 'E5', 'F5', 'F#5', 'G5', 'G#5', 'A5', 'Bb5', 'B5', 'C6', 'C#6', 'D6', 'Eb6', 'E6', 'F6', 'F#6', 'G6', 'G#6', 'A6', 'Bb6', 'B6', 'C7', 'C#7', 'D7', 'Eb7', 'E7', 'F7', 'F#7', 'G7', 'G#7', 'A7', 'Bb7', 'B7', 'C8', 'C#8', 'D8', 'Eb8', 'E8', 'F8', 'F#8', 'G8', 'G#8', 'A8', 'Bb8', 'B8', 'C9', 'C#9', 'D9', 'Eb9', 'E9', 'F9', 'F#9', 'G9']
 PATCH_CATEGORIES = ["DRM","PNO","EP","KEY","BEL","MLT","ORG", "ACD","HRM", "AGT", "EGT", "DGT", "BS", "SBS", "STR", "ORC", "HIT", "WND","FLT", "BRS", "SBR", "SAX", "HLD", "SLD", "TEK", "PLS", "FX", "SYN", "BPD", "SPD", "VOX", "PLK", "ETH", "FRT","PRC", "SFX", "BTS", "DRM", "CMB", "SMP"]
+FUZZY_CANDIDATES = 100 # names sharing the most letter pairs with a misspelt query, compared in full by `patch find`
 
 LOOPMIX_STYLES = ['Trance','Funk','House','Drum N Bass','Neo HipHop','Pop','Bright Rock','Trap Step','Future Bass','Trad HipHop','EDM','R&B', 'Reggaeton', 'Cumbia', 'ColombianPop', 'Bossa Lounge', 'Arrocha', 'Drum N Bossa', 'Bahia Mix', 'Power Rock', 'Classic Rock', 'J-Pop']
 LOOPMIX_KEYS = ['C', 'C#', 'D', 'Eb', 'E', 'F', 'F#', 'G', 'Ab', 'A', 'Bb', 'B']
 TEMPO_DOWN_ADDR = 0x01000503
 TEMPO_UP_ADDR = 0x01000504
+LOOPMIX_TEMPO_ADDR = 0x01000108 # 2 bytes, 7 bits each
 
 SETUP_MODEL = [ 
 		{ "addr": 0x0000,	"size": 1, "data_width": 3,	"ofs": 0,	"init": 0,	"min": 0,	"max": 4,	"name": "SoundMode" },
@@ -349,12 +375,481 @@ PATCH_COMMON_MODEL = [
 		{ "addr": 0x004F,	"size": 1, "data_width": 1,	"ofs": 0,	"init": 0,	"min": 0,	"max": 1,	"name": "PartModulationSw" }
 	]
 
+SETUP_SIZE = sum(param["size"] for param in SETUP_MODEL)
+SYS_COMMON_SIZE = sum(param["size"] for param in SYS_COMMON_MODEL)
+SYS_CTRL_SIZE = sum(param["size"] for param in SYS_CTRL_MODEL)
+ZONE_SIZE = sum(param["size"] for param in ZONE_MODEL)
+PART_SIZE = sum(param["size"] for param in PART_MODEL)
+PATCH_COMMON_SIZE = sum(param["size"] for param in PATCH_COMMON_MODEL)
+
+class SysExTimeoutError(TimeoutError):
+    """Raised when the keyboard does not answer a request, even after retries."""
+
+class IOStats:
+    """Counters and latency histograms of the MIDI traffic of a MidiManager.
+    Latencies are counted in power-of-two millisecond buckets (<1, <2, <4, ... ms) per kind,
+    e.g. the kind of block a RQ1 reads. Hooks get every sample as hook(metric, value, kind),
+    for exporting to other monitoring. Samples are taken in the MIDI input callback, so the
+    bookkeeping there is a few additions, hooks are called from a thread of their own.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hooks = []
+        self.samples = queue.SimpleQueue() # (metric, value, kind) waiting for the hooks
+        self.hook_thread = None
+        self.reset()
+    def reset(self):
+        with self.lock:
+            self.since = time.time()
+            self.counters = collections.Counter()
+            self.latencies = {} # (metric, kind) -> [count, total seconds, max seconds, bucket counts]
+    def add_hook(self, hook):
+        self.hooks.append(hook)
+        if self.hook_thread is None:
+            self.hook_thread = threading.Thread(target=self.run_hooks, name="goplus-stats", daemon=True)
+            self.hook_thread.start()
+    def run_hooks(self):
+        while True:
+            sample = self.samples.get()
+            for hook in self.hooks:
+                try:
+                    hook(*sample)
+                except Exception:
+                    traceback.print_exc()
+    def count(self, metric, value=1):
+        with self.lock:
+            self.counters[metric] += value
+        if self.hooks:
+            self.samples.put((metric, value, None))
+    def record(self, metric, kind, seconds):
+        bucket = int(seconds * 1000).bit_length()
+        with self.lock:
+            entry = self.latencies.setdefault((metric, kind), [0, 0.0, 0.0, []])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+            if len(entry[3]) <= bucket:
+                entry[3].extend([0] * (bucket + 1 - len(entry[3])))
+            entry[3][bucket] += 1
+        if self.hooks:
+            self.samples.put((metric, seconds, kind))
+    def as_dict(self):
+        with self.lock:
+            return {"since": self.since,
+                    "counters": dict(self.counters),
+                    "latencies": [{"metric": metric, "kind": kind, "count": count, "mean_ms": 1000 * total / count,
+                                   "max_ms": 1000 * longest, "buckets_ms": {f"<{1 << i}": n for i, n in enumerate(buckets) if n}}
+                                  for (metric, kind), (count, total, longest, buckets) in sorted(self.latencies.items())]}
+    def report(self):
+        stats = self.as_dict()
+        lines = [f"I/O statistics since {time.strftime('%H:%M:%S', time.localtime(stats['since']))}:"]
+        lines += [f"  {metric}: {value}" for metric, value in sorted(stats["counters"].items())]
+        for entry in stats["latencies"]:
+            buckets = " ".join(f"{limit}ms:{n}" for limit, n in entry["buckets_ms"].items())
+            lines.append(f"  {entry['metric']} {entry['kind']}: n={entry['count']} mean {entry['mean_ms']:.1f} ms, max {entry['max_ms']:.1f} ms [{buckets}]")
+        return "\n".join(lines)
+
+class PendingRequest:
+    """A request awaiting a reply from the keyboard, re-sent on timeout."""
+    def __init__(self, size=0):
+        self.size = size # bytes expected back, stretches the deadline for long replies
+        self.attempts = 0
+        self.started_at = None # first attempt, latency statistics count from here
+        self.sent_at = None
+        self.deadline = None
+        self.fallback = False # re-sent in another form, replies can't be timed against sent_at
+        self.future = Future()
+    def messages(self):
+        """Returns the MIDI messages to (re)send for this request."""
+        return []
+    def latencies(self, now):
+        """Returns {kind: seconds} from the first attempt until the reply completed, for the statistics."""
+        return {self.kind: now - self.started_at}
+    def describe(self):
+        return "request"
+
+class PendingReply(PendingRequest):
+    """Waits for the first incoming message accepted by a predicate, e.g. Identity Reply."""
+    def __init__(self, predicate, request=None, name="reply"):
+        super().__init__()
+        self.predicate = predicate
+        self.request = request
+        self.name = name
+        self.kind = name
+    def messages(self):
+        return [self.request] if self.request else []
+    def describe(self):
+        return self.name
+
+class PendingRead(PendingRequest):
+    """An outstanding RQ1 request, collecting DT1 replies for the blocks it covers."""
+    def __init__(self, model_id, blocks, max_size=MAX_RQ1_SIZE, single=False, out=None):
+        super().__init__(sum(size for _,size in blocks))
+        self.model_id = model_id
+        self.model_id_bytes = split_hex_string(model_id)
+        self.blocks = blocks
+        self.kinds = [block_kind(addr) for addr,_ in blocks] # statistics are kept per kind of block
+        self.max_size = max_size
+        self.single = single # resolve with the data of the only block instead of a list of blocks
+        self.starts = [reassemble_from_7bit(addr) for addr,_ in blocks]
+        self.out = out # caller's buffer for a single block, the replies are written straight into it
+        self.buffers = [out] if out is not None else [bytearray(size) for _,size in blocks]
+        self.filled = [bytearray(size) for _,size in blocks]
+        self.block_remaining = [size for _,size in blocks]
+        self.done_at = [None] * len(blocks) # when each block was complete
+        self.remaining = self.size
+        self.first = min(self.starts)
+        self.last = max(start + size for start,(_,size) in zip(self.starts,blocks))
+        self.merge_gap = RQ1_OVERHEAD # None once coalescing is given up
+    def messages(self):
+        return self.rq1_commands()
+    def split(self):
+        """Falls back to one RQ1 per block, for a device that does not answer spans covering unmapped addresses.
+        Returns False if there was nothing coalesced to split.
+        """
+        if self.merge_gap is None or all(len(indices) == 1 for _,_,indices in plan_block_reads(self.blocks,self.max_size,self.merge_gap)):
+            return False
+        self.merge_gap = None
+        self.attempts = 0
+        self.fallback = True
+        return True
+    def describe(self):
+        addr, size = self.blocks[0]
+        return f"read of {size} bytes at {addr:08X}" + (f" (+{len(self.blocks) - 1} blocks)" if len(self.blocks) > 1 else "")
+    def rq1_commands(self):
+        """One RQ1 per span of neighbouring blocks, spans larger than max_size are split into several RQ1s."""
+        commands = []
+        for span_addr, span_size, _ in plan_block_reads(self.blocks,self.max_size,self.merge_gap):
+            span_start = reassemble_from_7bit(span_addr)
+            for offset in range(0, span_size, self.max_size):
+                commands.append(construct_rq1_command(self.model_id, slice_to_7bit(span_start + offset), min(self.max_size, span_size - offset)))
+        return commands
+    def matches(self, model_id_bytes, dt1_start, dt1_end):
+        """Checks that a DT1 reply is for this model and falls within the requested address range."""
+        return model_id_bytes == self.model_id_bytes and dt1_start < self.last and dt1_end > self.first
+    def feed(self, dt1_start, dt1_data):
+        """Stores the part of a DT1 payload overlapping the requested blocks. Returns True once all data arrived."""
+        dt1_end = dt1_start + len(dt1_data)
+        for i, (start, buffer, mask) in enumerate(zip(self.starts, self.buffers, self.filled)):
+            lo, hi = max(start, dt1_start), min(start + len(buffer), dt1_end)
+            if lo < hi:
+                buffer[lo - start:hi - start] = bytes(dt1_data[lo - dt1_start:hi - dt1_start]) # memoryview slices need bytes
+                new = mask[lo - start:hi - start].count(0)
+                mask[lo - start:hi - start] = b'\x01' * (hi - lo)
+                self.remaining -= new
+                self.block_remaining[i] -= new
+                if new and not self.block_remaining[i]:
+                    self.done_at[i] = time.monotonic()
+        return self.remaining == 0
+    def latencies(self, now):
+        """Latency per kind of block: until the last block of that kind was complete."""
+        done = {}
+        for kind, done_at in zip(self.kinds, self.done_at):
+            done[kind] = max(done.get(kind, 0.0), done_at or now)
+        return {kind: done_at - self.started_at for kind, done_at in done.items()}
+    def result(self):
+        if self.out is not None:
+            return self.out
+        blocks_data = [list(buffer) for buffer in self.buffers]
+        return blocks_data[0] if self.single else blocks_data
+
+class TxScheduler:
+    """Single output queue drained by a background thread.
+    Messages leave at least `gap` seconds apart and, if a rate is set, no faster than `rate` bytes
+    per second, so bursts go out at the fastest pace the device absorbs instead of being dropped.
+    USB and BLE MIDI ports pace themselves, so by default there is no rate limit.
+    If the MIDI port fails, the scheduler stops: that message and everything queued or
+    queued later fails with the port's error.
+    """
+    def __init__(self, midi_out, rate=DEFAULT_TX_RATE, gap=0.0, stats=None):
+        self.midi_out = midi_out
+        self.stats = stats or IOStats()
+        self.rate = rate
+        self.gap = gap
+        self.queue = collections.deque()
+        self.queued_time = 0.0 # estimated seconds needed to send what is queued
+        self.cond = threading.Condition()
+        self.busy = False
+        self.closing = False
+        self.error = None # the exception that stopped the scheduler
+        self.ready_at = 0.0 # when the previous message has been absorbed at the configured rate
+        self.last_sent = float("-inf")
+        self.thread = threading.Thread(target=self.run, name="goplus-tx", daemon=True)
+        self.thread.start()
+    def send(self, message, spacing=0.0):
+        """Queues a message, to be sent at least `spacing` seconds after the previous one.
+        Returns:
+            A Future resolved once the message has been handed to the MIDI port.
+        """
+        return self.send_many((message,), spacing)
+    def send_many(self, messages, spacing=0.0):
+        """Queues a burst of messages at once, each `spacing` seconds after the previous one.
+        Returns:
+            A Future resolved once the last message of the burst has been handed to the MIDI port.
+        """
+        sent = Future()
+        queued_at = time.monotonic()
+        entries = [(message, spacing, max(self.transfer_time(message), spacing, self.gap), None, queued_at) for message in messages]
+        if not entries:
+            sent.set_result(None)
+            return sent
+        entries[-1] = entries[-1][:3] + (sent, queued_at)
+        with self.cond:
+            if self.error:
+                sent.set_exception(self.error)
+                return sent
+            self.queue.extend(entries)
+            self.queued_time += sum(entry[2] for entry in entries)
+            self.cond.notify_all()
+        return sent
+    def transfer_time(self, message):
+        """Seconds the device needs to absorb a message at the configured rate, 0 without a rate limit."""
+        return len(message) / self.rate if self.rate else 0.0
+    def backlog(self):
+        """Seconds until everything queued so far has been sent."""
+        with self.cond:
+            return max(0.0, self.ready_at - time.monotonic()) + self.queued_time
+    def flush(self):
+        """Waits until the queue is empty. Raises the port's error if the scheduler stopped."""
+        with self.cond:
+            while (self.queue or self.busy) and not self.error:
+                self.cond.wait()
+            if self.error:
+                raise self.error
+    def run(self):
+        while True:
+            with self.cond:
+                while not self.queue and not self.closing:
+                    self.cond.wait()
+                if not self.queue:
+                    return
+                message, spacing, cost, sent, queued_at = self.queue.popleft()
+                self.queued_time -= cost
+                self.busy = True
+            wait = max(self.ready_at, self.last_sent + max(self.gap, spacing)) - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                self.midi_out.send_message(message)
+            except Exception as e:
+                self.fail(e, sent)
+                return
+            self.count_sent(message, queued_at)
+            if sent:
+                sent.set_result(None)
+            self.last_sent = time.monotonic()
+            self.ready_at = self.last_sent + self.transfer_time(message)
+            with self.cond:
+                self.busy = False
+                self.cond.notify_all()
+    def fail(self, error, sent):
+        """Stops the scheduler, failing the message being sent and everything still queued."""
+        with self.cond:
+            self.error = error
+            failed = [sent] + [entry[3] for entry in self.queue]
+            self.queue.clear()
+            self.queued_time = 0.0
+            self.busy = False
+            self.cond.notify_all()
+        for future in failed:
+            if future:
+                future.set_exception(error)
+    def count_sent(self, message, queued_at):
+        if len(message) > 7 and message[0] == 0xF0 and message[1] == 0x41:
+            kind = {DT1: "dt1", RQ1: "rq1"}.get(message[7], "sysex")
+        else:
+            kind = "sysex" if message[0] == 0xF0 else "cc" if message[0] & 0xF0 == 0xB0 else "other"
+        self.stats.count(f"{kind} sent")
+        self.stats.count(f"{kind} bytes sent", len(message))
+        self.stats.record("tx queue wait", kind, time.monotonic() - queued_at)
+    def close(self):
+        """Sends what is queued and stops the thread. Raises the port's error if the scheduler stopped."""
+        try:
+            self.flush()
+        finally:
+            with self.cond:
+                self.closing = True
+                self.cond.notify_all()
+            self.thread.join()
+
+class ParamShadow:
+    """Local copy of parameter bytes known to be on the device, keyed by model ID and 7-bit address.
+    Only the SETUP, SYS_COMMON, SYS_CTRL, zone, part and patch common blocks are kept, other areas
+    (e.g. loop mix tempo) change on the device without notice.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.maps = {} # model_id -> {linear address: byte}
+        self.regions = [(reassemble_from_7bit(addr), reassemble_from_7bit(addr) + size) for addr, size in shadowed_blocks()]
+    def get(self, model_id, start_addr, size):
+        """Returns the bytes of a range if all of them are known, None otherwise."""
+        start = reassemble_from_7bit(start_addr)
+        with self.lock:
+            memory = self.maps.get(model_id)
+            if memory is None:
+                return None
+            try:
+                return [memory[addr] for addr in range(start, start + size)]
+            except KeyError:
+                return None
+    def known(self, model_id, start, size):
+        """Returns the bytes from linear address start on, None for those not known."""
+        with self.lock:
+            memory = self.maps.get(model_id, {})
+            return [memory.get(addr) for addr in range(start, start + size)]
+    def update(self, model_id, start_addr, data):
+        """Records bytes written to or received from the device."""
+        if model_id not in MODEL_IDS.values():
+            return
+        start = reassemble_from_7bit(start_addr)
+        end = start + len(data)
+        with self.lock:
+            memory = self.maps.setdefault(model_id, {})
+            changed = []
+            for region_start, region_end in self.regions:
+                for addr in range(max(start, region_start), min(end, region_end)):
+                    if memory.get(addr) != data[addr - start]:
+                        memory[addr] = data[addr - start]
+                        changed.append(addr)
+            if changed:
+                self.invalidate_dependents(memory, changed[0], changed[-1] + 1)
+    def invalidate_dependents(self, memory, start, end):
+        """Drops bytes the device changes as a side effect of a change within [start, end)."""
+        setup = reassemble_from_7bit(SETUP)
+        if start < setup + 4 and end > setup: # sound mode or performance selected, temporary performance reloads
+            self.drop(memory, lambda addr: addr >= reassemble_from_7bit(TMP_PERF_BASE))
+        for part_num in range(1, 17):
+            part = reassemble_from_7bit(calculate_part_address(part_num))
+            if start < part + 7 and end > part + 4: # patch selected, its temporary patch reloads
+                patch = reassemble_from_7bit(calculate_patch_address(part_num))
+                self.drop(memory, lambda addr: patch <= addr < patch + PATCH_COMMON_SIZE)
+    def drop(self, memory, predicate):
+        for addr in [addr for addr in memory if predicate(addr)]:
+            del memory[addr]
+    def invalidate(self, model_id=None, predicate=lambda addr: True):
+        """Forgets known bytes, for all models unless model_id is given."""
+        with self.lock:
+            for key, memory in self.maps.items():
+                if model_id is None or key == model_id:
+                    self.drop(memory, predicate)
+    def invalidate_parts(self):
+        """Forgets part and patch data, e.g. after the keyboard panel selected another tone."""
+        part = reassemble_from_7bit(PART_ADDRESS_BASE)
+        patch = reassemble_from_7bit(PATCH_ADDRESS_BASE)
+        self.invalidate(predicate=lambda addr: part <= addr < part + 16 * 0x80 or addr >= patch)
+    def save(self, path, identity):
+        """Stores known bytes as contiguous runs, together with the identity reply of the device."""
+        with self.lock:
+            maps = {}
+            for model_id, memory in self.maps.items():
+                runs = []
+                for addr in sorted(memory):
+                    if runs and runs[-1][0] + len(runs[-1][1]) == addr:
+                        runs[-1][1].append(memory[addr])
+                    else:
+                        runs.append([addr, [memory[addr]]])
+                maps[model_id] = [[addr, bytes(data).hex()] for addr, data in runs]
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"identity": bytes(identity).hex(), "maps": maps}, f)
+    def load(self, path, identity):
+        """Restores a saved shadow if it was taken from a device with the same identity reply."""
+        try:
+            with open(path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if saved.get("identity") != bytes(identity).hex():
+            return False
+        with self.lock:
+            for model_id, runs in saved["maps"].items():
+                memory = self.maps.setdefault(model_id, {})
+                for addr, data in runs:
+                    for i, value in enumerate(bytes.fromhex(data)):
+                        memory[addr + i] = value
+        return True
+
+def device_blocks():
+    """Returns (name, address, data_model) of every modelled block: setup, system,
+    16 zones, 16 parts and the patch common block of the patch each part holds."""
+    blocks = [("setup", SETUP, SETUP_MODEL), ("sys common", SYS_COMMON, SYS_COMMON_MODEL), ("sys ctrl", SYS_CTRL, SYS_CTRL_MODEL)]
+    for num in range(1, 17):
+        blocks.append((f"zone {num}", calculate_zone_address(num), ZONE_MODEL))
+        blocks.append((f"part {num}", calculate_part_address(num), PART_MODEL))
+        blocks.append((f"patch {num}", calculate_patch_address(num), PATCH_COMMON_MODEL))
+    return blocks
+
+def block_index():
+    """Returns (start, end, kind, number, data_model) of every modelled block, sorted by linear address.
+    kind is the block name without its number: "part", "zone", "patch", "setup", "sys common", "sys ctrl".
+    """
+    global BLOCK_INDEX
+    if BLOCK_INDEX is None:
+        index = []
+        for name, block_addr, data_model in device_blocks():
+            start = reassemble_from_7bit(block_addr)
+            kind, num = (name.rsplit(" ", 1)[0], int(name.rsplit(" ", 1)[1])) if name[-1].isdigit() else (name, None)
+            index.append((start, start + sum(param["size"] for param in data_model), kind, num, data_model))
+        BLOCK_INDEX = sorted(index, key=itemgetter(0))
+    return BLOCK_INDEX
+
+BLOCK_INDEX = None
+
+def find_blocks(start, end):
+    """Returns the block_index entries overlapping the linear address range [start, end)."""
+    index = block_index()
+    i = max(0, bisect.bisect_right(index, (start, float("inf"))) - 1)
+    found = []
+    while i < len(index) and index[i][0] < end:
+        if index[i][1] > start:
+            found.append(index[i])
+        i += 1
+    return found
+
+def block_kind(addr):
+    """Names the kind of block an address falls in ("part", "zone", "sys common", ...), "other" if not modelled."""
+    start = reassemble_from_7bit(addr)
+    found = find_blocks(start, start + 1)
+    return found[0][2] if found else "other"
+
+def shadowed_blocks():
+    """Returns (address, size) of every block kept in the shadow."""
+    return [(addr, sum(param["size"] for param in data_model)) for _, addr, data_model in device_blocks()]
+
+def shadow_path(identity, port):
+    """Names the persisted shadow of a device. Identical units send identical identity replies,
+    so the port name is part of the key too, otherwise keyboards in fleet mode would share one file."""
+    port_key = re.sub(r"[^\w.-]+", "_", port or "default")
+    return os.path.join(SHADOW_DIR, f"shadow-{bytes(identity[5:-1]).hex()}-{port_key}.json")
+
 class MidiManager:
-    def __init__(self, port):
+    def __init__(self, port, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, use_shadow=True, tx_rate=DEFAULT_TX_RATE, tx_gap=0.0, emulator=None):
         self.input_device_name = port
         self.output_device_name = port
+        self.emulator = emulator # KeyboardEmulator used instead of MIDI ports
         self.midi_in = None
         self.midi_out = None
+        self.lock = threading.Lock()
+        self.pending_reads = [] # RQ1s waiting for DT1 replies, oldest first
+        self.waiters = [] # other expected replies, e.g. Identity Reply
+        self.timeout = timeout # initial timeout, replaced by one derived from measured round-trips
+        self.retries = retries
+        self.srtt = None # smoothed round-trip time
+        self.rttvar = None # round-trip time variation
+        self.shadow = ParamShadow()
+        self.tx = None # TxScheduler, started with the dispatcher
+        self.stats = IOStats()
+        self.listeners = [] # called with every incoming message, before it updates the shadow
+        self.tx_rate = tx_rate
+        self.tx_gap = tx_gap
+        self.control_lock = threading.Lock()
+        self.selected_params = {} # channel -> ("rpn"/"nrpn", MSB, LSB) last selected by send_controls
+        self.tempo_step_spacing = 0.0 # learned by set_loopmix_tempo, grows when the device drops tempo steps
+        self.use_shadow = use_shadow # serve reads from the shadow when the data is known
+        self.identity = None # Identity Reply, once received
+        self.wakeup = threading.Event()
+        self.closing = False
+        self.watchdog_thread = None
     def __enter__(self):
         self.open_devices()
         return self
@@ -362,43 +857,254 @@ class MidiManager:
         self.close_devices()    
     def open_devices(self):
         try: # if MIDI port is not specified, try to open first available one
-            if self.input_device_name is None:
+            if self.emulator:
+                self.midi_in = self.midi_out = self.emulator
+                self.input_device_name = self.output_device_name = self.emulator.name
+            elif self.input_device_name is None:
                 self.midi_in, self.input_device_name = open_midiinput(0)
             else:
                 self.midi_in, self.input_device_name = open_midiinput(self.input_device_name) 
             self.midi_in.ignore_types(sysex=False)
-            if self.output_device_name is None:
+            if self.emulator:
+                pass
+            elif self.output_device_name is None:
                 self.midi_out, self.output_device_name = open_midioutput(0)
             else:
                 self.midi_out, self.output_device_name = open_midioutput(self.output_device_name)
+            self.start_dispatcher()
             return True
         except Exception as e:
             print(f"Error opening MIDI devices: {e}")
             return False
+    def start_dispatcher(self):
+        """Installs the input callback routing every incoming message to whoever awaits it,
+        and starts the output scheduler."""
+        self.tx = TxScheduler(self.midi_out, self.tx_rate, self.tx_gap, self.stats)
+        self.midi_in.set_callback(self.dispatch)
+        self.watchdog_thread = threading.Thread(target=self.watchdog, name="goplus-watchdog", daemon=True)
+        self.watchdog_thread.start()
+    def dispatch(self, event, data=None):
+        started = time.perf_counter()
+        message,_ = event
+        for listener in self.listeners:
+            listener(message)
+        if len(message) > 13 and message[0] == 0xF0 and message[1] == 0x41 and message[7] == DT1:
+            self.stats.count("dt1 received")
+            self.stats.count("dt1 bytes received", len(message))
+            self.dispatch_dt1(message)
+        elif message[0] & 0xF0 == 0xC0: # Program Change sent when a tone is selected on the panel
+            self.shadow.invalidate_parts()
+        with self.lock:
+            matched = [waiter for waiter in self.waiters if waiter.predicate(message)]
+            for waiter in matched:
+                self.waiters.remove(waiter)
+        for waiter in matched:
+            self.complete(waiter, message)
+        self.stats.record("dispatch", "callback", time.perf_counter() - started)
+    def dispatch_dt1(self, message):
+        """Matches a DT1 message to pending reads by model ID and address range."""
+        model_id_bytes = message[3:7]
+        dt1_address = int.from_bytes(bytes(message[8:12]), 'big')
+        dt1_start = reassemble_from_7bit(dt1_address)
+        dt1_data = message[12:-2]
+        dt1_end = dt1_start + len(dt1_data)
+        # replies and unsolicited changes (e.g. panel edits) alike keep the shadow current
+        self.shadow.update(bytes(model_id_bytes).hex().upper(), dt1_address, dt1_data)
+        completed, cancelled = [], []
+        with self.lock:
+            for pending in self.pending_reads:
+                if pending.future.cancelled(): # the reader gave up, its buffer is no longer ours to fill
+                    cancelled.append(pending)
+                elif pending.matches(model_id_bytes, dt1_start, dt1_end) and pending.feed(dt1_start, dt1_data):
+                    completed.append(pending)
+            for pending in completed + cancelled:
+                self.pending_reads.remove(pending)
+        for pending in completed:
+            self.complete(pending, pending.result())
+    def complete(self, pending, result):
+        now = time.monotonic()
+        if pending.attempts == 1 and not pending.fallback: # Karn's rule: only sample requests that were not re-sent
+            self.update_rtt(now - pending.sent_at)
+        for kind, seconds in pending.latencies(now).items():
+            self.stats.record("latency", kind, seconds)
+        if not pending.future.done():
+            pending.future.set_result(result)
+    def update_rtt(self, sample):
+        """Updates the smoothed round-trip estimate, the same way TCP does (RFC 6298)."""
+        if self.srtt is None:
+            self.srtt, self.rttvar = sample, sample / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - sample)
+            self.srtt = 0.875 * self.srtt + 0.125 * sample
+    def request_timeout(self, pending):
+        """Deadline for one attempt: adaptive estimate, stretched for long replies and doubled on each retry."""
+        base = self.timeout if self.srtt is None else self.srtt + 4 * self.rttvar
+        base = max(MIN_TIMEOUT, base) + pending.size * BYTE_TRANSFER_TIME
+        return min(MAX_TIMEOUT, base * 2 ** (pending.attempts - 1)) + self.tx.backlog()
+    def submit(self, pending, queue):
+        with self.lock:
+            queue.append(pending)
+        self.transmit(pending)
+        return pending.future
+    def transmit(self, pending):
+        pending.attempts += 1
+        pending.sent_at = time.monotonic()
+        if pending.attempts == 1:
+            pending.started_at = pending.sent_at
+        else:
+            self.stats.count("retries")
+        pending.deadline = pending.sent_at + self.request_timeout(pending)
+        sent = self.tx.send_many(pending.messages())
+        sent.add_done_callback(lambda sent: self.abort(pending, sent.exception()))
+        self.wakeup.set()
+    def abort(self, pending, error):
+        """Fails a request right away when its messages could not be sent."""
+        if error is None:
+            return
+        with self.lock:
+            for queue in (self.pending_reads, self.waiters):
+                if pending in queue:
+                    queue.remove(pending)
+        if not pending.future.done():
+            pending.future.set_exception(error)
+    def watchdog(self):
+        """Re-sends requests whose deadline passed and fails them once retries are exhausted."""
+        while not self.closing:
+            now = time.monotonic()
+            expired, failed = [], []
+            with self.lock:
+                for queue in (self.pending_reads, self.waiters):
+                    for pending in list(queue):
+                        if pending.future.cancelled():
+                            queue.remove(pending)
+                        elif pending.deadline is not None and pending.deadline <= now:
+                            if pending.attempts > self.retries and isinstance(pending, PendingRead) and pending.split():
+                                self.stats.count("split reads")
+                                expired.append(pending)
+                            elif pending.attempts > self.retries:
+                                queue.remove(pending)
+                                failed.append(pending)
+                            else:
+                                expired.append(pending)
+                deadlines = [pending.deadline for queue in (self.pending_reads, self.waiters)
+                             for pending in queue if pending.deadline is not None and pending not in expired]
+            for pending in failed:
+                self.stats.count("timeouts")
+                pending.future.set_exception(SysExTimeoutError(
+                    f"No reply to {pending.describe()} after {pending.attempts} attempts"))
+            for pending in expired:
+                self.transmit(pending)
+            if expired:
+                continue
+            self.wakeup.clear()
+            self.wakeup.wait(min(deadlines) - time.monotonic() if deadlines else None)
+    def request_blocks(self, blocks, model_id, max_size=MAX_RQ1_SIZE, single=False, fresh=False):
+        """Queues RQ1s for (address, size) blocks without waiting for the reply.
+        Blocks known in the shadow are not requested, unless `fresh` is set.
+        Returns:
+            A Future resolving to a list with the data bytes of each block.
+            It fails with SysExTimeoutError when the device does not answer.
+        """
+        if self.use_shadow and not fresh:
+            known = [self.shadow.get(model_id, addr, size) for addr, size in blocks]
+            missing = [block for block, data in zip(blocks, known) if data is None]
+            self.stats.count("shadow hits", len(blocks) - len(missing))
+            if not missing:
+                future = Future()
+                future.set_result(known[0] if single else known)
+                return future
+            if len(missing) < len(blocks): # only ask the device for what is not known
+                future = Future()
+                def merge(inner):
+                    if inner.exception():
+                        future.set_exception(inner.exception())
+                        return
+                    received = iter(inner.result())
+                    blocks_data = [data if data is not None else next(received) for data in known]
+                    future.set_result(blocks_data[0] if single else blocks_data)
+                self.submit(PendingRead(model_id, missing, max_size), self.pending_reads).add_done_callback(merge)
+                return future
+        return self.submit(PendingRead(model_id, blocks, max_size, single), self.pending_reads)
+    def request_into(self, start_addr, out, model_id, max_size=MAX_RQ1_SIZE):
+        """Queues RQ1s for len(out) bytes, writing the DT1 replies straight into out (a bytearray or writable memoryview).
+        The shadow is not consulted. Returns a Future resolving to out.
+        """
+        return self.submit(PendingRead(model_id, [(start_addr, len(out))], max_size, single=True, out=out), self.pending_reads)
+    def request_read(self, start_addr, size, model_id, fresh=False):
+        """Queues a RQ1 and returns a Future resolving to the data bytes read."""
+        return self.request_blocks([(start_addr, size)], model_id, single=True, fresh=fresh)
+    def expect(self, predicate, request=None, name="reply"):
+        """Sends request (if any) and returns a Future resolving to the next incoming message accepted by predicate."""
+        return self.submit(PendingReply(predicate, request, name), self.waiters)
     def close_devices(self):
-      if self.midi_in:
-        self.midi_in.close_port()
-      if self.midi_out:
-        self.midi_out.close_port()
+      try:
+        if self.tx:
+          self.tx.close() # let queued messages out first
+      finally:
+        self.closing = True
+        self.wakeup.set()
+        if self.midi_in:
+          self.midi_in.close_port()
+        if self.midi_out:
+          self.midi_out.close_port()
+    @contextlib.contextmanager
+    def overrides(self, timeout=None, retries=None, use_shadow=None, tx_rate=None, tx_gap=None):
+        """Changes request settings for the duration of a with block, e.g. for one forwarded command. None keeps a setting."""
+        settings = [(self, "timeout", timeout), (self, "retries", retries), (self, "use_shadow", use_shadow),
+                    (self.tx, "rate", tx_rate), (self.tx, "gap", tx_gap)]
+        saved = [(target, name, getattr(target, name)) for target, name, value in settings if value is not None]
+        for target, name, value in settings:
+            if value is not None:
+                setattr(target, name, value)
+        try:
+            yield self
+        finally:
+            for target, name, value in saved:
+                setattr(target, name, value)
+    def send_message(self, message, spacing=0.0):
+        """Queues a message for the output scheduler, returns a Future resolved once it is sent."""
+        return self.tx.send(message, spacing)
+    def send_messages(self, messages, spacing=0.0):
+        """Queues a burst of messages in one go, returns a Future resolved once they are sent."""
+        return self.tx.send_many(messages, spacing)
     def send_cc(self, channel, cc_number, value):
         """Sends a Control Change (CC) message."""
-        message = [
-            0xB0 + (channel - 1),  # Control Change (0xB0) on the specified channel
-            cc_number,             # The CC number
-            value                  # The CC value
-        ]
-        self.midi_out.send_message(message)
+        return self.send_controls([("cc", channel, cc_number, value)])
+    def send_controls(self, events):
+        """Sends controller events as one burst.
+        Args:
+            events: ("cc", channel, cc_number, value) or ("rpn"/"nrpn", channel, param_msb, param_lsb, data_msb, data_lsb) tuples.
+        The parameter select is skipped while the same RPN/NRPN is still selected on a channel.
+        RPNs are closed with the null function once, at the end of the burst.
+        Returns:
+            A Future resolved once the burst is sent.
+        """
+        with self.control_lock:
+            messages = []
+            for kind, channel, *values in events:
+                status = 0xB0 + (channel - 1) # Control Change on the channel
+                if kind == "cc":
+                    cc_number, value = values
+                    messages.append(bytes((status, cc_number, value)))
+                    if cc_number in (0x62, 0x63, 0x64, 0x65): # a parameter select we don't keep track of
+                        self.selected_params.pop(channel, None)
+                    continue
+                param_msb, param_lsb, data_msb, data_lsb = values
+                selection = (kind, param_msb, param_lsb)
+                if self.selected_params.get(channel) != selection:
+                    select_msb, select_lsb = (0x65, 0x64) if kind == "rpn" else (0x63, 0x62)
+                    messages += (bytes((status, select_msb, param_msb)), bytes((status, select_lsb, param_lsb)))
+                    self.selected_params[channel] = selection
+                messages += (bytes((status, 0x06, data_msb)), bytes((status, 0x26, data_lsb))) # Data Entry MSB, LSB
+            for channel, selection in list(self.selected_params.items()):
+                if selection[0] == "rpn": # Null function, RPN Select MSB = LSB = 127
+                    status = 0xB0 + (channel - 1)
+                    messages += (bytes((status, 0x65, 0x7F)), bytes((status, 0x64, 0x7F)))
+                    del self.selected_params[channel]
+            return self.tx.send_many(messages)
     def send_rpn(self, channel, param_msb, param_lsb, data_msb, data_lsb):
         """Sends a Registered Parameter Number (RPN) command."""
-        # RPN Select
-        self.send_cc(channel, 0x65, param_msb)    # RPN MSB
-        self.send_cc(channel, 0x64, param_lsb)    # RPN LSB 
-        # Data Entry
-        self.send_cc(channel, 0x06, data_msb)   # Data MSB
-        self.send_cc(channel, 0x26, data_lsb)   # Data LSB
-        # Null function 
-        self.send_cc(channel, 0x65, 0x7F)  # RPN Select (MSB = 127)
-        self.send_cc(channel, 0x64, 0x7F)  # RPN LSB (LSB = 127) 
+        return self.send_controls([("rpn", channel, param_msb, param_lsb, data_msb, data_lsb)])
 
     def send_rpnf(self,channel, parameter_number, value):
         """Send RPN number (0-16383) with value (0-16383)"""
@@ -412,17 +1118,7 @@ class MidiManager:
 
     def send_nrpn(self, ch, nrpn_msb, nrpn_lsb, data_msb, data_lsb):
         """Sends an NRPN (Non-Registered Parameter Number) command."""
-        #self.midi_out.send_message([0xB0 + (ch - 1), 0x63, nrpn_msb])
-        #self.midi_out.send_message([0xB0 + (ch - 1), 0x62, nrpn_lsb])
-        #self.midi_out.send_message([0xB0 + (ch - 1), 0x06, data_msb])
-        #self.midi_out.send_message([0xB0 + (ch - 1), 0x26, data_lsb])
-        self.send_cc(ch, 0x63, nrpn_msb)  # NRPN MSB
-        self.send_cc(ch, 0x62, nrpn_lsb)  # NRPN LSB
-        self.send_cc(ch, 0x06, data_msb)  # Data MSB
-        self.send_cc(ch, 0x26, data_lsb)  # Data LSB
-        # Null function 
-        # self.send_cc(channel, 0x65, 0x7F)  # RPN Select (MSB = 127)
-        # self.send_cc(channel, 0x64, 0x7F)  # RPN LSB (LSB = 127) 
+        return self.send_controls([("nrpn", ch, nrpn_msb, nrpn_lsb, data_msb, data_lsb)])
 
     def send_nrpnf(self,channel, parameter_number, value):
         """Send NRPN number (0-16383) with value (0-16383)"""
@@ -476,50 +1172,332 @@ def reassemble_from_7bit(x):
     return group1 | group2 | group3 | group4 
 
 def validate_patch(patch_str):
-    """Validates a patch string in the format MSB,LSB,PC with range checks."""
+    """Validates a patch string in the format MSB,LSB,PC with range checks, or looks up a patch name."""
+    if not re.fullmatch(r"[\d\s,]+", patch_str):
+        return resolve_patch_name(patch_str)
     try:
         msb, lsb, pc = map(int, patch_str.split(','))
         if not (0 <= msb <= 127 and 0 <= lsb <= 127 and 1 <= pc <= 128):
             raise argparse.ArgumentTypeError("MSB/LSB must be 0-127, PC must be 1-128")
         return msb, lsb, pc
     except ValueError:
-        raise argparse.ArgumentTypeError("Patch must be in format: MSB,LSB,PC") 
-
+        raise argparse.ArgumentTypeError("Patch must be in format: MSB,LSB,PC or a patch name") 
+
+def resolve_patch_name(name):
+    """Returns (MSB, LSB, PC) of the patch with this name, or of the only close match."""
+    catalog = patch_catalog()
+    if catalog is None:
+        raise argparse.ArgumentTypeError("Patch names need the patch catalog (goplus_patches.py), give MSB,LSB,PC instead")
+    patch = catalog.by_name(name)
+    if patch is None:
+        matches = catalog.find(name, limit=5)
+        if len(matches) != 1:
+            suggestions = ", ".join(f"'{match.name}'" for match in matches)
+            raise argparse.ArgumentTypeError(f"No patch named '{name}'" + (f", did you mean {suggestions}?" if suggestions else ""))
+        patch = matches[0]
+    return patch.msb, patch.lsb, patch.pc
+
+Patch = collections.namedtuple("Patch", "name category msb lsb pc")
+
+def patch_key(name):
+    """Normalizes a patch name for searching: lower case letters and digits only."""
+    return re.sub(r"[^0-9a-z]", "", name.lower())
+
+class PatchCatalog:
+    """Searchable patch list backed by indexes generated ahead of time.
+    names: sorted (key, row) pairs for exact and prefix search with bisect
+    categories: category -> rows, numbers: (MSB, LSB, PC) -> row
+    The letter pairs of each name are indexed once here, so typo searches only compare a few names.
+    """
+    def __init__(self, patches, names, categories, numbers):
+        self.patches = patches
+        self.names = names
+        self.keys = [key for key, _ in names]
+        self.categories = categories
+        self.category_rows = {category: frozenset(rows) for category, rows in categories.items()}
+        self.numbers = numbers
+        self.bigrams = collections.defaultdict(list) # letter pair -> indices into names
+        for i, key in enumerate(self.keys):
+            for bigram in set(key_bigrams(key)):
+                self.bigrams[bigram].append(i)
+    def patch(self, row):
+        return Patch(*self.patches[row])
+    def lookup(self, msb, lsb, pc):
+        """Reverse lookup of a patch by bank select and program number (PC 1-128)."""
+        row = self.numbers.get((msb, lsb, pc))
+        return None if row is None else self.patch(row)
+    def by_name(self, name):
+        key = patch_key(name)
+        i = bisect.bisect_left(self.keys, key)
+        return self.patch(self.names[i][1]) if i < len(self.keys) and self.keys[i] == key else None
+    def prefix(self, prefix):
+        """Rows of patches whose name starts with prefix, in name order."""
+        key = patch_key(prefix)
+        lo = bisect.bisect_left(self.keys, key)
+        hi = bisect.bisect_left(self.keys, key + "\x7f")
+        return [row for _, row in self.names[lo:hi]]
+    def find(self, query="", category=None, limit=20):
+        """Searches by name: exact and prefix matches first, then substrings, then fuzzy matches.
+        Results can be restricted to a category from PATCH_CATEGORIES.
+        """
+        allowed = None if category is None else self.category_rows.get(category, frozenset())
+        key = patch_key(query)
+        rows = []
+        seen = set()
+        for row in self.candidates(key) if key else range(len(self.patches)):
+            if row not in seen and (allowed is None or row in allowed):
+                seen.add(row)
+                rows.append(row)
+                if len(rows) == limit: # the scans below are lazy, stop as soon as there are enough results
+                    break
+        if key and not rows: # last resort for typos
+            rows = [row for row in self.fuzzy(key, limit) if allowed is None or row in allowed]
+        return [self.patch(row) for row in rows]
+    def fuzzy(self, key, limit):
+        """Rows of names close to key, best first. Only the names sharing the most letter pairs
+        with key are compared with difflib, which is too slow to run over the whole catalog."""
+        shared = collections.Counter(i for bigram in set(key_bigrams(key)) for i in self.bigrams.get(bigram, ()))
+        indices = [i for i, _ in shared.most_common(FUZZY_CANDIDATES)]
+        matches = difflib.get_close_matches(key, [self.keys[i] for i in indices], n=limit)
+        return [self.names[bisect.bisect_left(self.keys, match)][1] for match in matches]
+    def candidates(self, key):
+        """Yields rows in order of match quality: prefix, substring, then the query letters in order (e.g. 'jnopno' -> 'JUNO Piano 1')."""
+        yield from self.prefix(key)
+        yield from (row for k, row in self.names if key in k)
+        pattern = re.compile(".*?".join(map(re.escape, key)))
+        yield from (row for k, row in self.names if pattern.search(k))
+
+def key_bigrams(key):
+    """The overlapping letter pairs of a patch key, e.g. 'pno' -> ['pn', 'no']."""
+    return [key[i:i + 2] for i in range(len(key) - 1)]
+
+def patch_catalog():
+    """Returns the patch catalog, or None if goplus_patches.py is not available."""
+    global PATCH_CATALOG
+    if PATCH_CATALOG is None and goplus_patches is not None:
+        PATCH_CATALOG = PatchCatalog(goplus_patches.PATCHES, goplus_patches.NAME_INDEX,
+                                     goplus_patches.CATEGORY_INDEX, goplus_patches.NUMBER_INDEX)
+    return PATCH_CATALOG
+
+PATCH_CATALOG = None
+
+def parse_patch_table(md_path):
+    """Reads (name, category, MSB, LSB, PC) rows from a markdown table such as GO-sounds.md."""
+    patches = []
+    with open(md_path, encoding="utf-8") as f:
+        for line in f:
+            cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
+            if len(cells) == 5 and all(cell.isdigit() for cell in cells[2:]):
+                name, category, msb, lsb, pc = cells
+                patches.append((name, category, int(msb), int(lsb), int(pc)))
+    return patches
+
+def write_patch_catalog(patches, out_path, source):
+    """Writes patches and their search indexes as a Python module, so nothing is parsed at run time."""
+    names = sorted((patch_key(patch[0]), row) for row, patch in enumerate(patches))
+    categories = {}
+    numbers = {}
+    for row, (_, category, msb, lsb, pc) in enumerate(patches):
+        categories.setdefault(category, []).append(row)
+        numbers.setdefault((msb, lsb, pc), row)
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(f"# Generated by goplus.py from {source}, do not edit.\n")
+        f.write("# Rows are (name, category, MSB, LSB, PC), PC counted from 1.\n\n")
+        f.write("PATCHES = (\n")
+        f.writelines(f"    {patch!r},\n" for patch in patches)
+        f.write(")\n\n# sorted (normalized name, row)\nNAME_INDEX = (\n")
+        f.writelines(f"    {entry!r},\n" for entry in names)
+        f.write(")\n\n# category -> rows\nCATEGORY_INDEX = {\n")
+        f.writelines(f"    {category!r}: {tuple(rows)!r},\n" for category, rows in categories.items())
+        f.write("}\n\n# (MSB, LSB, PC) -> row\nNUMBER_INDEX = {\n")
+        f.writelines(f"    {key!r}: {row},\n" for key, row in numbers.items())
+        f.write("}\n")
+
+
+class ParamCodec:
+    """A data model compiled once into flat tables of offsets, widths and value offsets.
+    Decodes a block into a compact record (a list with one value per model entry) and
+    encodes such a record back into bytes, without copying the model.
+    """
+    def __init__(self, data_model):
+        self.model = data_model
+        self.names = [param["name"] for param in data_model]
+        self.offsets = [reassemble_from_7bit(param["addr"]) for param in data_model]
+        self.sizes = [param["size"] for param in data_model]
+        self.widths = [param["data_width"] for param in data_model]
+        self.ofs = [param["ofs"] for param in data_model]
+        self.inits = [param["init"] for param in data_model]
+        self.mins = [param["min"] for param in data_model]
+        self.maxs = [param["max"] for param in data_model]
+        self.size = sum(self.sizes)
+        self.index = {name: i for i, name in enumerate(self.names) if name != "(reserve)"}
+        # single byte values are the common case and decode in one pass, others are fixed up afterwards
+        self.first_bytes = list(zip(self.offsets, self.ofs))
+        self.wide = []
+        for i, (size, width) in enumerate(zip(self.sizes, self.widths)):
+            if size == 1:
+                continue
+            if size == 12 and width == 7: # ASCII string
+                self.wide.append((i, self.offsets[i], size, None))
+            elif size in (2, 4) and width == 4: # 4-bit nibbles spread across bytes
+                self.wide.append((i, self.offsets[i], size, self.ofs[i]))
+            else: # shouldn't happen
+                raise ValueError(f"Unhandled data type - {size} bytes")
+        self.narrow = [(i, offset, ofs) for i, (offset, ofs) in enumerate(self.first_bytes) if self.sizes[i] == 1]
+        self.template = self.encode(self.inits, bytearray(self.size))
+    def decode(self, data_bytes):
+        """Decodes the bytes of one block into a list of values."""
+        if len(data_bytes) != self.size:
+            raise ValueError(f"Expected {self.size} bytes, got {len(data_bytes)}")
+        values = [data_bytes[offset] - ofs for offset, ofs in self.first_bytes]
+        for i, offset, size, ofs in self.wide:
+            if ofs is None:
+                values[i] = bytes(data_bytes[offset:offset + size]).decode('ascii')
+            else:
+                value = 0
+                for byte in data_bytes[offset:offset + size]:
+                    value = value << 4 | (byte & 0x0F)
+                values[i] = value - ofs
+        return values
+    def decode_many(self, blocks_data):
+        return [self.decode(data_bytes) for data_bytes in blocks_data]
+    def encode(self, values, out=None):
+        """Encodes a list of values into the bytes of one block."""
+        if out is None:
+            out = bytearray(self.template)
+        for i, offset, ofs in self.narrow:
+            out[offset] = values[i] + ofs
+        for i, offset, size, ofs in self.wide:
+            if ofs is None:
+                out[offset:offset + size] = bytes(values[i], 'ascii')
+            else:
+                encoded_value = values[i] + ofs
+                for j in range(size):
+                    out[offset + size - 1 - j] = (encoded_value >> (4 * j)) & 0x0F
+        return out
+    def encode_many(self, records):
+        return [self.encode(values) for values in records]
+    def random_values(self, rng):
+        """Random values within each parameter's range, e.g. for tests and benchmarks."""
+        values = []
+        for i, init in enumerate(self.inits):
+            lo, hi = sorted((self.mins[i], self.maxs[i]))
+            if isinstance(init, str):
+                values.append("".join(chr(rng.randint(lo, hi)) for _ in range(self.sizes[i])))
+            else:
+                values.append(rng.randint(lo, hi))
+        return values
+    def check(self, i, value):
+        """Raises ValueError if value is outside the range of the i-th parameter. Reserved entries are not checked."""
+        if self.names[i] == "(reserve)":
+            return
+        lo, hi = self.mins[i], self.maxs[i]
+        if isinstance(self.inits[i], str):
+            if not isinstance(value, str) or len(value) != self.sizes[i] or not all(lo <= ord(c) <= hi for c in value):
+                raise ValueError(f"{self.names[i]} must be {self.sizes[i]} ASCII characters")
+        elif not isinstance(value, int) or not lo <= value <= hi:
+            raise ValueError(f"{self.names[i]} must be in range {lo}..{hi}, got {value}")
+
+class ParamBlock:
+    """A decoded block: values in one flat list, names and ranges shared through the codec.
+    Parameters are read and assigned by name or by index, assignments are range checked.
+    """
+    __slots__ = ("codec", "values")
+    def __init__(self, codec, values=None):
+        self.codec = codec
+        self.values = list(codec.inits) if values is None else values
+    @classmethod
+    def from_bytes(cls, data_model, data_bytes):
+        codec = codec_for(data_model)
+        return cls(codec, codec.decode(data_bytes))
+    def to_bytes(self):
+        return list(self.codec.encode(self.values))
+    def copy(self):
+        return ParamBlock(self.codec, list(self.values))
+    def __getitem__(self, key):
+        return self.values[key if isinstance(key, int) else self.codec.index[key]]
+    def __setitem__(self, key, value):
+        i = key if isinstance(key, int) else self.codec.index[key]
+        self.codec.check(i, value)
+        self.values[i] = value
+    def __len__(self):
+        return len(self.values)
+    def __contains__(self, name):
+        return name in self.codec.index
+    def items(self):
+        """(name, value) pairs of all parameters except reserved ones."""
+        values = self.values
+        return [(name, values[i]) for name, i in self.codec.index.items()]
+    def as_dict(self):
+        return dict(self.items())
+    def __eq__(self, other):
+        return isinstance(other, ParamBlock) and self.codec is other.codec and self.values == other.values
+    def __repr__(self):
+        return f"ParamBlock({self.as_dict()!r})"
+
+def codec_for(data_model):
+    """Returns the compiled codec of a model, compiling it on first use."""
+    codec = PARAM_CODECS.get(id(data_model))
+    if codec is None:
+        codec = PARAM_CODECS[id(data_model)] = ParamCodec(data_model)
+    return codec
+
+PARAM_CODECS = {id(model): ParamCodec(model) for model in
+                (SETUP_MODEL, SYS_COMMON_MODEL, SYS_CTRL_MODEL, ZONE_MODEL, PART_MODEL, PATCH_COMMON_MODEL)}
+PARAM_LAYOUT_CODECS = {tuple(codec.names): codec for codec in PARAM_CODECS.values()}
+
+class SysExBuilder:
+    """Builds Roland RQ1/DT1 messages for one model ID as bytes, from headers prepared once.
+    Checksums are computed from the bytes with sum(), which runs in C.
+    """
+    __slots__ = ("model_id", "rq1_header", "dt1_header")
+    def __init__(self, model_id):
+        self.model_id = model_id
+        header = bytes([0xF0, 0x41, 0x10, *split_hex_string(model_id)]) # Start of SysEx, this is Roland, model ID
+        self.rq1_header = header + bytes([RQ1])
+        self.dt1_header = header + bytes([DT1])
+    def rq1(self, address, size):
+        """Read request for size bytes (a linear count) at the 7-bit address."""
+        request = address.to_bytes(4, 'big') + slice_to_7bit(size).to_bytes(4, 'big')
+        return self.rq1_header + request + bytes(((-sum(request)) & 0x7F, 0xF7))
+    def dt1(self, address, data_bytes):
+        """Data set of data_bytes at the 7-bit address."""
+        body = address.to_bytes(4, 'big') + bytes(data_bytes)
+        return self.dt1_header + body + bytes(((-sum(body)) & 0x7F, 0xF7))
+    def dt1_ranges(self, start_addr, data_bytes, ranges):
+        """DT1 messages writing the (start, end) offset ranges of a block starting at start_addr.
+        Data checksums come from running sums over the block, so each message costs two lookups
+        instead of summing its data again.
+        """
+        data = bytes(data_bytes)
+        sums = [0, *itertools.accumulate(data)]
+        base = reassemble_from_7bit(start_addr)
+        messages = []
+        for start, end in ranges:
+            address = slice_to_7bit(base + start).to_bytes(4, 'big')
+            checksum_value = (-(sum(address) + sums[end] - sums[start])) & 0x7F
+            messages.append(b"".join((self.dt1_header, address, data[start:end], bytes((checksum_value, 0xF7)))))
+        return messages
+    def dt1_batch(self, writes):
+        """DT1 messages for an iterable of (address, data_bytes) pairs."""
+        return [self.dt1(address, data_bytes) for address, data_bytes in writes]
+
+def sysex_builder(model_id):
+    """Returns the SysExBuilder of a model ID, created on first use."""
+    builder = SYSEX_BUILDERS.get(model_id)
+    if builder is None:
+        builder = SYSEX_BUILDERS[model_id] = SysExBuilder(model_id)
+    return builder
+
+SYSEX_BUILDERS = {}
 
 def construct_rq1_command(model_id, address, size):
     """Constructs a Roland RQ1 (Read Request) SysEx command. """
-    model_id_bytes = split_hex_string(model_id)
-    address_bytes = convert_address_to_bytes(address)
-    encoded_size_bytes = list(slice_to_7bit(size).to_bytes(4, 'big')) 
-    checksum_value = checksum(address_bytes, encoded_size_bytes) 
-    message = [
-        0xF0,      # Start of SysEx
-        0x41, 0x10,  # This is Roland
-        *model_id_bytes, 
-        RQ1,               # RQ1 command type
-        *address_bytes, 
-        *encoded_size_bytes, 
-        checksum_value, 
-        0xF7               # End of SysEx
-    ]
-    return message
+    return sysex_builder(model_id).rq1(address, size)
 
 def construct_dt1_command(model_id, address, data_bytes): 
     """Constructs a Roland DT1 (Data Transmission) SysEx command."""
-    model_id_bytes = split_hex_string(model_id)
-    address_bytes = convert_address_to_bytes(address)
-    checksum_value = checksum(address_bytes, data_bytes)  
-    message = [
-        0xF0,      # Start of SysEx
-        0x41, 0x10,  # This is Roland
-        *model_id_bytes, 
-        DT1,               # DT1 command type
-        *address_bytes, 
-        *data_bytes,
-        checksum_value, 
-        0xF7               # End of SysEx
-    ]
-    return message
+    return sysex_builder(model_id).dt1(address, data_bytes)
 
 def calculate_part_address(part_num):
     return PART_ADDRESS_BASE + (part_num - 1) * 0x100
@@ -545,130 +1523,196 @@ def get_patch_common_config(part_num,midi_manager,model_id):
     patch_config = get_params(PATCH_COMMON_MODEL,patch_address,model_id,midi_manager)
     return patch_config
 
+def get_zone_configs(zone_nums,midi_manager,model_id):
+    zone_addresses = [calculate_zone_address(zone_num) for zone_num in zone_nums]
+    return get_params_bulk(ZONE_MODEL,zone_addresses,model_id,midi_manager)
+
+def get_part_configs(part_nums,midi_manager,model_id):
+    part_addresses = [calculate_part_address(part_num) for part_num in part_nums]
+    return get_params_bulk(PART_MODEL,part_addresses,model_id,midi_manager)
+
 #def extract_nibbles(encoded_value, num_nibbles):
 #     return [(encoded_value >> (4 * i)) & 0xf for i in range(num_nibbles - 1, -1, -1)]
 
-def read_map_data(start_addr,size,model_id,midi_manager):
-    rq1_command = construct_rq1_command(model_id, start_addr, size)
-    data_ready_event = threading.Event()
-    received_message = []
-    def data_callback(event,data):
-        message,_ = event
-        # check if the received DT1 message address matches the sent RQ1 address
-        # TODO: implement more complete checks
-        if rq1_command[8:12] == message[8:12]:
-            data.extend(message)
-            data_ready_event.set()  # Signal completion
-            midi_manager.midi_in.cancel_callback()  # Cleanup
-    midi_manager.midi_in.set_callback(data_callback,data=received_message)
-    midi_manager.midi_out.send_message(rq1_command)
-    data_ready_event.wait()
-    received_data = received_message[12:-2]
-    assert len(received_data) == size
-    return received_data
-
-def write_map_data(start_addr,data,model_id,midi_manager):
+def read_map_data(start_addr,size,model_id,midi_manager,fresh=False):
+    """ sends RQ1 and awaits response, unless the shadow knows the data and `fresh` is not set """
+    return midi_manager.request_read(start_addr,size,model_id,fresh=fresh).result()
+
+def read_map_stream(start_addr,size,model_id,midi_manager,chunk_size=MAX_RQ1_SIZE,window=4,buffer=None):
+    """Reads a large area as a series of chunk reads, with at most `window` chunks in flight.
+    Each chunk is re-sent on its own after a timeout, and its DT1 replies (however the device splits them)
+    are written straight into place: into buffer if given, otherwise into a bytearray per chunk, which
+    keeps memory bounded to the chunks in flight and those the caller still holds.
+    Yields:
+        (7-bit address, chunk data) in address order, as soon as a chunk and all before it are complete.
+    """
+    view = memoryview(buffer) if buffer is not None else None
+    base = reassemble_from_7bit(start_addr)
+    offsets = iter(range(0, size, chunk_size))
+    in_flight = collections.deque()
+    try:
+        while True:
+            for offset in offsets:
+                length = min(chunk_size, size - offset)
+                out = view[offset:offset + length] if view is not None else bytearray(length)
+                in_flight.append((slice_to_7bit(base + offset), midi_manager.request_into(slice_to_7bit(base + offset), out, model_id, chunk_size)))
+                if len(in_flight) >= window:
+                    break
+            if not in_flight:
+                return
+            chunk_addr, future = in_flight.popleft()
+            yield chunk_addr, future.result()
+    finally:
+        for _, future in in_flight: # given up early, drop what is still outstanding
+            future.cancel()
+
+def read_map_large(start_addr,size,model_id,midi_manager,chunk_size=MAX_RQ1_SIZE,window=4):
+    """Reads a large area into one preallocated bytearray, see read_map_stream."""
+    buffer = bytearray(size)
+    for _ in read_map_stream(start_addr,size,model_id,midi_manager,chunk_size,window,buffer):
+        pass
+    return buffer
+
+def plan_block_reads(blocks,max_size=MAX_RQ1_SIZE,merge_gap=RQ1_OVERHEAD):
+    """Groups (address, size) blocks into RQ1 spans.
+    Blocks are only merged when the unmapped bytes between them cost less than another RQ1,
+    the same trade-off diff_ranges makes for writes.
+    Args:
+        blocks: A list of (address, size) tuples.
+        max_size: The largest span a single RQ1 may cover.
+        merge_gap: The most filler bytes read to save a RQ1, None for one RQ1 per block.
+    Returns:
+        A list of (span_address, span_size, block_indices) tuples.
+    """
+    order = sorted(range(len(blocks)), key=lambda i: reassemble_from_7bit(blocks[i][0]))
+    spans = []
+    for i in order:
+        start = reassemble_from_7bit(blocks[i][0])
+        end = start + blocks[i][1]
+        if spans and merge_gap is not None and start - spans[-1][1] <= merge_gap and end - spans[-1][0] <= max_size:
+            span = spans[-1]
+            span[1] = max(span[1], end)
+            span[2].append(i)
+        else:
+            spans.append([start, end, [i]])
+    return [(slice_to_7bit(start), end - start, indices) for start, end, indices in spans]
+
+def read_map_blocks(blocks,model_id,midi_manager,max_size=MAX_RQ1_SIZE,fresh=False):
+    """Reads several (address, size) blocks, all requested at once.
+    Blocks close to each other are coalesced into a single RQ1 covering all of them. The device
+    may answer a span with several DT1 messages, these are split back into the blocks.
+    Blocks known in the shadow are not read again, unless `fresh` is set.
+    Returns:
+        A list with the data bytes of each block, in the order of `blocks`.
+    """
+    return midi_manager.request_blocks(blocks,model_id,max_size,fresh=fresh).result()
+
+def write_map_data(start_addr,data,model_id,midi_manager,spacing=0.0):
+    """ queues a DT1, returns a Future resolved once it is sent """
     dt1_command = construct_dt1_command(model_id,start_addr,data)
-    midi_manager.midi_out.send_message(dt1_command)
+    sent = midi_manager.send_message(dt1_command,spacing)
+    midi_manager.shadow.update(model_id,start_addr,data)
+    return sent
+
+def diff_ranges(old_bytes,new_bytes,merge_gap=DT1_OVERHEAD):
+    """Finds the byte ranges where new_bytes differs from old_bytes.
+    Ranges closer than merge_gap are merged, resending a few unchanged bytes is
+    cheaper than the overhead of another DT1 message.
+    Returns:
+        A list of (start, end) offsets.
+    """
+    ranges = []
+    for i, (old, new) in enumerate(zip(old_bytes, new_bytes)):
+        if old != new:
+            if ranges and i - ranges[-1][1] < merge_gap:
+                ranges[-1][1] = i + 1
+            else:
+                ranges.append([i, i + 1])
+    return [tuple(r) for r in ranges]
+
+def write_map_delta(start_addr,old_bytes,new_bytes,model_id,midi_manager):
+    """Sends only the DT1 messages needed to turn old_bytes into new_bytes on the device.
+    Returns:
+        The number of DT1 messages sent.
+    """
+    ranges = diff_ranges(old_bytes,new_bytes)
+    midi_manager.send_messages(sysex_builder(model_id).dt1_ranges(start_addr,new_bytes,ranges))
+    midi_manager.shadow.update(model_id,start_addr,new_bytes)
+    return len(ranges)
+
+def update_params(data_model,start_addr,changes,model_id,midi_manager):
+    """Changes parameters of a block by name, writing back only the bytes that changed.
+    The block is always read from the device: a shadow gone stale by an edit on the panel
+    would hide changes that set a parameter back to the value the shadow still holds.
+    """
+    codec = codec_for(data_model)
+    old_bytes = read_map_data(start_addr,codec.size,model_id,midi_manager,fresh=True)
+    block = ParamBlock(codec,codec.decode(old_bytes))
+    for name, value in changes.items():
+        block[name] = value
+    write_map_delta(start_addr,old_bytes,block.to_bytes(),model_id,midi_manager)
+    return block
 
 def get_params(data_model,start_addr,model_id,midi_manager):
     """ sends RQ1 and awaits response """
-    size = sum(i["size"] for i in data_model)
-    received_data = read_map_data(start_addr,size,model_id,midi_manager)
-    params = bytes_to_params(received_data,data_model)
-    return params
+    codec = codec_for(data_model)
+    received_data = read_map_data(start_addr,codec.size,model_id,midi_manager)
+    return ParamBlock(codec,codec.decode(received_data))
+
+def get_params_async(data_model,start_addr,model_id,midi_manager):
+    """ sends RQ1 without waiting, returns a Future resolving to the raw block data """
+    return midi_manager.request_read(start_addr,codec_for(data_model).size,model_id)
+
+def get_params_bulk(data_model,start_addrs,model_id,midi_manager):
+    """ reads several blocks sharing one model with coalesced RQ1s """
+    codec = codec_for(data_model)
+    blocks_data = read_map_blocks([(addr,codec.size) for addr in start_addrs],model_id,midi_manager)
+    return [ParamBlock(codec,values) for values in codec.decode_many(blocks_data)]
 
 def bytes_to_params(data_bytes,data_model):
     """Tranforms raw binary data into a structured representation based on a provided model."""
-    model_size = sum(i["size"] for i in data_model)
-    assert len(data_bytes) == model_size
-    params = copy.deepcopy(data_model)
-    params_by_addr = {reassemble_from_7bit(param["addr"]): param for param in params}
-    for addr,param in params_by_addr.items():
-        size = param["size"]
-        if size == 1:
-            value = data_bytes[addr]
-            value -= param["ofs"]
-            param["value"] = value
-        elif size == 2:
-            byte1, byte2 = data_bytes[addr:addr+2]
-            value = (byte1 & 0x0F) << 4 | (byte2 & 0x0F)
-            value -= param["ofs"]
-            param["value"] = value
-        elif size == 4:
-            byte1, byte2, byte3, byte4 = data_bytes[addr:addr+4]
-            value = (byte1 & 0x0F) << 12 | (byte2 & 0x0F) << 8 | (byte3 & 0x0F) << 4 | (byte4 & 0x0F)
-            value -= param["ofs"]
-            param["value"] = value
-        elif size == 12: # this is ASCII string
-            value = bytes(data_bytes[addr:addr+12]).decode('ascii')
-            param["value"] = value
-        else: # shouldn't happen
-            raise ValueError(f"Unhandled data type - {size} bytes")
-    return params    
-    
+    values = codec_for(data_model).decode(data_bytes)
+    return [dict(param, value=value) for param, value in zip(data_model, values)]
+
 def params_to_bytes(params):
     """Packs model parameters with their values into a list of bytes according to a specified model."""
-    model_size = sum(param["size"] for param in params)
-    data_bytes = model_size * [None]
-    params_by_addr = {reassemble_from_7bit(param["addr"]): param for param in params}
-    for addr,param in params_by_addr.items():
-        size = param["size"]
-        data_width = param["data_width"]
-        value = param.get("value", param["init"])
-        if size == 1:
-            encoded_value = value + param["ofs"]
-            data_bytes[addr] = encoded_value
-        elif size == 2 and data_width == 4:
-            # 4-bit value spread across two bytes
-            encoded_value = value + param["ofs"]
-            byte1 = encoded_value & 0x0F # lsb
-            byte2 = (encoded_value >> 4) & 0x0F # msb
-            data_bytes[addr:addr+2] = [byte2,byte1]
-            # or data_bytes[addr:addr+4] = extract_nibbles(encoded_value, 2)
-        elif size == 4 and data_width == 4:
-            encoded_value = value + param["ofs"]
-            byte1 = encoded_value & 0x0F
-            byte2 = (encoded_value >> 4) & 0x0F
-            byte3 = (encoded_value >> 8) & 0x0F
-            byte4 = (encoded_value >> 12) & 0x0F
-            data_bytes[addr:addr+4] = [byte4,byte3,byte2,byte1]
-            # or data_bytes[addr:addr+4] = extract_nibbles(encoded_value, 4)
-        elif size == 12 and data_width == 7: # this is ASCII string
-            data_bytes[addr:addr+12] = list(bytes(value,'ascii'))
-        else: # shouldn't happen
-            raise ValueError(f"Unhandled data type - {size} bytes")
-    assert all(i != None for i in data_bytes)    # check that we have all the data
-    return data_bytes
+    codec = PARAM_LAYOUT_CODECS.get(tuple(param["name"] for param in params))
+    if codec is None:
+        codec = ParamCodec(params)
+    return list(codec.encode([param.get("value", param["init"]) for param in params]))
 
 def part_set(args,midi_manager):
     model_id = MODEL_IDS[args.model] if args.model else None 
     print(f"Configuring part {args.part} on model {args.model}: Patch({args.patch}), Channel({args.channel}), Level({args.level}), Octave Shift({args.octave_shift}), Model ID: {model_id}")
-    part_params = get_part_config(args.part,midi_manager,model_id)
-
-    params_by_name = {param["name"]: param for param in part_params if param["name"] != "(reserve)" }
-    # Update zone configuration based on arguments (using KEYS for mapping)
-
-    if args.channel is not None:
-        params_by_name["ReceiveChannel"]["value"] = args.channel - 1
-    if args.octave_shift is not None:
-        params_by_name["PartOctaveShift"]["value"] = args.octave_shift
-    if args.level is not None:
-        params_by_name["PartLevel(CC#7)"]["value"] = args.level
-    if args.patch is not None:
-        params_by_name["PatchBankSelMSB(CC#0)"]["value"] = args.patch[0]
-        params_by_name["PatchBankSelLSB(CC#32)"]["value"] = args.patch[1]
-        params_by_name["PatchProgramNum(PC)"]["value"] = args.patch[2] - 1
-
-    # Encode and send the message 
-    address = calculate_part_address(args.part)
-    data_bytes = params_to_bytes(part_params)
-    sysex_message = construct_dt1_command(model_id, address, data_bytes)
-    midi_manager.midi_out.send_message(sysex_message)
+    changes = part_changes(args.patch,args.channel,args.level,args.octave_shift)
+    # Encode and send only the changed bytes
+    update_params(PART_MODEL,calculate_part_address(args.part),changes,model_id,midi_manager)
+
+def part_changes(patch=None,channel=None,level=None,octave_shift=None):
+    """Translates part settings into PART_MODEL parameter values, leaving out those not given."""
+    changes = {}
+    if channel is not None:
+        changes["ReceiveChannel"] = channel - 1
+    if octave_shift is not None:
+        changes["PartOctaveShift"] = octave_shift
+    if level is not None:
+        changes["PartLevel(CC#7)"] = level
+    if patch is not None:
+        changes["PatchBankSelMSB(CC#0)"] = patch[0]
+        changes["PatchBankSelLSB(CC#32)"] = patch[1]
+        changes["PatchProgramNum(PC)"] = patch[2] - 1
+    return changes
+
+def part_settings(part_config):
+    """The part settings of a PART_MODEL block, the inverse of part_changes."""
+    return {"patch": [part_config["PatchBankSelMSB(CC#0)"], part_config["PatchBankSelLSB(CC#32)"], part_config["PatchProgramNum(PC)"] + 1],
+            "channel": part_config["ReceiveChannel"] + 1,
+            "level": part_config["PartLevel(CC#7)"],
+            "octave_shift": part_config["PartOctaveShift"]}
 
 def part_get(args,midi_manager):
     part_config = get_part_config(args.part,midi_manager,MODEL_IDS[args.model])
-    param_vals = {param["name"]:param["value"] for param in part_config if param["name"] != "(reserve)"}
+    param_vals = part_config.as_dict()
     print(param_vals)
     for k,v in param_vals.items():
         print(f"{k}: {v}")
@@ -679,51 +1723,105 @@ def part_preview(args,midi_manager):
     stop_demo_cmd = construct_dt1_command(model_id, SOUND_DEMO_SWITCH, [0])
 
     part_params = get_part_config(args.part_num,midi_manager,model_id)
-    part_params_by_name = {param["name"]: param for param in part_params }
     patch_common_params = get_patch_common_config(args.part_num,midi_manager,model_id)
-    patch_common_params_by_name = {param["name"]: param for param in patch_common_params }
 
-    msb = part_params_by_name["PatchBankSelMSB(CC#0)"]["value"]
-    lsb = part_params_by_name["PatchBankSelLSB(CC#32)"]["value"]
-    pc = part_params_by_name["PatchProgramNum(PC)"]["value"] + 1
-    patch_name = patch_common_params_by_name["PatchName"]["value"]
-    patch_category = patch_common_params_by_name["PatchCategory"]["value"]
+    msb = part_params["PatchBankSelMSB(CC#0)"]
+    lsb = part_params["PatchBankSelLSB(CC#32)"]
+    pc = part_params["PatchProgramNum(PC)"] + 1
+    patch_name = patch_common_params["PatchName"]
+    patch_category = patch_common_params["PatchCategory"]
         
     print(f"Playing part {args.part_num}: patch name: '{patch_name.strip()}' ({msb},{lsb},{pc}), category: {PATCH_CATEGORIES[patch_category]}")
-    midi_manager.midi_out.send_message(start_demo_cmd)
+    midi_manager.send_message(start_demo_cmd)
     time.sleep(args.duration)
-    midi_manager.midi_out.send_message(stop_demo_cmd)
+    midi_manager.send_message(stop_demo_cmd)
+
+def read_keys():
+    """Starts a thread passing lines typed on stdin to a queue."""
+    keys = queue.Queue()
+    def reader():
+        for line in sys.stdin:
+            keys.put(line.strip().lower())
+    threading.Thread(target=reader, name="goplus-keys", daemon=True).start()
+    return keys
+
+def audition_playlist(args):
+    """Returns the patches to audition: those given, or the catalog patches matching query and category."""
+    if args.patches:
+        return args.patches
+    catalog = require_patch_catalog()
+    patches = catalog.find(args.query or "", args.category, limit=len(catalog.patches))
+    return [(patch.msb, patch.lsb, patch.pc) for patch in patches]
+
+def part_audition(args,midi_manager):
+    model_id = MODEL_IDS[args.model]
+    patches = audition_playlist(args)
+    if not patches:
+        raise ValueError("No patches to audition")
+    # Two parts take turns: while one plays, the next patch is loaded into the other and its name read
+    parts = [args.part_num, args.spare if args.spare != args.part_num else args.part_num % 16 + 1]
+    part_blocks = [(calculate_part_address(part),PART_SIZE) for part in parts]
+    original_parts = list(zip([addr for addr,_ in part_blocks],read_map_blocks(part_blocks,model_id,midi_manager,fresh=True)))
+    keys = read_keys()
+    print(f"Auditioning {len(patches)} patches, Enter: next, q Enter: quit")
+    select_patch(parts[0],patches[0],model_id,midi_manager)
+    next_patch_common = get_params_async(PATCH_COMMON_MODEL,calculate_patch_address(parts[0]),model_id,midi_manager)
+    try:
+        for i, (msb, lsb, pc) in enumerate(patches):
+            part = parts[i % 2]
+            patch_common = ParamBlock.from_bytes(PATCH_COMMON_MODEL,next_patch_common.result())
+            category = patch_common["PatchCategory"]
+            print(f"[{i + 1}/{len(patches)}] part {part}: '{patch_common['PatchName'].strip()}' ({msb},{lsb},{pc}), "
+                  f"category: {PATCH_CATEGORIES[category] if category < len(PATCH_CATEGORIES) else category}")
+            midi_manager.send_message(construct_dt1_command(model_id, SOUND_DEMO_SWITCH, [0]))
+            midi_manager.send_message(construct_dt1_command(model_id, SOUND_DEMO_SWITCH, [part]))
+            if i + 1 < len(patches):
+                other_part = parts[(i + 1) % 2]
+                select_patch(other_part,patches[i + 1],model_id,midi_manager)
+                next_patch_common = get_params_async(PATCH_COMMON_MODEL,calculate_patch_address(other_part),model_id,midi_manager)
+            with contextlib.suppress(queue.Empty):
+                if keys.get(timeout=args.duration) == "q":
+                    break
+    finally:
+        midi_manager.send_message(construct_dt1_command(model_id, SOUND_DEMO_SWITCH, [0]))
+        restore_blocks(original_parts,model_id,midi_manager)
 
 def set_zone(args,midi_manager):
     
     model_id = MODEL_IDS[args.model] if args.model else None 
     #print(f"Configuring zone {args.zone} on model {args.model}: Octave Shift({args.octave_shift}), Low Key({args.low_key}), High Key({args.high_key}), Status({args.on if args.on else 'off'}), Model ID: {model_id}")
 
-    zone_params = get_zone_config(args.zone,midi_manager,model_id)
-    zone_config = {param["name"]: param for param in zone_params if param["name"] != "(reserve)" }
-    # Update zone configuration based on arguments (using KEYS for mapping)
-    if args.octave_shift is not None:
-        zone_config["ZoneOctaveShift"]["value"] = args.octave_shift
-    if (args.on or args.off): # on or off was explicitly specified
-        zone_config["ZoneSw"]["value"] = int(args.on)
-    if args.low_key is not None:
-        zone_config["KbdRangeLower"]["value"] = KEYS.index(args.low_key)  
-    if args.high_key is not None:
-        zone_config["KbdRangeUpper"]["value"] = KEYS.index(args.high_key)
-
-    # Encode and send the message 
-    address = calculate_zone_address(args.zone)
-    #print(f"zone address: {address.to_bytes(4,'big').hex(' ')}")
-    data_bytes = params_to_bytes(zone_params)
-    sysex_message = construct_dt1_command(model_id, address, data_bytes)
-    #print("Sending SysEx Command:", bytes(sysex_message).hex(' '))
-    midi_manager.midi_out.send_message(sysex_message)
+    on = args.on if (args.on or args.off) else None # on or off was explicitly specified
+    changes = zone_changes(on,args.octave_shift,args.low_key,args.high_key)
+
+    # Encode and send only the changed bytes
+    update_params(ZONE_MODEL,calculate_zone_address(args.zone),changes,model_id,midi_manager)
+
+def zone_changes(on=None,octave_shift=None,low_key=None,high_key=None):
+    """Translates zone settings into ZONE_MODEL parameter values (using KEYS for mapping), leaving out those not given."""
+    changes = {}
+    if octave_shift is not None:
+        changes["ZoneOctaveShift"] = octave_shift
+    if on is not None:
+        changes["ZoneSw"] = int(on)
+    if low_key is not None:
+        changes["KbdRangeLower"] = KEYS.index(low_key)
+    if high_key is not None:
+        changes["KbdRangeUpper"] = KEYS.index(high_key)
+    return changes
+
+def zone_settings(zone_config):
+    """The zone settings of a ZONE_MODEL block, the inverse of zone_changes."""
+    return {"on": bool(zone_config["ZoneSw"]),
+            "octave_shift": zone_config["ZoneOctaveShift"],
+            "low_key": KEYS[zone_config["KbdRangeLower"]],
+            "high_key": KEYS[zone_config["KbdRangeUpper"]]}
 
 def zone_show(args,midi_manager):
     if not args.zones:
         zone_numbers = range(1,17)
     else:
-        zone_numbers = set(args.zones)
+        zone_numbers = sorted(set(args.zones))
     attrs = ['ZoneSw', 'ZoneOctaveShift', 'KbdRangeLower','KbdRangeUpper']
     attribute_extractor = itemgetter(*attrs)
     value_transformations = {
@@ -733,9 +1831,9 @@ def zone_show(args,midi_manager):
     }
     output_row_format ="{:>20}" * (len(attrs) + 1)
     print(output_row_format.format("Zone number", *attrs))
-    for i in zone_numbers:
-        zone_config =  get_zone_config(i,midi_manager,MODEL_IDS[args.model])
-        raw_param_values = {param["name"]:param["value"] for param in zone_config}
+    zone_configs = get_zone_configs(zone_numbers,midi_manager,MODEL_IDS[args.model])
+    for i,zone_config in zip(zone_numbers,zone_configs):
+        raw_param_values = zone_config.as_dict()
         transformed_param_values = transform_values(raw_param_values,value_transformations)
         #print(row_format.format(i,*selector(tr_values)))
         print(output_row_format.format(i, *attribute_extractor(transformed_param_values))) 
@@ -745,7 +1843,7 @@ def part_show(args,midi_manager):
     if not args.parts:
         parts = range(1,17)
     else:
-        parts = set(args.parts)
+        parts = sorted(set(args.parts))
     attrs = ['ReceiveChannel', 'PatchBankSelMSB(CC#0)', 'PatchBankSelLSB(CC#32)','PatchProgramNum(PC)',
              'PartLevel(CC#7)','PartOctaveShift']
     selector = itemgetter(*attrs)
@@ -756,18 +1854,20 @@ def part_show(args,midi_manager):
     }
     row_format ="{:>24}" * (len(attrs) + 1)
     print(row_format.format("Part number", *attrs))
-    for i in parts:
-        part_config =  get_part_config(i,midi_manager,MODEL_IDS[args.model])
-        param_vals = {param["name"]:param["value"] for param in part_config}
+    part_configs = get_part_configs(parts,midi_manager,MODEL_IDS[args.model])
+    for i,part_config in zip(parts,part_configs):
+        param_vals = part_config.as_dict()
         tr_values = transform_values(param_vals,value_transformations)
         print(row_format.format(i,*selector(tr_values)))
 
 def sys_show(args,midi_manager):
-    setup_config = get_params(SETUP_MODEL,SETUP,MODEL_IDS[args.model],midi_manager)
-    sys_common_config = get_params(SYS_COMMON_MODEL,SYS_COMMON,MODEL_IDS[args.model],midi_manager)
-    sys_ctrl_config = get_params(SYS_CTRL_MODEL,SYS_CTRL,MODEL_IDS[args.model],midi_manager)
+    # all three reads are in flight at once
+    blocks = ((SETUP_MODEL,SETUP),(SYS_COMMON_MODEL,SYS_COMMON),(SYS_CTRL_MODEL,SYS_CTRL))
+    futures = [get_params_async(data_model,start_addr,MODEL_IDS[args.model],midi_manager) for data_model,start_addr in blocks]
+    setup_config, sys_common_config, sys_ctrl_config = [
+        ParamBlock.from_bytes(data_model,future.result()) for future,(data_model,_) in zip(futures,blocks)]
     for block in (setup_config,sys_common_config,sys_ctrl_config):
-        param_vals = {param["name"]:param["value"] for param in block if param["name"] != "(reserve)"}
+        param_vals = block.as_dict()
         for k,v in param_vals.items():
             print(f"{k}: {v}")
     #print(setup_config)
@@ -775,22 +1875,68 @@ def sys_show(args,midi_manager):
     #print(sys_ctrl_config)
    
 
+def calibrate_tx_rate(model_id,midi_manager,burst=32,max_rate=200000):
+    """Finds the fastest transmit rate at which a burst of RQ1s is answered completely.
+    Rates double from the DIN MIDI speed until a reply goes missing.
+    Returns:
+        The highest rate (bytes per second) that passed, None if even max_rate did.
+    """
+    saved_rate, saved_retries = midi_manager.tx.rate, midi_manager.retries
+    midi_manager.retries = 0 # a lost message must show up as a failure, not be re-sent
+    best = DIN_TX_RATE
+    try:
+        rate = DIN_TX_RATE
+        while rate <= max_rate:
+            midi_manager.tx.rate = rate
+            # distinct addresses, so that each reply completes exactly one request
+            futures = [midi_manager.request_read(slice_to_7bit(reassemble_from_7bit(SETUP) + i),1,model_id,fresh=True)
+                       for i in range(burst)]
+            try:
+                for future in futures:
+                    future.result()
+            except SysExTimeoutError:
+                break
+            best = rate
+            rate *= 2
+        else:
+            best = None
+    finally:
+        midi_manager.tx.rate, midi_manager.retries = saved_rate, saved_retries
+    return best
+
+def sys_dump(args,midi_manager):
+    model_id = MODEL_IDS[args.model]
+    start = time.monotonic()
+    with (open(args.output, "wb") if args.output else contextlib.nullcontext()) as f:
+        for chunk_addr, data in read_map_stream(args.address,args.size,model_id,midi_manager,args.chunk):
+            if f:
+                f.write(data)
+            else:
+                for offset in range(0, len(data), 16):
+                    print(f"{slice_to_7bit(reassemble_from_7bit(chunk_addr) + offset):08X}: {bytes(data[offset:offset + 16]).hex(' ')}")
+    if args.output:
+        print(f"Wrote {args.size} bytes from {args.address:08X} to {args.output} in {time.monotonic() - start:.2f}s")
+
+def sys_calibrate(args,midi_manager):
+    rate = calibrate_tx_rate(MODEL_IDS[args.model],midi_manager)
+    midi_manager.tx.rate = rate
+    if rate is None:
+        print("Device keeps up with any rate, no --tx-rate needed")
+    else:
+        print(f"Device keeps up with {rate} bytes/s, use --tx-rate {rate}")
+
 def autodetect_model(midi_port,midi_manager):
     """ sends Idenyity request and awaits response """
-    data_ready_event = threading.Event()
-    received_message = []
-    def data_callback(event,data):
-        message,_ = event
-        # check if the received message is Identity Reply
-        # TODO: implement more complete checks
-        if message[0:6] == IDENTITY_REPLY_START:
-            data.extend(message)
-            data_ready_event.set()  # Signal completion
-            midi_manager.midi_in.cancel_callback()  # Cleanup
-    midi_manager.midi_in.set_callback(data_callback,data=received_message)
-    midi_manager.midi_out.send_message(IDENTITY_REQUEST)
-    data_ready_event.wait()
+    received_message = request_identity(midi_manager).result()
+    midi_manager.identity = received_message
     #print(bytes(received_message).hex(' '))
+    return model_from_identity(received_message)
+
+def request_identity(midi_manager):
+    """ sends Identity Request, returns a Future resolving to the Identity Reply """
+    return midi_manager.expect(lambda message: message[0:6] == IDENTITY_REPLY_START, IDENTITY_REQUEST, "Identity Request")
+
+def model_from_identity(received_message):
     if received_message[6] == 0x3c:
         model = 'GK'
     elif received_message[6] == 0x3d:
@@ -799,6 +1945,274 @@ def autodetect_model(midi_port,midi_manager):
         raise Exception(f"Unsupported model")
     return model
 
+class AsyncMidiManager:
+    """asyncio front end to a MidiManager.
+    Every call returns the MidiManager's own Future wrapped for the event loop: replies are matched
+    by the rtmidi callback and handed to the loop with call_soon_threadsafe, no thread waits on them.
+    Coroutines share the one dispatcher and output queue, so any number of them may use the port at once.
+    """
+    def __init__(self, port=None, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, use_shadow=True,
+                 tx_rate=DEFAULT_TX_RATE, tx_gap=0.0, midi_manager=None):
+        self.midi_manager = midi_manager or MidiManager(port, timeout, retries, use_shadow, tx_rate, tx_gap)
+        self.model = None
+    async def __aenter__(self):
+        if self.midi_manager.midi_in is None and not self.midi_manager.open_devices():
+            raise OSError("Could not open MIDI ports")
+        return self
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await asyncio.get_running_loop().run_in_executor(None, self.midi_manager.close_devices) # waits for queued messages
+    def model_id(self, model_id=None):
+        if model_id is None and self.model is None:
+            raise ValueError("Model unknown, call identify() first or give a model ID")
+        return model_id or MODEL_IDS[self.model]
+    async def identify(self):
+        """Sends an Identity Request, returns the model ('GK' or 'GP') and uses it for later calls."""
+        received_message = await asyncio.wrap_future(request_identity(self.midi_manager))
+        self.midi_manager.identity = received_message
+        self.model = model_from_identity(received_message)
+        return self.model
+    async def read_block(self, start_addr, size, model_id=None, fresh=False):
+        """Reads size bytes at start_addr, from the shadow if they are known there and not fresh."""
+        return await asyncio.wrap_future(self.midi_manager.request_read(start_addr, size, self.model_id(model_id), fresh))
+    async def read_params(self, data_model, start_addr, model_id=None):
+        """Reads a block and returns it as a ParamBlock."""
+        return ParamBlock.from_bytes(data_model, await self.read_block(start_addr, codec_for(data_model).size, model_id))
+    async def write_block(self, start_addr, data, model_id=None):
+        """Writes data at start_addr, returns once the DT1 has been sent."""
+        await asyncio.wrap_future(write_map_data(start_addr, data, self.model_id(model_id), self.midi_manager))
+    async def send_nrpn(self, channel, nrpn_msb, nrpn_lsb, data_msb, data_lsb):
+        await asyncio.wrap_future(self.midi_manager.send_nrpn(channel, nrpn_msb, nrpn_lsb, data_msb, data_lsb))
+    async def send_controls(self, events):
+        """Sends CC/RPN/NRPN events as one burst, see MidiManager.send_controls."""
+        await asyncio.wrap_future(self.midi_manager.send_controls(events))
+
+class KeyboardEmulator:
+    """Software GO:KEYS / GO:PIANO for testing without a keyboard.
+    It stands in for both the MidiIn and the MidiOut of a MidiManager (see MidiManager's emulator argument),
+    or serves other programs through virtual ports (open_virtual_ports, `goplus emulate`).
+    It answers the Identity Request and RQ1/DT1 against an address space filled with the init values of the
+    modelled blocks. Replies leave in order from one thread, after latency plus random jitter. Incoming
+    messages are lost with probability drop, and RQ1 replies are split into DT1s of at most max_sysex data bytes.
+    """
+    def __init__(self, model='GK', latency=0.002, jitter=0.0, drop=0.0, max_sysex=128, seed=None):
+        self.model = model
+        self.model_id = MODEL_IDS[model]
+        self.name = f"goplus {model} emulator"
+        self.latency = latency
+        self.jitter = jitter
+        self.drop = drop
+        self.max_sysex = max_sysex
+        self.random = random.Random(seed)
+        self.memory = {} # model_id -> {linear address: byte}
+        self.fill()
+        self.callback = None
+        self.callback_data = None
+        self.ports = None # virtual (input, output) ports, if opened
+        self.replies = collections.deque() # (due, message), due times never decrease
+        self.last_due = 0.0
+        self.cond = threading.Condition()
+        self.closing = False
+        self.thread = threading.Thread(target=self.run, name="goplus-emulator", daemon=True)
+        self.thread.start()
+    def fill(self):
+        memory = self.memory.setdefault(self.model_id, {})
+        for _, addr, data_model in device_blocks():
+            start = reassemble_from_7bit(addr)
+            for i, byte in enumerate(codec_for(data_model).template):
+                memory[start + i] = byte
+        self.set_tempo(120)
+    def set_tempo(self, bpm):
+        start = reassemble_from_7bit(LOOPMIX_TEMPO_ADDR)
+        aux = self.memory.setdefault(MODEL_ID_AUX, {})
+        aux[start], aux[start + 1] = bpm >> 7, bpm & 0x7F
+    def tempo(self):
+        start = reassemble_from_7bit(LOOPMIX_TEMPO_ADDR)
+        aux = self.memory[MODEL_ID_AUX]
+        return (aux[start] << 7) | aux[start + 1]
+    # MidiIn stand-in
+    def set_callback(self, callback, data=None):
+        self.callback, self.callback_data = callback, data
+    def cancel_callback(self):
+        self.callback = None
+    def ignore_types(self, **kwargs):
+        pass
+    def close_port(self):
+        with self.cond:
+            self.closing = True
+            self.cond.notify_all()
+    # MidiOut stand-in: messages sent to the keyboard
+    def send_message(self, message):
+        if self.drop and self.random.random() < self.drop:
+            return
+        if list(message) == IDENTITY_REQUEST:
+            self.reply(IDENTITY_REPLY_START + [0x3C if self.model == 'GK' else 0x3D, 0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0xF7])
+        elif len(message) > 13 and message[0] == 0xF0 and message[1] == 0x41 and message[2] == 0x10:
+            model_id = bytes(message[3:7]).hex().upper()
+            if model_id not in self.memory or (-sum(message[8:-1])) & 0x7F: # unknown model or bad checksum: ignored
+                return
+            address = int.from_bytes(bytes(message[8:12]), 'big')
+            if message[7] == RQ1:
+                self.read(model_id, address, reassemble_from_7bit(int.from_bytes(bytes(message[12:16]), 'big')))
+            elif message[7] == DT1:
+                self.write(model_id, address, message[12:-2])
+    def read(self, model_id, address, size):
+        memory = self.memory[model_id]
+        start = reassemble_from_7bit(address)
+        for offset in range(0, size, self.max_sysex):
+            data = [memory.get(i, 0) for i in range(start + offset, start + min(size, offset + self.max_sysex))]
+            self.reply(construct_dt1_command(model_id, slice_to_7bit(start + offset), data))
+    def write(self, model_id, address, data):
+        if model_id == MODEL_ID_AUX and address in (TEMPO_UP_ADDR, TEMPO_DOWN_ADDR):
+            self.set_tempo(min(250, max(40, self.tempo() + (1 if address == TEMPO_UP_ADDR else -1))))
+            return
+        memory = self.memory[model_id]
+        start = reassemble_from_7bit(address)
+        for i, byte in enumerate(data):
+            memory[start + i] = byte
+    def reply(self, message):
+        with self.cond:
+            due = max(self.last_due, time.monotonic() + self.latency + self.random.uniform(0, self.jitter))
+            self.last_due = due
+            self.replies.append((due, bytes(message)))
+            self.cond.notify_all()
+    def run(self):
+        while True:
+            with self.cond:
+                while not self.replies and not self.closing:
+                    self.cond.wait()
+                if self.closing:
+                    return
+                due, message = self.replies[0]
+                if due > time.monotonic():
+                    self.cond.wait(due - time.monotonic())
+                    continue
+                self.replies.popleft()
+            callback = self.callback
+            if callback:
+                callback((list(message), 0.0), self.callback_data)
+    def open_virtual_ports(self, name=None):
+        """Shows up as a MIDI port for other programs."""
+        self.name = name or self.name
+        port_in, port_out = rtmidi.MidiIn(), rtmidi.MidiOut()
+        port_in.ignore_types(sysex=False)
+        port_in.open_virtual_port(self.name)
+        port_out.open_virtual_port(self.name)
+        port_in.set_callback(lambda event, data: self.send_message(event[0]))
+        self.set_callback(lambda event, data: port_out.send_message(event[0]))
+        self.ports = (port_in, port_out)
+    def close(self):
+        self.close_port()
+        if self.ports:
+            for port in self.ports:
+                port.close_port()
+
+def emulate(args):
+    emulator = KeyboardEmulator(args.model or 'GK', args.latency / 1000, args.jitter / 1000, args.drop, args.max_sysex)
+    emulator.open_virtual_ports(args.name)
+    print(f"Emulating {emulator.model} on virtual port '{emulator.name}', Ctrl-C to stop", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.close()
+
+ParamEvent = collections.namedtuple("ParamEvent", "block num param old new")
+
+class ParamMonitor:
+    """Decodes what the keyboard sends by itself (panel edits, knobs, controllers) into ParamEvents.
+    DT1 messages become one event per parameter that changed, e.g. ("part", 3, "PartLevel(CC#7)", 100, 87),
+    old values come from the shadow (None if unknown). Controllers become ("cc", channel, "CC#7", old, new)
+    and Program Changes ("pc", channel, "Program", old, new). DT1s outside the modelled blocks are
+    reported as ("other", None, "ADDRESS", None, data).
+    The input callback only copies the old bytes and queues the message, decoding happens in the
+    consumer's thread, so the callback never falls behind a knob sweep.
+    DT1s are only decoded for the keyboard's model ID, given or taken from the MidiManager's Identity Reply
+    (any GO model if neither is known); other Roland devices on the same port are ignored.
+    """
+    def __init__(self, midi_manager, model_id=None):
+        self.midi_manager = midi_manager
+        if model_id is None and midi_manager.identity:
+            model_id = MODEL_IDS[model_from_identity(midi_manager.identity)]
+        self.model_ids = {model_id} if model_id else set(MODEL_IDS.values())
+        self.queue = queue.SimpleQueue()
+        self.controllers = {} # (kind, channel, number) -> last value
+        midi_manager.listeners.append(self.receive)
+    def __enter__(self):
+        return self
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    def close(self):
+        with contextlib.suppress(ValueError):
+            self.midi_manager.listeners.remove(self.receive)
+    def receive(self, message):
+        if len(message) > 13 and message[0] == 0xF0 and message[1] == 0x41 and message[7] == DT1:
+            model_id = bytes(message[3:7]).hex().upper()
+            if model_id not in self.model_ids:
+                return
+            start = reassemble_from_7bit(int.from_bytes(bytes(message[8:12]), 'big'))
+            data = message[12:-2]
+            blocks = find_blocks(start, start + len(data))
+            old = [(block, self.midi_manager.shadow.known(model_id, block[0], block[1] - block[0])) for block in blocks]
+            self.queue.put((DT1, start, data, old))
+        elif 0xB0 <= message[0] <= 0xCF:
+            self.queue.put((message[0], None, message, None))
+    def events(self, timeout=None):
+        """Yields ParamEvents as they arrive. Stops after timeout seconds without any, or never if timeout is None."""
+        while True:
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                return
+            yield from self.decode(*item)
+    __iter__ = events
+    def decode(self, status, start, data, old):
+        if status != DT1:
+            channel = (status & 0x0F) + 1
+            key = ("cc", channel, f"CC#{data[1]}") if status < 0xC0 else ("pc", channel, "Program")
+            value = data[-1]
+            previous = self.controllers.get(key)
+            self.controllers[key] = value
+            yield ParamEvent(*key, previous, value)
+            return
+        if not old:
+            yield ParamEvent("other", None, f"{slice_to_7bit(start):08X}", None, list(data))
+            return
+        end = start + len(data)
+        for (block_start, block_end, kind, num, data_model), old_bytes in old:
+            codec = codec_for(data_model)
+            new_bytes = list(old_bytes)
+            lo, hi = max(start, block_start), min(end, block_end)
+            new_bytes[lo - block_start:hi - block_start] = data[lo - start:hi - start]
+            changed = [i for i, (offset, size) in enumerate(zip(codec.offsets, codec.sizes))
+                       if offset < hi - block_start and offset + size > lo - block_start and codec.names[i] != "(reserve)"]
+            fill = codec.template # unknown bytes, decoded but never reported
+            old_values = codec.decode([fill[i] if byte is None else byte for i, byte in enumerate(old_bytes)])
+            new_values = codec.decode([fill[i] if byte is None else byte for i, byte in enumerate(new_bytes)])
+            for i in changed:
+                offset, size = codec.offsets[i], codec.sizes[i]
+                old_value = None if None in old_bytes[offset:offset + size] else old_values[i]
+                if None not in new_bytes[offset:offset + size] and old_value != new_values[i]:
+                    yield ParamEvent(kind, num, codec.names[i], old_value, new_values[i])
+
+def monitor(args,midi_manager):
+    model_id = MODEL_IDS[args.model]
+    if not args.no_prime: # learn the current values, so that changes show where they come from
+        read_map_blocks([(addr,codec_for(data_model).size) for _,addr,data_model in device_blocks()],model_id,midi_manager)
+    print("Monitoring the keyboard, Ctrl-C to stop", flush=True)
+    deadline = time.monotonic() + args.duration if args.duration else None
+    with ParamMonitor(midi_manager,model_id) as param_monitor:
+        try:
+            while deadline is None or time.monotonic() < deadline:
+                for event in param_monitor.events(timeout=0.2):
+                    where = event.block if event.num is None else f"{event.block} {event.num}"
+                    print(f"{time.strftime('%H:%M:%S')} {where} {event.param}: {event.old} -> {event.new}", flush=True)
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+        except KeyboardInterrupt:
+            pass
+
 def loopmix_select(args,midi_manager):
     print(f"Selected {LOOPMIX_STYLES[args.style-1]}")
     midi_manager.send_nrpn(16,0,0,0,args.style-1)
@@ -808,8 +2222,7 @@ def loopmix_exit(args,midi_manager):
     midi_manager.send_nrpn(16,0,3,0,0)
     # exit loop mixing mode
     model_id = MODEL_IDS[args.model]
-    sysex_message = construct_dt1_command(model_id, 0x01000019, [0])
-    midi_manager.midi_out.send_message(sysex_message)
+    write_map_data(0x01000019,[0],model_id,midi_manager)
 
 def loopmix_play(args,midi_manager):
     loopmix_part = args.loopmix_part
@@ -820,19 +2233,62 @@ def loopmix_key(args,midi_manager):
     key_index = LOOPMIX_KEYS.index(args.key)
     midi_manager.send_nrpn(16,0,2,0,key_index)
 
+def read_loopmix_tempo(midi_manager):
+    byte1, byte2 = midi_manager.request_read(LOOPMIX_TEMPO_ADDR,2,MODEL_ID_AUX,fresh=True).result()
+    return (byte1 << 7) | byte2 # same as; (128 * byte1) + byte2
+
+def set_loopmix_tempo(target,midi_manager,max_rounds=MAX_TEMPO_ROUNDS):
+    """Steps the loop mix tempo to the target bpm.
+    All steps still needed are sent in one burst and the tempo is read back once per burst.
+    Steps the device dropped are re-sent with more spacing, an overshoot is stepped back.
+    Returns:
+        (initial tempo, final tempo, number of steps sent)
+    """
+    tempo = initial = read_loopmix_tempo(midi_manager)
+    spacing = midi_manager.tempo_step_spacing
+    steps_sent = 0
+    progressed = True
+    for _ in range(max_rounds):
+        delta = target - tempo
+        if delta == 0:
+            break
+        addr = TEMPO_UP_ADDR if delta > 0 else TEMPO_DOWN_ADDR
+        steps = abs(delta) if progressed else 1 # after a burst without effect, probe with single steps
+        for _ in range(steps):
+            write_map_data(addr,[0],MODEL_ID_AUX,midi_manager,spacing=spacing)
+        steps_sent += steps
+        new_tempo = read_loopmix_tempo(midi_manager)
+        moved = abs(new_tempo - tempo)
+        if moved == 0 and not progressed:
+            break # a single step, well apart from the previous one, had no effect: the tempo is at its limit
+        if 0 < moved < steps: # some steps were dropped
+            spacing = min(max(2 * spacing, 0.005), 2 * TEMPO_STEP_SPACING)
+        elif moved >= steps > 1: # the whole burst was taken, creep towards a faster pace
+            spacing = 0.9 * spacing if spacing > 0.001 else 0.0
+        progressed = moved > 0
+        tempo = new_tempo
+    midi_manager.tempo_step_spacing = spacing
+    return initial, tempo, steps_sent
+
 def loopmix_tempo(args,midi_manager):
-    byte1, byte2 = read_map_data(0x01000108,2,MODEL_ID_AUX,midi_manager)
-    tempo = (byte1 << 7) | byte2 # same as; (128 * byte1) + byte2
+    if args.bpm is not None:
+        if args.tempo_delta:
+            raise ValueError("Give either a tempo change or --bpm, not both")
+        start = time.monotonic()
+        tempo, new_tempo, steps = set_loopmix_tempo(args.bpm,midi_manager)
+        print(f"Tempo changed from {tempo} to {new_tempo} bpm in {(time.monotonic() - start) * 1000:.0f} ms ({steps} steps).")
+        if new_tempo != args.bpm:
+            raise ValueError(f"Could not reach {args.bpm} bpm")
+        return
+    tempo = read_loopmix_tempo(midi_manager)
     dt = args.tempo_delta
     if dt is None or dt == 0:
         print(f"Loop mix tempo: {tempo} bpm")
     else:
         addr = TEMPO_UP_ADDR if args.tempo_delta > 0 else TEMPO_DOWN_ADDR
         for _ in range(abs(dt)):
-            write_map_data(addr,[0],MODEL_ID_AUX,midi_manager)
-            time.sleep(0.04)
-        byte1, byte2 = read_map_data(0x01000108,2,MODEL_ID_AUX,midi_manager)
-        new_tempo = (byte1 << 7) | byte2 # same as; (128 * byte1) + byte2
+            write_map_data(addr,[0],MODEL_ID_AUX,midi_manager,spacing=TEMPO_STEP_SPACING)
+        new_tempo = read_loopmix_tempo(midi_manager)
         print(f"Tempo changed from {tempo} to {new_tempo} bpm.")
 
 def loopmix_stop(args,midi_manager):
@@ -841,26 +2297,736 @@ def loopmix_stop(args,midi_manager):
     else:
         midi_manager.send_nrpn(16,0,3,0,args.loopmix_part)
 
+def require_patch_catalog():
+    catalog = patch_catalog()
+    if catalog is None:
+        raise ValueError("Patch catalog goplus_patches.py not found, create it with 'patch build-index'")
+    return catalog
+
+def patch_find(args):
+    patches = require_patch_catalog().find(args.query or "", args.category, args.limit)
+    row_format = "{:<16}{:<10}{:>12}"
+    print(row_format.format("Patch", "Category", "MSB,LSB,PC"))
+    for patch in patches:
+        print(row_format.format(patch.name, patch.category, f"{patch.msb},{patch.lsb},{patch.pc}"))
+
+def patch_name(args):
+    msb, lsb, pc = args.patch
+    patch = require_patch_catalog().lookup(msb, lsb, pc)
+    print(f"{msb},{lsb},{pc}: " + (f"'{patch.name}' ({patch.category})" if patch else "not in catalog"))
+
+def patch_build_index(args):
+    patches = parse_patch_table(args.source)
+    write_patch_catalog(patches, args.output, os.path.basename(args.source))
+    print(f"Wrote {len(patches)} patches to {args.output}")
+
+def catalog_banks():
+    """Returns the (MSB, LSB) banks listed in the patch catalog, in order."""
+    catalog = patch_catalog()
+    return list(dict.fromkeys((patch[2], patch[3]) for patch in catalog.patches)) if catalog else []
+
+def validate_bank(bank_str):
+    """Validates a bank string in the format MSB,LSB."""
+    try:
+        msb, lsb = map(int, bank_str.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError("Bank must be in format: MSB,LSB")
+    if not (0 <= msb <= 127 and 0 <= lsb <= 127):
+        raise argparse.ArgumentTypeError("MSB/LSB must be 0-127")
+    return msb, lsb
+
+def read_scan_checkpoint(path):
+    """Returns the results recorded by an earlier scan, keyed by (MSB, LSB, PC)."""
+    results = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                with contextlib.suppress(ValueError, KeyError): # a line cut short by an interruption
+                    entry = json.loads(line)
+                    results[(entry["msb"], entry["lsb"], entry["pc"])] = entry
+    return results
+
+def select_patch(part_num,patch,model_id,midi_manager,spacing=0.0):
+    """Loads patch (MSB, LSB, PC) into a part with a single DT1, returns the address written."""
+    msb, lsb, pc = patch
+    selection_addr = slice_to_7bit(reassemble_from_7bit(calculate_part_address(part_num)) + 4)
+    write_map_data(selection_addr,[msb, lsb, pc - 1],model_id,midi_manager,spacing)
+    return selection_addr
+
+def scan_patches(numbers,parts,model_id,midi_manager,settle=0.0):
+    """Loads each (MSB, LSB, PC) into one of the scratch parts and reads back its patch name.
+    Every scratch part has one patch in flight: while the device answers for one part,
+    the next patches are already being loaded into the others.
+    Yields:
+        (MSB, LSB, PC, name, category) tuples, name is None if the device has no such patch.
+    """
+    in_flight = collections.deque()
+    free_parts = collections.deque(parts)
+    numbers = iter(numbers)
+    while True:
+        for number in numbers:
+            part = free_parts.popleft()
+            msb, lsb, pc = number
+            selection_addr = select_patch(part,number,model_id,midi_manager,settle)
+            reads = (midi_manager.request_read(selection_addr,3,model_id,fresh=True),
+                     get_params_async(PATCH_COMMON_MODEL,calculate_patch_address(part),model_id,midi_manager))
+            in_flight.append((part, number, reads))
+            if not free_parts:
+                break
+        if not in_flight:
+            return
+        part, (msb, lsb, pc), (selection, patch_common) = in_flight.popleft()
+        free_parts.append(part)
+        if list(selection.result()) != [msb, lsb, pc - 1]: # the device ignores a selection it has no patch for
+            yield msb, lsb, pc, None, None
+            continue
+        patch = ParamBlock.from_bytes(PATCH_COMMON_MODEL,patch_common.result())
+        category = patch["PatchCategory"]
+        yield msb, lsb, pc, patch["PatchName"].strip(), PATCH_CATEGORIES[category] if category < len(PATCH_CATEGORIES) else str(category)
+
+def restore_blocks(blocks,model_id,midi_manager):
+    """Writes (address, bytes) blocks back as they were read, e.g. scratch parts after a scan.
+    The raw bytes are written without range checks, values the model does not allow are restored too.
+    """
+    current = read_map_blocks([(addr,len(data)) for addr,data in blocks],model_id,midi_manager,fresh=True)
+    for (addr,data),old_data in zip(blocks,current):
+        write_map_delta(addr,old_data,data,model_id,midi_manager)
+
+def patch_scan(args,midi_manager):
+    model_id = MODEL_IDS[args.model]
+    banks = args.banks or catalog_banks()
+    if not banks:
+        raise ValueError("No banks to scan, give them with --banks MSB,LSB")
+    checkpoint = args.checkpoint or args.output + ".scan.jsonl"
+    results = read_scan_checkpoint(checkpoint)
+    todo = [(msb, lsb, pc) for msb, lsb in banks for pc in range(1,129) if (msb, lsb, pc) not in results]
+    print(f"Scanning {len(todo)} patches on parts {', '.join(map(str, args.parts))}" + (f", {len(results)} done before" if results else ""))
+    part_blocks = [(calculate_part_address(part),PART_SIZE) for part in args.parts]
+    original_parts = list(zip([addr for addr,_ in part_blocks],read_map_blocks(part_blocks,model_id,midi_manager,fresh=True)))
+    start = time.monotonic()
+    try:
+        with open(checkpoint, "a", encoding="utf-8") as f:
+            for done, (msb, lsb, pc, name, category) in enumerate(scan_patches(todo,args.parts,model_id,midi_manager,args.settle / 1000),1):
+                entry = {"msb": msb, "lsb": lsb, "pc": pc, "name": name, "category": category}
+                results[(msb, lsb, pc)] = entry
+                f.write(json.dumps(entry) + "\n")
+                if done % 128 == 0:
+                    f.flush()
+                    print(f"{done}/{len(todo)} patches, {time.monotonic() - start:.0f}s")
+    finally: # also after Ctrl-C, the checkpoint has what was scanned so far
+        restore_blocks(original_parts,model_id,midi_manager)
+    patches = [(entry["name"], entry["category"], *key) for key, entry in sorted(results.items()) if entry["name"] is not None]
+    write_patch_catalog(patches, args.output, f"{args.model} device scan")
+    print(f"Wrote {len(patches)} patches to {args.output} in {time.monotonic() - start:.1f}s")
+
+def load_scenes(path):
+    """Returns the scenes stored in path, {} if there is no such file."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def store_scenes(scenes,path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(path) or ".", delete=False) as f:
+        json.dump(scenes, f, indent=1)
+    os.replace(f.name, path) # never leave a half written file behind
+
+def scene_blocks(scene):
+    """Turns a scene into (address, data model, parameter changes) of the blocks it touches."""
+    try:
+        blocks = [(calculate_part_address(int(num)), PART_MODEL, part_changes(**settings)) for num, settings in scene.get("parts", {}).items()]
+        blocks += [(calculate_zone_address(int(num)), ZONE_MODEL, zone_changes(**settings)) for num, settings in scene.get("zones", {}).items()]
+    except (TypeError, KeyError) as e:
+        raise ValueError(f"Invalid scene setting: {e}")
+    return blocks
+
+def apply_scene(scene,model_id,midi_manager):
+    """Brings the device to the settings of a scene, sending only the byte ranges that differ.
+    Current block contents come from the shadow, or from one coalesced read if unknown.
+    All DT1 messages go out as one burst.
+    Returns:
+        (number of DT1 messages, bytes sent)
+    """
+    return write_block_changes(scene_blocks(scene),model_id,midi_manager)
+
+def write_block_changes(blocks,model_id,midi_manager):
+    """Applies parameter changes to several blocks, sending only the byte ranges that differ as one DT1 burst.
+    The blocks are read from the device first, in one burst, as the shadow misses edits made on the panel.
+    Args:
+        blocks: (address, data model, {parameter name: value}) tuples.
+    Returns:
+        (number of DT1 messages, bytes sent)
+    """
+    blocks_data = read_map_blocks([(addr,codec_for(data_model).size) for addr,data_model,_ in blocks],model_id,midi_manager,fresh=True)
+    builder = sysex_builder(model_id)
+    messages = []
+    for (addr,data_model,changes),old_bytes in zip(blocks,blocks_data):
+        block = ParamBlock.from_bytes(data_model,old_bytes)
+        for name, value in changes.items():
+            block[name] = value
+        new_bytes = block.to_bytes()
+        messages += builder.dt1_ranges(addr,new_bytes,diff_ranges(old_bytes,new_bytes))
+        midi_manager.shadow.update(model_id,addr,new_bytes)
+    midi_manager.send_messages(messages).result()
+    return len(messages), sum(map(len, messages))
+
+def scene_save(args,midi_manager):
+    model_id = MODEL_IDS[args.model]
+    parts = sorted(set(args.parts or range(1,17)))
+    zones = sorted(set(args.zones or range(1,17)))
+    scenes = load_scenes(args.scenes)
+    scenes[args.name] = {
+        "parts": {str(num): part_settings(config) for num,config in zip(parts,get_part_configs(parts,midi_manager,model_id))},
+        "zones": {str(num): zone_settings(config) for num,config in zip(zones,get_zone_configs(zones,midi_manager,model_id))},
+    }
+    store_scenes(scenes,args.scenes)
+    print(f"Saved scene '{args.name}' ({len(parts)} parts, {len(zones)} zones) to {args.scenes}")
+
+def scene_apply(args,midi_manager):
+    scenes = load_scenes(args.scenes)
+    if args.name not in scenes:
+        raise ValueError(f"No scene named '{args.name}' in {args.scenes}")
+    start = time.monotonic()
+    messages, sent_bytes = apply_scene(scenes[args.name],MODEL_IDS[args.model],midi_manager)
+    print(f"Applied scene '{args.name}': {messages} DT1 messages ({sent_bytes} bytes) in {(time.monotonic() - start) * 1000:.0f} ms")
+
+def scene_list(args,midi_manager):
+    for name, scene in load_scenes(args.scenes).items():
+        zones_on = [num for num, settings in scene.get("zones", {}).items() if settings.get("on")]
+        print(f"{name}: zones on: {', '.join(zones_on) or 'none'}")
+
+def scene_delete(args,midi_manager):
+    scenes = load_scenes(args.scenes)
+    if scenes.pop(args.name, None) is None:
+        raise ValueError(f"No scene named '{args.name}' in {args.scenes}")
+    store_scenes(scenes,args.scenes)
+    print(f"Deleted scene '{args.name}'")
+
+SNAPSHOT_FORMAT = "goplus-snapshot/1"
+
+def snapshot_save(args,midi_manager):
+    model_id = MODEL_IDS[args.model]
+    blocks = device_blocks()
+    start = time.monotonic()
+    blocks_data = read_map_blocks([(addr,codec_for(data_model).size) for _,addr,data_model in blocks],model_id,midi_manager,fresh=True) # the shadow misses edits made on the panel
+    snapshot = {
+        "format": SNAPSHOT_FORMAT,
+        "model": args.model,
+        "blocks": [{"name": name, "address": f"{addr:08X}", "data": bytes(data).hex()}
+                   for (name,addr,_),data in zip(blocks,blocks_data)]
+    }
+    with open(args.file, "w") as f:
+        json.dump(snapshot, f, indent=1)
+    print(f"Saved {len(blocks)} blocks ({sum(map(len, blocks_data))} bytes) to {args.file} in {(time.monotonic() - start) * 1000:.0f} ms")
+
+def snapshot_load(args,midi_manager):
+    model_id = MODEL_IDS[args.model]
+    with open(args.file) as f:
+        snapshot = json.load(f)
+    if snapshot.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"{args.file} is not a goplus snapshot")
+    if snapshot["model"] != args.model:
+        raise ValueError(f"{args.file} was saved on {snapshot['model']}, not {args.model}")
+    saved = {int(block["address"], 16): list(bytes.fromhex(block["data"])) for block in snapshot["blocks"]}
+    # setup may reload the performance and a part's patch selection reloads its patch, so these
+    # are written first and what depends on them is compared against the device only afterwards.
+    # The comparison reads the device itself: a shadow kept by the daemon or --persist-shadow misses
+    # edits made on the keyboard, and blocks that differ would be skipped
+    phases = [(SETUP_MODEL, SYS_COMMON_MODEL, SYS_CTRL_MODEL), (PART_MODEL, ZONE_MODEL), (PATCH_COMMON_MODEL,)]
+    start = time.monotonic()
+    changed_blocks = messages = 0
+    for phase in phases:
+        blocks = [(addr,saved[addr]) for _,addr,data_model in device_blocks() if data_model in phase and addr in saved]
+        current = read_map_blocks([(addr,len(data)) for addr,data in blocks],model_id,midi_manager,fresh=True)
+        for (addr,data),old_data in zip(blocks,current):
+            if old_data != data:
+                changed_blocks += 1
+                messages += write_map_delta(addr,old_data,data,model_id,midi_manager)
+    print(f"Restored {args.file}: {changed_blocks} of {len(saved)} blocks differed, sent {messages} DT1 messages in {(time.monotonic() - start) * 1000:.0f} ms")
+
 def transform_values(row, transformations):
     """Applies transformations to a data row.""" 
     return {k : transformations.get(k, lambda x: x)(v) for k,v in row.items() }
 
 
-def main():
+def run_command(args,midi_manager,parser):
+    """Runs a parsed subcommand against open MIDI ports."""
+    if 'subcommand' in args and args.subcommand:
+        args.func(args,midi_manager)
+        if args.stats:
+            midi_manager.tx.flush() # count what the command queued
+            print(midi_manager.stats.report())
+    else:
+        parser.print_help()
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Runs one forwarded command line and answers with its output, one JSON object per line each way."""
+    def handle(self):
+        server = self.server
+        request = json.loads(self.rfile.readline())
+        if request.get("shutdown"):
+            self.reply(0, "goplus daemon stopped\n")
+            threading.Thread(target=server.shutdown).start()
+            return
+        output = io.StringIO()
+        status = 0
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            try:
+                args = server.parser.parse_args(request["argv"])
+                if args.port is not None and args.port not in server.midi_manager.input_device_name:
+                    self.reply(None, "") # another port, the client runs the command itself
+                    return
+                args.model = args.model or server.model
+                os.chdir(request.get("cwd", server.cwd)) # file names are relative to the client
+                with server.midi_manager.overrides(**forwarded_settings(args,server.parser)):
+                    run_command(args,server.midi_manager,server.parser)
+            except SystemExit as e: # argparse errors and --help
+                status = e.code if isinstance(e.code, int) else 1
+                if isinstance(e.code, str):
+                    print(e.code)
+            except (SysExTimeoutError, ValueError, OSError) as e:
+                print(f"Error: {e}")
+                status = 1
+            except Exception:
+                traceback.print_exc()
+                status = 1
+            finally:
+                os.chdir(server.cwd)
+        self.reply(status, output.getvalue())
+    def reply(self, status, output):
+        self.wfile.write(json.dumps({"status": status, "output": output}).encode() + b"\n")
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Serves one command at a time, commands share the open ports, detected model and shadow."""
+    def __init__(self, socket_path, midi_manager, model, parser):
+        self.midi_manager = midi_manager
+        self.model = model
+        self.parser = parser
+        self.cwd = os.getcwd()
+        super().__init__(socket_path, DaemonRequestHandler)
+
+def forwarded_settings(args,parser):
+    """Returns the MidiManager overrides for the global options given on a forwarded command line.
+    Options left at their default keep the daemon's settings.
+    """
+    given = lambda option: getattr(args, option) != parser.get_default(option)
+    for option in ("persist_shadow", "stats_hook"): # these belong to the daemon's own command line
+        if given(option):
+            raise ValueError(f"--{option.replace('_', '-')} can't be used while a goplus daemon runs, give it to 'serve' or add --no-daemon")
+    return {
+        "timeout": args.timeout if given("timeout") else None,
+        "retries": args.retries if given("retries") else None,
+        "use_shadow": False if args.no_shadow else None,
+        "tx_rate": args.tx_rate if given("tx_rate") else None,
+        "tx_gap": args.tx_gap / 1000 if given("tx_gap") else None,
+    }
+
+def serve(args,midi_manager,parser):
+    """Holds the MIDI ports open and runs commands forwarded by other goplus invocations."""
+    if os.path.exists(args.socket):
+        if daemon_request(args.socket, {"argv": []}) is not None:
+            sys.exit(f"Error: a goplus daemon is already listening on {args.socket}")
+        os.unlink(args.socket) # left over from a daemon that did not exit cleanly
+    with DaemonServer(args.socket,midi_manager,args.model,parser) as server:
+        print(f"goplus daemon for {args.model} on '{midi_manager.input_device_name}' listening on {args.socket}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(args.socket)
+
+def daemon_request(socket_path, request):
+    """Sends a request to a running daemon. Returns its reply, or None if no daemon answers."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(json.dumps(request).encode() + b"\n")
+            with client.makefile("rb") as reply:
+                return json.loads(reply.readline())
+    except (OSError, ValueError):
+        return None
+
+def forward_to_daemon(socket_path, argv):
+    """Runs a command line in a running daemon. Returns the exit status, or None to run it locally."""
+    reply = daemon_request(socket_path, {"argv": argv, "cwd": os.getcwd()})
+    if reply is None or reply["status"] is None:
+        return None
+    sys.stdout.write(reply["output"])
+    return reply["status"]
+
+def osc_string(packet, pos):
+    """Reads a NUL terminated OSC string padded to 4 bytes, returns it and the position after it."""
+    end = packet.index(b"\0", pos)
+    return packet[pos:end].decode(errors="replace"), (end + 4) & ~3
+
+def parse_osc(packet):
+    """Parses an OSC packet, a message or a bundle of them.
+    Yields:
+        (address, arguments) pairs. Argument types i, f, d, h, s, T, F and N are understood.
+    """
+    if packet.startswith(b"#bundle\0"):
+        pos = 16 # after the time tag, bundled elements are applied right away
+        while pos < len(packet):
+            size, = struct.unpack_from(">i", packet, pos)
+            yield from parse_osc(packet[pos + 4:pos + 4 + size])
+            pos += 4 + size
+        return
+    address, pos = osc_string(packet, 0)
+    tags, pos = osc_string(packet, pos) if pos < len(packet) else (",", pos)
+    args = []
+    for tag in tags[1:]:
+        if tag in "if":
+            args.append(struct.unpack_from(">" + tag, packet, pos)[0])
+            pos += 4
+        elif tag in "dh":
+            args.append(struct.unpack_from(">" + ("d" if tag == "d" else "q"), packet, pos)[0])
+            pos += 8
+        elif tag == "s":
+            value, pos = osc_string(packet, pos)
+            args.append(value)
+        elif tag in "TFN":
+            args.append({"T": True, "F": False, "N": None}[tag])
+        else:
+            raise ValueError(f"Unsupported OSC type tag '{tag}'")
+    yield address, args
+
+OSC_PART_FIELDS = {"level": ("level", "PartLevel(CC#7)"), "octave": ("octave_shift", "PartOctaveShift"), "channel": ("channel", "ReceiveChannel")}
+OSC_ZONE_FIELDS = {"on": ("on", "ZoneSw"), "octave": ("octave_shift", "ZoneOctaveShift"), "low": ("low_key", "KbdRangeLower"), "high": ("high_key", "KbdRangeUpper")}
+
+def osc_block_changes(data_model, fields, field, arg):
+    """Translates the argument of /part/N/<field> or /zone/N/<field> into parameter changes.
+    Floats are fader positions 0.0-1.0, scaled to the range of the parameter.
+    Other values mean what they mean for part set / zone set (key names or note numbers for key ranges).
+    """
+    if field not in fields:
+        raise ValueError(f"Unknown field '{field}'")
+    setting, name = fields[field]
+    codec = codec_for(data_model)
+    i = codec.index[name]
+    if isinstance(arg, float):
+        changes = {name: round(codec.mins[i] + min(max(arg, 0.0), 1.0) * (codec.maxs[i] - codec.mins[i]))}
+    elif data_model is PART_MODEL:
+        changes = part_changes(**{setting: int(arg)})
+    else:
+        changes = zone_changes(**{setting: KEYS[osc_index(arg, KEYS)] if setting.endswith("_key") and isinstance(arg, int) else arg})
+    for name, value in changes.items():
+        codec.check(codec.index[name], value)
+    return changes
+
+def osc_number(part, lo=1, hi=16):
+    num = int(part)
+    if not lo <= num <= hi:
+        raise ValueError(f"{num} is not in range {lo}-{hi}")
+    return num
+
+def osc_index(arg, names, base=0):
+    """Turns a name, or a number counted from base, into an index of names. Numbers out of range are rejected, not wrapped."""
+    if isinstance(arg, str):
+        return names.index(arg)
+    return osc_number(arg, base, len(names) - 1 + base) - base
+
+def translate_osc(address, args):
+    """Maps an OSC message to what it changes on the keyboard.
+    Returns:
+        (key, kind, value): messages with the same key replace each other until the next tick.
+        kind is "block" (value: address, data model, changes), "controls" (a send_controls event),
+        "tempo" (bpm) or "scene" (name).
+    """
+    path = address.strip("/").split("/")
+    arg = args[0] if args else None
+    if path[0] == "part" and len(path) == 3:
+        num = osc_number(path[1])
+        if path[2] == "patch":
+            patch = resolve_patch_name(arg) if isinstance(arg, str) else validate_patch(",".join(map(str, map(int, args))))
+            return address, "block", (calculate_part_address(num), PART_MODEL, part_changes(patch=patch))
+        return address, "block", (calculate_part_address(num), PART_MODEL, osc_block_changes(PART_MODEL, OSC_PART_FIELDS, path[2], arg))
+    if path[0] == "zone" and len(path) == 3:
+        num = osc_number(path[1])
+        return address, "block", (calculate_zone_address(num), ZONE_MODEL, osc_block_changes(ZONE_MODEL, OSC_ZONE_FIELDS, path[2], arg))
+    if path[0] == "loopmix" and len(path) == 2:
+        if path[1] == "style":
+            style = osc_index(arg, LOOPMIX_STYLES, 1)
+            return address, "controls", ("nrpn", 16, 0, 0, 0, style)
+        if path[1] == "play":
+            loopmix_part, pattern = osc_number(args[0], 1, 5), osc_number(args[1], 1, 11)
+            return (address, loopmix_part), "controls", ("nrpn", 16, 0, 1, loopmix_part - 1, pattern - 1)
+        if path[1] == "stop":
+            loopmix_part = osc_number(arg or 0, 0, 5) # 0: all loop mix parts
+            return (address, loopmix_part), "controls", ("nrpn", 16, 0, 3, 0, loopmix_part)
+        if path[1] == "key":
+            key_index = osc_index(arg, LOOPMIX_KEYS)
+            return address, "controls", ("nrpn", 16, 0, 2, 0, key_index)
+        if path[1] == "tempo":
+            return address, "tempo", int(arg)
+    if path == ["scene"]:
+        return address, "scene", str(arg)
+    raise ValueError("Unknown address")
+
+class OscRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        self.server.receive(self.request[0])
+
+class OscServer(socketserver.UDPServer):
+    """Receives OSC messages and applies them to the keyboard.
+    Incoming messages only replace the latest value of what they change. Every tick, the pending values
+    are sent together: part and zone changes as one DT1 burst of the changed bytes, loop mix commands as
+    one controller burst. A fader flood thus costs one write per tick, never a queue of stale values.
+    """
+    allow_reuse_address = True
+    def __init__(self, address, midi_manager, model_id, tick=OSC_TICK, scenes=SCENES_FILE):
+        self.midi_manager = midi_manager
+        self.model_id = model_id
+        self.tick = tick
+        self.scenes = scenes
+        self.pending = {} # key -> (kind, value), latest value first seen order
+        self.pending_lock = threading.Lock()
+        self.ticked = threading.Event()
+        super().__init__(address, OscRequestHandler)
+        self.tick_thread = threading.Thread(target=self.run_ticks, name="goplus-osc", daemon=True)
+        self.tick_thread.start()
+    def receive(self, packet):
+        try:
+            updates = [translate_osc(address, args) for address, args in parse_osc(packet)]
+        except (ValueError, IndexError, TypeError, struct.error, argparse.ArgumentTypeError) as e:
+            print(f"Ignored OSC packet: {e}", flush=True)
+            return
+        with self.pending_lock:
+            for key, kind, value in updates:
+                self.pending[key] = (kind, value)
+    def run_ticks(self):
+        while not self.ticked.wait(self.tick):
+            with self.pending_lock:
+                pending, self.pending = self.pending, {}
+            if pending:
+                try:
+                    self.apply(pending.values())
+                except (SysExTimeoutError, ValueError, OSError) as e:
+                    print(f"Error: {e}", flush=True)
+    def apply(self, updates):
+        blocks = {} # address -> (data model, merged changes)
+        events = []
+        for kind, value in updates:
+            if kind == "scene":
+                scenes = load_scenes(self.scenes)
+                if value not in scenes:
+                    raise ValueError(f"No scene named '{value}'")
+                for addr, data_model, changes in scene_blocks(scenes[value]):
+                    blocks.setdefault(addr, (data_model, {}))[1].update(changes)
+            elif kind == "block":
+                addr, data_model, changes = value
+                blocks.setdefault(addr, (data_model, {}))[1].update(changes)
+            elif kind == "controls":
+                events.append(value)
+        if blocks:
+            write_block_changes([(addr, data_model, changes) for addr, (data_model, changes) in blocks.items()],self.model_id,self.midi_manager)
+        if events:
+            self.midi_manager.send_controls(events)
+        for kind, value in updates:
+            if kind == "tempo": # closed loop, takes a few round-trips
+                set_loopmix_tempo(value,self.midi_manager)
+    def server_close(self):
+        self.ticked.set()
+        self.tick_thread.join()
+        super().server_close()
+
+def osc_serve(args,midi_manager):
+    """Runs the OSC bridge until interrupted."""
+    with OscServer((args.host, args.osc_port),midi_manager,MODEL_IDS[args.model],args.tick / 1000,args.scenes) as server:
+        print(f"goplus OSC bridge for {args.model} on '{midi_manager.input_device_name}' listening on udp {args.host}:{args.osc_port}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+def open_manager(args):
+    emulator = KeyboardEmulator(args.emulate) if args.emulate else None
+    return MidiManager(args.port,args.timeout,args.retries,not args.no_shadow,args.tx_rate,args.tx_gap / 1000,emulator)
+
+def run_device(args,midi_manager,parser):
+    """Detects the model if needed and runs the command on one device."""
+    if args.stats_hook:
+        midi_manager.stats.add_hook(load_stats_hook(args.stats_hook))
+    # Model selection/detection logic
+    if args.model is None or args.persist_shadow: # the Identity Reply also names the shadow file
+        detected_model = autodetect_model(args.port,midi_manager)
+        args.model = args.model or detected_model
+    if args.persist_shadow:
+        midi_manager.shadow.load(shadow_path(midi_manager.identity,midi_manager.input_device_name),midi_manager.identity)
+    if args.command == 'serve':
+        serve(args,midi_manager,parser)
+    elif args.command == 'osc':
+        osc_serve(args,midi_manager)
+        if args.stats:
+            print(midi_manager.stats.report())
+    else:
+        run_command(args,midi_manager,parser)
+    if args.persist_shadow:
+        midi_manager.shadow.save(shadow_path(midi_manager.identity,midi_manager.input_device_name),midi_manager.identity)
+
+def load_stats_hook(spec):
+    """Imports the hook named by 'module:function', called as hook(metric, value, kind) for every statistics sample."""
+    module_name, _, function_name = spec.partition(":")
+    try:
+        return getattr(importlib.import_module(module_name), function_name or "stats_hook")
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Cannot load statistics hook '{spec}': {e}")
+
+def stats_show(args,midi_manager):
+    if args.json:
+        print(json.dumps(midi_manager.stats.as_dict(), indent=1))
+    else:
+        print(midi_manager.stats.report())
+
+def stats_reset(args,midi_manager):
+    midi_manager.stats.reset()
+    print("I/O statistics reset")
+
+def list_ports():
+    """Returns the names of the MIDI input ports."""
+    midi_in = rtmidi.MidiIn()
+    try:
+        return midi_in.get_ports()
+    finally:
+        midi_in.delete()
+
+def match_ports(patterns):
+    """Expands port names and glob patterns (e.g. 'GO:KEYS*') to available input ports, in order."""
+    available = list_ports()
+    ports = []
+    for pattern in patterns:
+        matches = fnmatch.filter(available, pattern) or [port for port in available if pattern in port]
+        if not matches:
+            raise ValueError(f"No MIDI port matches '{pattern}'")
+        ports += [port for port in matches if port not in ports]
+    return ports
+
+class ThreadOutput(io.TextIOBase):
+    """Stand-in for sys.stdout that sends each thread's output to its own buffer while it captures."""
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    def write(self, text):
+        return (getattr(self.local, "buffer", None) or self.stream).write(text)
+    def flush(self):
+        self.stream.flush()
+    @contextlib.contextmanager
+    def capture(self):
+        self.local.buffer = io.StringIO()
+        try:
+            yield self.local.buffer
+        finally:
+            self.local.buffer = None
+
+def run_fleet(args,parser):
+    """Runs the command on every port matching args.ports at the same time, one thread per device.
+    Each device is opened and identified in its own thread, the output is printed per device at the end.
+    Returns:
+        The number of devices the command failed on.
+    """
+    ports = match_ports(args.ports)
+    output = ThreadOutput(sys.stdout)
+    def run(port):
+        device_args = copy.copy(args)
+        device_args.port = port
+        with output.capture() as captured:
+            start = time.monotonic()
+            try:
+                with open_manager(device_args) as midi_manager:
+                    if midi_manager.midi_out is None:
+                        raise OSError(f"Could not open {port}")
+                    run_device(device_args,midi_manager,parser)
+                error = None
+            except Exception as e: # reported with the device, the others carry on
+                error = e
+            return captured.getvalue(), error, time.monotonic() - start
+    start = time.monotonic()
+    with contextlib.redirect_stdout(output), ThreadPoolExecutor(max_workers=len(ports)) as pool:
+        results = list(pool.map(run, ports))
+    failed = 0
+    for port, (text, error, duration) in zip(ports,results):
+        print(f"== {port}: " + (f"Error: {error}" if error else "ok") + f" ({duration:.1f}s)")
+        print(text, end="")
+        failed += error is not None
+    print(f"{len(ports) - failed} of {len(ports)} devices ok in {time.monotonic() - start:.1f}s")
+    return failed
+
+def build_parser():
     # Main parser 
     parser = argparse.ArgumentParser(description="%(prog)s - GO:KEYS and GO:PIANO Sound Management Tool")
 #    parser.add_argument('-v', '--verbose', action='store_true', help="Verbose output")
     parser.add_argument('-p', '--port', required=False, help="MIDI port (default: first available)") 
+    parser.add_argument('--ports', type=lambda ports: ports.split(','), help="Run the command on several keyboards at once: comma separated port names or globs, e.g. 'GO:KEYS*'")
     parser.add_argument('--model', choices=MODEL_IDS.keys(), help="Select model (GK/GP, auto-detect if omitted)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help=f"Seconds to wait for a reply until round-trip time is measured (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES, help=f"Times a request is re-sent before giving up (default: {DEFAULT_RETRIES})")
+    parser.add_argument('--tx-rate', type=int, default=DEFAULT_TX_RATE, help=f"Limit the bytes per second sent to the keyboard, e.g. {DIN_TX_RATE} behind a DIN MIDI interface, see 'sys calibrate' (default: no limit, 0 to lift a daemon's limit)")
+    parser.add_argument('--tx-gap', type=float, default=0.0, help="Minimum milliseconds between two messages sent to the keyboard (default: 0)")
+    parser.add_argument('--no-shadow', action='store_true', help="Always read from the keyboard instead of the local copy of its parameters")
+    parser.add_argument('--persist-shadow', action='store_true', help=f"Keep the local copy of parameters in {SHADOW_DIR} between runs (only safe if nothing else changes the keyboard in between)")
+    parser.add_argument('--socket', default=DAEMON_SOCKET, help=f"Socket of the goplus daemon (default: {DAEMON_SOCKET})")
+    parser.add_argument('--stats', action='store_true', help="Print I/O statistics (latencies, traffic, retries) after the command")
+    parser.add_argument('--stats-hook', help="Pass every statistics sample to a function, given as MODULE:FUNCTION, called as FUNCTION(metric, value, kind)")
+    parser.add_argument('--emulate', choices=MODEL_IDS.keys(), help="Run against a built-in software keyboard of this model instead of a MIDI port")
+    parser.add_argument('--no-daemon', action='store_true', help="Open the MIDI ports even if a goplus daemon is running")
 
     subparsers = parser.add_subparsers(title="subcommands", dest="command")
 
+    # serve command
+    serve_parser = subparsers.add_parser('serve', help="Keep the MIDI ports open and run commands of other goplus invocations")
+    serve_parser.add_argument('--stop', action='store_true', help="Stop the running daemon")
+
+    # emulate command
+    emulate_parser = subparsers.add_parser('emulate', help="Present a software keyboard on a virtual MIDI port (use --model to pick GK or GP)")
+    emulate_parser.add_argument('--name', help="Port name (default: goplus MODEL emulator)")
+    emulate_parser.add_argument('--latency', type=float, default=2.0, help="Reply latency in milliseconds (default: 2)")
+    emulate_parser.add_argument('--jitter', type=float, default=0.0, help="Random extra latency, up to this many milliseconds (default: 0)")
+    emulate_parser.add_argument('--drop', type=float, default=0.0, help="Probability of losing an incoming message (default: 0)")
+    emulate_parser.add_argument('--max-sysex', type=int, default=128, help="Largest number of data bytes in one DT1 reply (default: 128)")
+    emulate_parser.set_defaults(func=emulate, offline=True)
+
+    # monitor command
+    monitor_parser = subparsers.add_parser('monitor', help="Show parameter changes made on the keyboard as they happen")
+    monitor_parser.add_argument('--duration', type=float, help="Stop after this many seconds (default: run until Ctrl-C)")
+    monitor_parser.add_argument('--no-prime', action='store_true', help="Don't read the current values first (old values show as None)")
+    monitor_parser.set_defaults(func=monitor, subcommand='monitor', foreground=True)
+
+    # osc command
+    osc_parser = subparsers.add_parser('osc', help="Control parts, zones, loop mix and scenes over OSC (e.g. from TouchOSC)")
+    osc_parser.add_argument('--host', default='0.0.0.0', help="Address to listen on (default: all)")
+    osc_parser.add_argument('--osc-port', type=int, default=OSC_PORT, help=f"UDP port (default: {OSC_PORT})")
+    osc_parser.add_argument('--tick', type=float, default=OSC_TICK * 1000, help=f"Milliseconds between sends of the latest values (default: {OSC_TICK * 1000:.0f})")
+    osc_parser.add_argument('--scenes', default=SCENES_FILE, help=f"Scene file for /scene (default: {SCENES_FILE})")
+    osc_parser.set_defaults(foreground=True)
+
+    # stats command
+    stats_parser = subparsers.add_parser('stats', help="I/O statistics, of the daemon if one is running")
+    stats_subparsers = stats_parser.add_subparsers(title="subcommands", dest="subcommand", help='additional help')
+    stats_show_parser = stats_subparsers.add_parser('show', help="Show latencies, traffic, retries and timeouts")
+    stats_show_parser.add_argument('--json', action='store_true', help="Print as JSON")
+    stats_show_parser.set_defaults(func=stats_show)
+    stats_reset_parser = stats_subparsers.add_parser('reset', help="Start counting anew")
+    stats_reset_parser.set_defaults(func=stats_reset)
+
     # sys command
     sys_parser = subparsers.add_parser('sys',help="system data")
     sys_subparsers = sys_parser.add_subparsers(title="subcommands", dest="subcommand", help='additional help')
     # 'get' subcommand within 'sys'
     sys_show_parser = sys_subparsers.add_parser('show', help="Get setup & system properties")
     sys_show_parser.set_defaults(func=sys_show)
+    # 'calibrate' subcommand within 'sys'
+    sys_calibrate_parser = sys_subparsers.add_parser('calibrate', help="Measure how fast the keyboard takes SysEx messages")
+    sys_calibrate_parser.set_defaults(func=sys_calibrate)
+    # 'dump' subcommand within 'sys'
+    sys_dump_parser = sys_subparsers.add_parser('dump', help="Read a memory area of any size, streamed in chunks")
+    sys_dump_parser.add_argument('address', type=lambda x: int(x, 16), help="Start address (hex, 7-bit bytes as in the MIDI implementation, e.g. 10000000)")
+    sys_dump_parser.add_argument('size', type=lambda x: int(x, 0), help="Number of bytes")
+    sys_dump_parser.add_argument('--chunk', type=lambda x: int(x, 0), default=MAX_RQ1_SIZE, help=f"Bytes per read request (default: {MAX_RQ1_SIZE})")
+    sys_dump_parser.add_argument('-o', '--output', help="Write the bytes to this file instead of printing them")
+    sys_dump_parser.set_defaults(func=sys_dump)
 
     # parts command 
     part_parser = subparsers.add_parser('part', help="Manage configuration of parts")
@@ -869,7 +3035,7 @@ def main():
     #  'set' subcommand within 'part'
     part_set_parser = part_subparsers.add_parser('set', help="Set part properties")
     part_set_parser.add_argument('part', type=int, choices=range(1, 17), help="Part number",metavar='PART_NUM')
-    part_set_parser.add_argument('--patch', type=validate_patch, help="Patch specified as MSB,LSB,PC")
+    part_set_parser.add_argument('--patch', type=validate_patch, help="Patch specified as MSB,LSB,PC or by name")
     part_set_parser.add_argument('--channel', type=int, help="MIDI receive channel", choices=range(1, 17), metavar='CHAN')
     part_set_parser.add_argument('--level', type=int, help="Part level (volume)")
     part_set_parser.add_argument('--octave-shift', type=int, choices=range(-3,4), help="Octave shift for the part")
@@ -891,6 +3057,67 @@ def main():
     part_preview_parser.add_argument("--duration", type=int, default=5, help="Set preview length in seconds (default: 5)") 
     part_preview_parser.set_defaults(func=part_preview)
 
+    part_audition_parser = part_subparsers.add_parser('audition', help="Play the demo of a list of patches, one after the other")
+    part_audition_parser.add_argument('part_num', type=int, choices=range(1, 17), help="Part to play the patches on, it is restored afterwards",metavar='PART_NUM')
+    part_audition_parser.add_argument('--spare', type=int, choices=range(1, 17), default=16, help="Part that loads the next patch while one plays (default: 16)",metavar='PART_NUM')
+    part_audition_parser.add_argument('--patches', type=validate_patch, nargs='+', help="Patches as MSB,LSB,PC or names (default: the catalog)", metavar='PATCH')
+    part_audition_parser.add_argument('--query', help="Only catalog patches matching this name")
+    part_audition_parser.add_argument('--category', choices=sorted(set(PATCH_CATEGORIES)), help="Only catalog patches of this category", metavar='CAT')
+    part_audition_parser.add_argument("--duration", type=float, default=5, help="Seconds to play each patch (default: 5)")
+    part_audition_parser.set_defaults(func=part_audition, foreground=True)
+
+    # patch command
+    patch_parser = subparsers.add_parser('patch', help="Search the patch catalog")
+    patch_subparsers = patch_parser.add_subparsers(title="subcommands", dest="subcommand", help='additional help')
+    patch_find_parser = patch_subparsers.add_parser('find', help="Find patches by name and category")
+    patch_find_parser.add_argument('query', nargs='?', help="Name, name prefix or letters of the name in order")
+    patch_find_parser.add_argument('--category', choices=sorted(set(PATCH_CATEGORIES)), help="Only patches of this category", metavar='CAT')
+    patch_find_parser.add_argument('--limit', type=int, default=20, help="Maximum number of results (default: 20)")
+    patch_find_parser.set_defaults(func=patch_find, offline=True)
+    patch_name_parser = patch_subparsers.add_parser('name', help="Look up the name of a patch")
+    patch_name_parser.add_argument('patch', type=validate_patch, help="Patch specified as MSB,LSB,PC")
+    patch_name_parser.set_defaults(func=patch_name, offline=True)
+    patch_build_index_parser = patch_subparsers.add_parser('build-index', help="Generate the patch catalog module from a markdown table")
+    patch_build_index_parser.add_argument('--source', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "GO-sounds.md"), help="Markdown patch table (default: GO-sounds.md)")
+    patch_build_index_parser.add_argument('--output', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "goplus_patches.py"), help="Module to write (default: goplus_patches.py)")
+    patch_build_index_parser.set_defaults(func=patch_build_index, offline=True)
+    patch_scan_parser = patch_subparsers.add_parser('scan', help="Build a patch catalog by reading every patch's name from the device")
+    patch_scan_parser.add_argument('--banks', type=validate_bank, nargs='+', help="Banks to scan as MSB,LSB (default: all banks in the catalog)", metavar='MSB,LSB')
+    patch_scan_parser.add_argument('--parts', type=int, nargs='+', choices=range(1,17), default=[13,14,15,16], help="Scratch parts, their patches are restored afterwards (default: 13 14 15 16)", metavar='PART_NUM')
+    patch_scan_parser.add_argument('--settle', type=float, default=0.0, help="Time in ms to give the device after each patch change (default: 0)")
+    patch_scan_parser.add_argument('--output', default="goplus_device_patches.py", help="Catalog module to write (default: goplus_device_patches.py)")
+    patch_scan_parser.add_argument('--checkpoint', help="Progress file, an interrupted scan resumes from it (default: OUTPUT.scan.jsonl)")
+    patch_scan_parser.set_defaults(func=patch_scan, foreground=True)
+
+    # scene command
+    scene_parser = subparsers.add_parser('scene', help="Named part & zone settings, switched with as few messages as possible")
+    scene_subparsers = scene_parser.add_subparsers(title="subcommands", dest="subcommand", help='additional help')
+    scene_save_parser = scene_subparsers.add_parser('save', help="Save the current patches, levels, channels, octave shifts and key ranges as a scene")
+    scene_save_parser.add_argument('name', help="Scene name")
+    scene_save_parser.add_argument('--parts', type=int, nargs='+', choices=range(1,17), help="Parts to include (default: all)", metavar='PART_NUM')
+    scene_save_parser.add_argument('--zones', type=int, nargs='+', choices=range(1,17), help="Zones to include (default: all)", metavar='ZONE_NUM')
+    scene_save_parser.set_defaults(func=scene_save)
+    scene_apply_parser = scene_subparsers.add_parser('apply', help="Switch to a scene")
+    scene_apply_parser.add_argument('name', help="Scene name")
+    scene_apply_parser.set_defaults(func=scene_apply)
+    scene_list_parser = scene_subparsers.add_parser('list', help="List saved scenes")
+    scene_list_parser.set_defaults(func=scene_list)
+    scene_delete_parser = scene_subparsers.add_parser('delete', help="Delete a scene")
+    scene_delete_parser.add_argument('name', help="Scene name")
+    scene_delete_parser.set_defaults(func=scene_delete)
+    for scene_subparser in (scene_save_parser, scene_apply_parser, scene_list_parser, scene_delete_parser):
+        scene_subparser.add_argument('--scenes', default=SCENES_FILE, help=f"Scene file (default: {SCENES_FILE})")
+
+    # snapshot command
+    snapshot_parser = subparsers.add_parser('snapshot', help="Save or restore the whole keyboard setup")
+    snapshot_subparsers = snapshot_parser.add_subparsers(title="subcommands", dest="subcommand", help='additional help')
+    snapshot_save_parser = snapshot_subparsers.add_parser('save', help="Save setup, system, zones, parts and patch commons to a file")
+    snapshot_save_parser.add_argument('file', help="Snapshot file")
+    snapshot_save_parser.set_defaults(func=snapshot_save)
+    snapshot_load_parser = snapshot_subparsers.add_parser('load', help="Restore a snapshot, writing only what differs")
+    snapshot_load_parser.add_argument('file', help="Snapshot file")
+    snapshot_load_parser.set_defaults(func=snapshot_load)
+
     # zone command 
     zone_parser = subparsers.add_parser('zone', help="Manage configuration of zones")
     zone_subparsers = zone_parser.add_subparsers(title="subcommands", dest="subcommand", help='additional help')
@@ -934,6 +3161,7 @@ def main():
     # loopmix tempo
     loopmix_tempo_parser = loopmix_subparsers.add_parser('tempo', help="loopmix tempo")
     loopmix_tempo_parser.add_argument('tempo_delta', type=int, help="loop mix tempo", nargs='?')
+    loopmix_tempo_parser.add_argument('--bpm', type=int, help="set an absolute tempo instead of changing it by steps")
     loopmix_tempo_parser.set_defaults(func=loopmix_tempo)
 
     # loopmix key
@@ -945,22 +3173,45 @@ def main():
     loopmix_exit_parser = loopmix_subparsers.add_parser('exit', help="exit loop mixing mode")
     loopmix_exit_parser.set_defaults(func=loopmix_exit)
 
+    return parser
+
+def main():
+    parser = build_parser()
     # Parse the arguments 
     args = parser.parse_args()
 
+    if getattr(args, 'offline', False): # needs no MIDI ports
+        try:
+            args.func(args)
+        except (ValueError, OSError) as e:
+            sys.exit(f"Error: {e}")
+        return
+    if args.command == 'serve' and args.stop:
+        reply = daemon_request(args.socket, {"shutdown": True})
+        if reply is None:
+            sys.exit(f"Error: no goplus daemon on {args.socket}")
+        sys.stdout.write(reply["output"])
+        return
+    if args.ports:
+        if args.command == 'serve' or getattr(args, 'foreground', False):
+            sys.exit(f"Error: {' '.join(sys.argv[sys.argv.index(args.command):][:2])} can't run on several ports")
+        try:
+            failed = run_fleet(args,parser)
+        except (ValueError, OSError) as e:
+            sys.exit(f"Error: {e}")
+        sys.exit(1 if failed else 0)
+    if args.command != 'serve' and not args.no_daemon and not args.emulate and not getattr(args, 'foreground', False): # long running or reading the keyboard, not for the daemon
+        status = forward_to_daemon(args.socket, sys.argv[1:])
+        if status is not None:
+            sys.exit(status)
+
    #lets open the midi device
-    #midi_manager = MidiManager(args.port)
-    with MidiManager(args.port) as midi_manager:
-        # Model selection/detection logic
-        if args.model is None:
-            args.model = autodetect_model(args.port,midi_manager)
-        if 'subcommand' in args and args.subcommand:
-            args.func(args,midi_manager)
-        else:
-            parser.print_help()
+    with open_manager(args) as midi_manager:
+        try:
+            run_device(args,midi_manager,parser)
+        except (SysExTimeoutError, ValueError, OSError) as e:
+            sys.exit(f"Error: {e}")
     
-#    midi_manager.close_devices()
-
 if __name__ == "__main__":
     main()
 
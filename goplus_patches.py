@@ -0,0 +1,4207 @@
+# Generated by goplus.py from GO-sounds.md, do not edit.
+# Rows are (name, category, MSB, LSB, PC), PC counted from 1.
+
+PATCHES = (
+    ('88StageGrand', 'PNO', 87, 64, 1),
+    ('88StgGrand 2', 'PNO', 87, 64, 2),
+    ('88StgGrand 3', 'PNO', 87, 64, 3),
+    ('JUNO Piano 1', 'PNO', 87, 64, 4),
+    ('JUNO Piano 2', 'PNO', 87, 64, 5),
+    ('Rich Grand 1', 'PNO', 87, 64, 6),
+    ('Rich Grand 2', 'PNO', 87, 64, 7),
+    ('Piano+Str 1', 'PNO', 87, 64, 8),
+    ('Fairy Piano', 'PNO', 87, 64, 9),
+    ('Pop Piano 1', 'PNO', 87, 64, 10),
+    ('Pop Piano 2', 'PNO', 87, 64, 11),
+    ('ConcertGrand', 'PNO', 87, 64, 12),
+    ('Warm Tune', 'PNO', 87, 64, 13),
+    ('Hall Concert', 'PNO', 87, 64, 14),
+    ('Mellow Tune', 'PNO', 87, 64, 15),
+    ('Mono Piano 1', 'PNO', 87, 64, 16),
+    ('Mono Piano 2', 'PNO', 87, 64, 17),
+    ('Mono Piano 3', 'PNO', 87, 64, 18),
+    ('Piano+Pad 1', 'PNO', 87, 64, 19),
+    ('Piano+Pad 2', 'PNO', 87, 64, 20),
+    ('Piano+Vox', 'PNO', 87, 64, 21),
+    ('Piano+Str 2', 'PNO', 87, 64, 22),
+    ('Layers', 'PNO', 87, 64, 23),
+    ('Grand Hall', 'PNO', 87, 64, 24),
+    ('Cicada Piano', 'PNO', 87, 64, 25),
+    ('Rapsody', 'PNO', 87, 64, 26),
+    ('Pop Piano 3', 'PNO', 87, 64, 27),
+    ('Pop Piano 4', 'PNO', 87, 64, 28),
+    ('Radio Piano', 'PNO', 87, 64, 29),
+    ("Rokkin' pF", 'PNO', 87, 64, 30),
+    ('JD Piano 1', 'PNO', 87, 64, 31),
+    ('JD Piano 2', 'PNO', 87, 64, 32),
+    ('JD Piano&Str', 'PNO', 87, 64, 33),
+    ('SA Dance Pno', 'PNO', 87, 64, 34),
+    ('E-Grand', 'PNO', 87, 64, 35),
+    ('Back E-Grand', 'PNO', 87, 64, 36),
+    ('Dark Grand', 'PNO', 87, 64, 37),
+    ('Grand+FM', 'PNO', 87, 64, 38),
+    ('Blend Piano', 'PNO', 87, 64, 39),
+    ('Piano Oz', 'PNO', 87, 64, 40),
+    ('Meditate Pno', 'PNO', 87, 64, 41),
+    ('FX Piano', 'PNO', 87, 64, 42),
+    ('AmbientPiano', 'PNO', 87, 64, 43),
+    ('Pure EP', 'EP', 87, 64, 44),
+    ('Pure EP Trem', 'EP', 87, 64, 45),
+    ('Stage Phazer', 'EP', 87, 64, 46),
+    ('SA EPiano 1', 'EP', 87, 64, 47),
+    ('FM EP 1', 'EP', 87, 64, 48),
+    ('Pure Wurly 1', 'EP', 87, 64, 49),
+    ('Wurly Trem 1', 'EP', 87, 64, 50),
+    ('VelSpdWurly', 'EP', 87, 64, 51),
+    ('Phase EP 1', 'EP', 87, 64, 52),
+    ('Phase Stg EP', 'EP', 87, 64, 53),
+    ('Flanger EP', 'EP', 87, 64, 54),
+    ('TEL Stage EP', 'EP', 87, 64, 55),
+    ('Vintage EP 1', 'EP', 87, 64, 56),
+    ('Vintage EP 2', 'EP', 87, 64, 57),
+    ('Vintage EP 3', 'EP', 87, 64, 58),
+    ('Stage EP 1', 'EP', 87, 64, 59),
+    ('Stage EP 2', 'EP', 87, 64, 60),
+    ('StageCabinet', 'EP', 87, 64, 61),
+    ('StageEP Trem', 'EP', 87, 64, 62),
+    ('EP Trem 1', 'EP', 87, 64, 63),
+    ('EP Trem 2', 'EP', 87, 64, 64),
+    ('EP Trem 3', 'EP', 87, 64, 65),
+    ('EP Chorus 1', 'EP', 87, 64, 66),
+    ('EP Chorus 2', 'EP', 87, 64, 67),
+    ('EP Chorus 3', 'EP', 87, 64, 68),
+    ('Phase EP 2', 'EP', 87, 64, 69),
+    ('80s EP 1', 'EP', 87, 64, 70),
+    ('Dyno EP', 'EP', 87, 64, 71),
+    ('E.Piano', 'EP', 87, 64, 72),
+    ('Back2the60s', 'EP', 87, 64, 73),
+    ('Tine EP', 'EP', 87, 64, 74),
+    ('LEO EP', 'EP', 87, 64, 75),
+    ('SA EPiano 2', 'EP', 87, 64, 76),
+    ('SA EP Trem', 'EP', 87, 64, 77),
+    ('FM EP mix', 'EP', 87, 64, 78),
+    ('FM-777', 'EP', 87, 64, 79),
+    ('FM EP 2', 'EP', 87, 64, 80),
+    ('FM EP 3', 'EP', 87, 64, 81),
+    ('FM EP 4', 'EP', 87, 64, 82),
+    ('Pure Wurly 2', 'EP', 87, 64, 83),
+    ('Pure Wurly 3', 'EP', 87, 64, 84),
+    ('Wurly Trem 2', 'EP', 87, 64, 85),
+    ('Wurly Trem 3', 'EP', 87, 64, 86),
+    ('EP Layer', 'EP', 87, 64, 87),
+    ('80s EP 2', 'EP', 87, 64, 88),
+    ('Pop EP', 'EP', 87, 64, 89),
+    ('EP Bell 1', 'EP', 87, 64, 90),
+    ('EP Bell 2', 'EP', 87, 64, 91),
+    ('LonesomeRoad', 'EP', 87, 64, 92),
+    ("Age'n'Tines", 'EP', 87, 64, 93),
+    ('Brill TremEP', 'EP', 87, 64, 94),
+    ('Crystal EP', 'EP', 87, 64, 95),
+    ('Vintage Tine', 'EP', 87, 64, 96),
+    ('Mk2 Stg phsr', 'EP', 87, 64, 97),
+    ('Celestial EP', 'EP', 87, 64, 98),
+    ('Psycho EP 1', 'EP', 87, 64, 99),
+    ('Psycho EP 2', 'EP', 87, 64, 100),
+    ('TineEP+Pad', 'EP', 87, 64, 101),
+    ('Wurly+Pad', 'EP', 87, 64, 102),
+    ('Dreaming EP', 'EP', 87, 64, 103),
+    ('Balladeer', 'EP', 87, 64, 104),
+    ('Remember', 'EP', 87, 64, 105),
+    ('Vibe EP', 'EP', 87, 64, 106),
+    ('sin(EP)', 'EP', 87, 64, 107),
+    ('Fonky Fonky', 'EP', 87, 64, 108),
+    ('FM EPad', 'EP', 87, 64, 109),
+    ('EP Stack', 'EP', 87, 64, 110),
+    ('HardRockORG1', 'ORG', 87, 64, 111),
+    ('HardRockORG2', 'ORG', 87, 64, 112),
+    ('GT Org Stack', 'ORG', 87, 64, 113),
+    ('GT Org Std', 'ORG', 87, 64, 114),
+    ('GT Org Clean', 'ORG', 87, 64, 115),
+    ('Perc Organ 1', 'ORG', 87, 64, 116),
+    ('FullStop Org', 'ORG', 87, 64, 117),
+    ('FullDraw Org', 'ORG', 87, 64, 118),
+    ('StakDraw Org', 'ORG', 87, 64, 119),
+    ('JUNO PercOrg', 'ORG', 87, 64, 120),
+    ('VKHold4Speed', 'ORG', 87, 64, 121),
+    ('Pop Organ 1', 'ORG', 87, 64, 122),
+    ('Pop Organ 2', 'ORG', 87, 64, 123),
+    ('Pop Organ 3', 'ORG', 87, 64, 124),
+    ('B Org 1', 'ORG', 87, 64, 125),
+    ('B Org 2', 'ORG', 87, 64, 126),
+    ('B Org 3', 'ORG', 87, 64, 127),
+    ('B Org 4', 'ORG', 87, 64, 128),
+    ('D.Bar Org 1', 'ORG', 87, 65, 1),
+    ('D.Bar Org 2', 'ORG', 87, 65, 2),
+    ('D.Bar Org 3', 'ORG', 87, 65, 3),
+    ('D.Bar Org 4', 'ORG', 87, 65, 4),
+    ('D.Bar Org 5', 'ORG', 87, 65, 5),
+    ('D.Bar Org 6', 'ORG', 87, 65, 6),
+    ('D.Bar Org 7', 'ORG', 87, 65, 7),
+    ('D.Bar Org 8', 'ORG', 87, 65, 8),
+    ('Perc Organ 2', 'ORG', 87, 65, 9),
+    ('X Perc Organ', 'ORG', 87, 65, 10),
+    ("Rhythm'n'B", 'ORG', 87, 65, 11),
+    ('Phono Organ', 'ORG', 87, 65, 12),
+    ('Rochno Org', 'ORG', 87, 65, 13),
+    ('R&B Organ 1', 'ORG', 87, 65, 14),
+    ('R&B Organ 2', 'ORG', 87, 65, 15),
+    ('SuperDistOrg', 'ORG', 87, 65, 16),
+    ('SuperDist Ld', 'ORG', 87, 65, 17),
+    ('Dist Bee', 'ORG', 87, 65, 18),
+    ('LoFi PercOrg', 'ORG', 87, 65, 19),
+    ("60's Org 1", 'ORG', 87, 65, 20),
+    ("60's Org 2", 'ORG', 87, 65, 21),
+    ('Smoky Organ', 'ORG', 87, 65, 22),
+    ('Soap Opera', 'ORG', 87, 65, 23),
+    ('Crummy Organ', 'ORG', 87, 65, 24),
+    ('Aqua Org/Pno', 'ORG', 87, 65, 25),
+    ('Positive Org', 'ORG', 87, 65, 26),
+    ('Chapel Organ', 'ORG', 87, 65, 27),
+    ('Cathedral', 'ORG', 87, 65, 28),
+    ('Grand Pipe', 'ORG', 87, 65, 29),
+    ('Pipe Organ 1', 'ORG', 87, 65, 30),
+    ('Pipe Organ 2', 'ORG', 87, 65, 31),
+    ('Masked Opera', 'ORG', 87, 65, 32),
+    ('Clavi 1', 'KEY', 87, 65, 33),
+    ('Clavi 2', 'KEY', 87, 65, 34),
+    ('Phase Clavi1', 'KEY', 87, 65, 35),
+    ('Phase Clavi2', 'KEY', 87, 65, 36),
+    ('AnalogClavi1', 'KEY', 87, 65, 37),
+    ('Pulse Clavi', 'KEY', 87, 65, 38),
+    ('VintageClavi', 'KEY', 87, 65, 39),
+    ('Cutter Clavi', 'KEY', 87, 65, 40),
+    ('Over-D6', 'KEY', 87, 65, 41),
+    ('Cell Clavi', 'KEY', 87, 65, 42),
+    ('Clavi 3', 'KEY', 87, 65, 43),
+    ('Clavi 4', 'KEY', 87, 65, 44),
+    ('Clavi 5', 'KEY', 87, 65, 45),
+    ('Funky D', 'KEY', 87, 65, 46),
+    ('Funky Line', 'KEY', 87, 65, 47),
+    ('AnalogClavi2', 'KEY', 87, 65, 48),
+    ('PWM Clavi', 'KEY', 87, 65, 49),
+    ('Biting Clavi', 'KEY', 87, 65, 50),
+    ('Reso Clavi', 'KEY', 87, 65, 51),
+    ('BPF Clavi Ph', 'KEY', 87, 65, 52),
+    ('Snappy Clavi', 'KEY', 87, 65, 53),
+    ('Harpsy Clavi', 'KEY', 87, 65, 54),
+    ('JUNO Harpsi', 'KEY', 87, 65, 55),
+    ('Amadeus', 'KEY', 87, 65, 56),
+    ('Music Bells', 'BEL', 87, 65, 57),
+    ('D50Fantasia1', 'BEL', 87, 65, 58),
+    ('D50Fantasia2', 'BEL', 87, 65, 59),
+    ('Frends Bell', 'BEL', 87, 65, 60),
+    ('FM Syn Bell', 'BEL', 87, 65, 61),
+    ('Dreaming Box', 'BEL', 87, 65, 62),
+    ('Himalaya Ice', 'BEL', 87, 65, 63),
+    ('Wine Glass', 'BEL', 87, 65, 64),
+    ('MuBox Pad', 'BEL', 87, 65, 65),
+    ('Pop Bell', 'BEL', 87, 65, 66),
+    ('Candy Bell', 'BEL', 87, 65, 67),
+    ('FM Heaven', 'BEL', 87, 65, 68),
+    ('JUNO Celesta', 'BEL', 87, 65, 69),
+    ('Celesta Trem', 'BEL', 87, 65, 70),
+    ('Glocken', 'BEL', 87, 65, 71),
+    ('Music Box 1', 'BEL', 87, 65, 72),
+    ('Music Box 2', 'BEL', 87, 65, 73),
+    ('Kalimbells', 'BEL', 87, 65, 74),
+    ('JUNO Bell', 'BEL', 87, 65, 75),
+    ('Grained Bell', 'BEL', 87, 65, 76),
+    ('Chime', 'BEL', 87, 65, 77),
+    ('Bell Ring', 'BEL', 87, 65, 78),
+    ('Tubular Bell', 'BEL', 87, 65, 79),
+    ('5th Key', 'BEL', 87, 65, 80),
+    ('Bell Monitor', 'BEL', 87, 65, 81),
+    ('TubyRuesday', 'BEL', 87, 65, 82),
+    ('Step Ice', 'BEL', 87, 65, 83),
+    ('Vibe Trem 1', 'MLT', 87, 65, 84),
+    ('Vibe Trem 2', 'MLT', 87, 65, 85),
+    ('Pure Vibe', 'MLT', 87, 65, 86),
+    ('Ringy Vibes', 'MLT', 87, 65, 87),
+    ('Airie Vibez', 'MLT', 87, 65, 88),
+    ('JUNO Marimba', 'MLT', 87, 65, 89),
+    ('Soft Marimba', 'MLT', 87, 65, 90),
+    ('FM Wood', 'MLT', 87, 65, 91),
+    ('Xylo', 'MLT', 87, 65, 92),
+    ('Ethno Keys', 'MLT', 87, 65, 93),
+    ('Synergy MLT', 'MLT', 87, 65, 94),
+    ('JUNO SteelDr', 'MLT', 87, 65, 95),
+    ('50`SteelDrms', 'MLT', 87, 65, 96),
+    ('Xylosizer', 'MLT', 87, 65, 97),
+    ('AirPluck', 'MLT', 87, 65, 98),
+    ('Toy Box', 'MLT', 87, 65, 99),
+    ('Icy Keys', 'MLT', 87, 65, 100),
+    ('Squeeze Me!', 'ACD', 87, 65, 101),
+    ('Vodkakordion', 'ACD', 87, 65, 102),
+    ('Guinguette', 'ACD', 87, 65, 103),
+    ('JUNO Harm', 'HRM', 87, 65, 104),
+    ('Blues harp', 'HRM', 87, 65, 105),
+    ('Green Bullet', 'HRM', 87, 65, 106),
+    ('JUNO Nylon', 'AGT', 87, 65, 107),
+    ('Comp Stl Gtr', 'AGT', 87, 65, 108),
+    ('Pre Mass Hum', 'AGT', 87, 65, 109),
+    ('Uncle Martin', 'AGT', 87, 65, 110),
+    ('12str Guitar', 'AGT', 87, 65, 111),
+    ('Nylon Gtr', 'AGT', 87, 65, 112),
+    ('SoftNyln Gtr', 'AGT', 87, 65, 113),
+    ('Wet Nyln Gtr', 'AGT', 87, 65, 114),
+    ('Bright Nylon', 'AGT', 87, 65, 115),
+    ('Pure Nylon', 'AGT', 87, 65, 116),
+    ('Nylon Delay', 'AGT', 87, 65, 117),
+    ('Thick Steel', 'AGT', 87, 65, 118),
+    ('Wide Ac Gtr', 'AGT', 87, 65, 119),
+    ('So good !', 'AGT', 87, 65, 120),
+    ('Jazz Guitar1', 'EGT', 87, 65, 121),
+    ('Jazz Guitar2', 'EGT', 87, 65, 122),
+    ('DynoJazz Gtr', 'EGT', 87, 65, 123),
+    ('Clean Gtr 1', 'EGT', 87, 65, 124),
+    ('Clean Gtr 2', 'EGT', 87, 65, 125),
+    ('Pick Gtr', 'EGT', 87, 65, 126),
+    ('Strat Gtr 1', 'EGT', 87, 65, 127),
+    ('Strat Gtr 2', 'EGT', 87, 65, 128),
+    ('Funk Gtr', 'EGT', 87, 66, 1),
+    ("StratSeq'nce", 'EGT', 87, 66, 2),
+    ("Plug n' Gig1", 'EGT', 87, 66, 3),
+    ("Plug n' Gig2", 'EGT', 87, 66, 4),
+    ('Kinda Kurt', 'EGT', 87, 66, 5),
+    ('Nice Oct Gtr', 'EGT', 87, 66, 6),
+    ('Crimson Gtr', 'EGT', 87, 66, 7),
+    ('Plugged!!', 'DGT', 87, 66, 8),
+    ('Punker 1', 'DGT', 87, 66, 9),
+    ("Rockin' Dly", 'DGT', 87, 66, 10),
+    ('Loud Gtr', 'DGT', 87, 66, 11),
+    ('Searing Gtr', 'DGT', 87, 66, 12),
+    ('Searing COSM', 'DGT', 87, 66, 13),
+    ('OctSearingGt', 'DGT', 87, 66, 14),
+    ('Dist.Fingerz', 'DGT', 87, 66, 15),
+    ('Fuzz Gtr', 'DGT', 87, 66, 16),
+    ('Crunch Twin', 'DGT', 87, 66, 17),
+    ('Larsen', 'DGT', 87, 66, 18),
+    ('Trem-o-Vibe', 'DGT', 87, 66, 19),
+    ('Touch Drive', 'DGT', 87, 66, 20),
+    ('Chunk Atk', 'DGT', 87, 66, 21),
+    ('LP Dist', 'DGT', 87, 66, 22),
+    ('Hurtling Gtr', 'DGT', 87, 66, 23),
+    ('Power Chord', 'DGT', 87, 66, 24),
+    ('Punker 2', 'DGT', 87, 66, 25),
+    ('Ac Bass 1', 'BS', 87, 66, 26),
+    ('Ac Bass 2', 'BS', 87, 66, 27),
+    ('Ac Bass 3', 'BS', 87, 66, 28),
+    ('Ulti Ac Bass', 'BS', 87, 66, 29),
+    ('Downright Bs', 'BS', 87, 66, 30),
+    ("Cmp'd Fng Bs", 'BS', 87, 66, 31),
+    ('FingerMaster', 'BS', 87, 66, 32),
+    ('Return2Base!', 'BS', 87, 66, 33),
+    ('Finger Bs 1', 'BS', 87, 66, 34),
+    ('Finger Bs 2', 'BS', 87, 66, 35),
+    ('Finger Bs 3', 'BS', 87, 66, 36),
+    ('Fretless Bs1', 'BS', 87, 66, 37),
+    ('Fretless Bs2', 'BS', 87, 66, 38),
+    ('Fretless Bs3', 'BS', 87, 66, 39),
+    ('RichFretless', 'BS', 87, 66, 40),
+    ('NewAge Frtls', 'BS', 87, 66, 41),
+    ('P-Bass', 'BS', 87, 66, 42),
+    ('Roomy Bass', 'BS', 87, 66, 43),
+    ('All Round Bs', 'BS', 87, 66, 44),
+    ('Pick Bass 1', 'BS', 87, 66, 45),
+    ('Pick Bass 2', 'BS', 87, 66, 46),
+    ('Thumb Up!', 'BS', 87, 66, 47),
+    ('Tubby Mute', 'BS', 87, 66, 48),
+    ('Chicken Bass', 'BS', 87, 66, 49),
+    ('Snug Bass', 'BS', 87, 66, 50),
+    ('Chorus Bass', 'BS', 87, 66, 51),
+    ('A Big Pick', 'BS', 87, 66, 52),
+    ('Slap Bass', 'BS', 87, 66, 53),
+    ('Slap w/Fx', 'BS', 87, 66, 54),
+    ('Basement', 'BS', 87, 66, 55),
+    ('Low Bass', 'SBS', 87, 66, 56),
+    ('Foundation', 'SBS', 87, 66, 57),
+    ('SH Sawtooth', 'SBS', 87, 66, 58),
+    ('Fat RubberBs', 'SBS', 87, 66, 59),
+    ('Garage Bass1', 'SBS', 87, 66, 60),
+    ('Reso SynBs 1', 'SBS', 87, 66, 61),
+    ('TB Dist Bs', 'SBS', 87, 66, 62),
+    ('JUNO Acid Bs', 'SBS', 87, 66, 63),
+    ('Monster Bass', 'SBS', 87, 66, 64),
+    ('Oil Can Bass', 'SBS', 87, 66, 65),
+    ('Pedal Syn Bs', 'SBS', 87, 66, 66),
+    ('Big Mini 1', 'SBS', 87, 66, 67),
+    ('Big Mini 2', 'SBS', 87, 66, 68),
+    ('SH-2 Bs', 'SBS', 87, 66, 69),
+    ('SH-101 Bs 1', 'SBS', 87, 66, 70),
+    ('R&B Bass 1', 'SBS', 87, 66, 71),
+    ('R&B Bass 2', 'SBS', 87, 66, 72),
+    ('R&B Bass 3', 'SBS', 87, 66, 73),
+    ('Moogy Bass 1', 'SBS', 87, 66, 74),
+    ('Moogy Bass 2', 'SBS', 87, 66, 75),
+    ('JUNO Reso', 'SBS', 87, 66, 76),
+    ('Alpha SynBs1', 'SBS', 87, 66, 77),
+    ('Alpha SynBs2', 'SBS', 87, 66, 78),
+    ('SH Square', 'SBS', 87, 66, 79),
+    ('Pedal Square', 'SBS', 87, 66, 80),
+    ('Doze Bass 1', 'SBS', 87, 66, 81),
+    ('VirtualRnBs1', 'SBS', 87, 66, 82),
+    ('Saw&MG Bass1', 'SBS', 87, 66, 83),
+    ('Square Bass', 'SBS', 87, 66, 84),
+    ('Bs MG', 'SBS', 87, 66, 85),
+    ('Bs Reso', 'SBS', 87, 66, 86),
+    ('Bs SH', 'SBS', 87, 66, 87),
+    ('Bs TB', 'SBS', 87, 66, 88),
+    ('Bs MC', 'SBS', 87, 66, 89),
+    ('Bs Pedal', 'SBS', 87, 66, 90),
+    ('Bs Release', 'SBS', 87, 66, 91),
+    ('Bs Cheeze', 'SBS', 87, 66, 92),
+    ('Mini Like!', 'SBS', 87, 66, 93),
+    ('MC-404 Bass', 'SBS', 87, 66, 94),
+    ('Soft SynBass', 'SBS', 87, 66, 95),
+    ('JUNO-106 Bs', 'SBS', 87, 66, 96),
+    ('Smooth Bass', 'SBS', 87, 66, 97),
+    ('Flat Bass', 'SBS', 87, 66, 98),
+    ('Punch MG 2', 'SBS', 87, 66, 99),
+    ('Electro Rubb', 'SBS', 87, 66, 100),
+    ('R&B Bass 4', 'SBS', 87, 66, 101),
+    ('Enorjizor', 'SBS', 87, 66, 102),
+    ('LowFat Bass', 'SBS', 87, 66, 103),
+    ('Doze Bass 2', 'SBS', 87, 66, 104),
+    ('DCO Bass', 'SBS', 87, 66, 105),
+    ('VirtualRnBs2', 'SBS', 87, 66, 106),
+    ('Saw&MG Bass2', 'SBS', 87, 66, 107),
+    ('MG+SubOsc Bs', 'SBS', 87, 66, 108),
+    ('R&B Bass 5', 'SBS', 87, 66, 109),
+    ('R&B Bass 6', 'SBS', 87, 66, 110),
+    ('Not a Bass', 'SBS', 87, 66, 111),
+    ('Reso SynBs 2', 'SBS', 87, 66, 112),
+    ('SH-1 Bass', 'SBS', 87, 66, 113),
+    ('SH-101 Bs 2', 'SBS', 87, 66, 114),
+    ('Punch MG 1', 'SBS', 87, 66, 115),
+    ('MKS-50 SynBs', 'SBS', 87, 66, 116),
+    ('Gashed Bass', 'SBS', 87, 66, 117),
+    ('Q Bass', 'SBS', 87, 66, 118),
+    ('Super-G DX', 'SBS', 87, 66, 119),
+    ("Kickin' Bass", 'SBS', 87, 66, 120),
+    ('OilDrum Bass', 'SBS', 87, 66, 121),
+    ('Dust Bass', 'SBS', 87, 66, 122),
+    ('Glide-iator', 'SBS', 87, 66, 123),
+    ('Acid Punch', 'SBS', 87, 66, 124),
+    ('Unison Bass', 'SBS', 87, 66, 125),
+    ('Detune Bass', 'SBS', 87, 66, 126),
+    ('Lo Bass', 'SBS', 87, 66, 127),
+    ('Garage Bass2', 'SBS', 87, 66, 128),
+    ('Sub Sonic', 'SBS', 87, 67, 1),
+    ('Jungle Bass', 'SBS', 87, 67, 2),
+    ('R&B Bass 7', 'SBS', 87, 67, 3),
+    ('Simply Basic', 'SBS', 87, 67, 4),
+    ('Beepin Bass', 'SBS', 87, 67, 5),
+    ('MC-TB Bass', 'SBS', 87, 67, 6),
+    ('Acdg Bass', 'SBS', 87, 67, 7),
+    ('Loco Voco', 'SBS', 87, 67, 8),
+    ('Unplug it!', 'SBS', 87, 67, 9),
+    ('S&H Bass', 'SBS', 87, 67, 10),
+    ('Destroyed Bs', 'SBS', 87, 67, 11),
+    ('Lo-Fi TB', 'SBS', 87, 67, 12),
+    ('Drop Bass', 'SBS', 87, 67, 13),
+    ('Big Mini 3', 'SBS', 87, 67, 14),
+    ('Muffled MG', 'SBS', 87, 67, 15),
+    ('Intrusive Bs', 'SBS', 87, 67, 16),
+    ('Alpha SynBs3', 'SBS', 87, 67, 17),
+    ('TransistorBs', 'SBS', 87, 67, 18),
+    ('JUNO-60 Bass', 'SBS', 87, 67, 19),
+    ('Storm Bass', 'SBS', 87, 67, 20),
+    ('Alpha ResoBs', 'SBS', 87, 67, 21),
+    ('SH-101 Vibe', 'SBS', 87, 67, 22),
+    ('Fazee Bass', 'SBS', 87, 67, 23),
+    ('Hi-Energy Bs', 'SBS', 87, 67, 24),
+    ('Low Nz Bass', 'SBS', 87, 67, 25),
+    ('String Ens', 'STR', 87, 67, 26),
+    ('JUNO Strings', 'STR', 87, 67, 27),
+    ('Chamber Str1', 'STR', 87, 67, 28),
+    ('Chamber Str2', 'STR', 87, 67, 29),
+    ('Staccato', 'STR', 87, 67, 30),
+    ('Pizzicato', 'STR', 87, 67, 31),
+    ('Pizz/Stacc', 'STR', 87, 67, 32),
+    ('Sahara Str', 'STR', 87, 67, 33),
+    ('Random Mood', 'STR', 87, 67, 34),
+    ('X Hall Str', 'STR', 87, 67, 35),
+    ('DelayQuartet', 'STR', 87, 67, 36),
+    ('Pop Str 1', 'STR', 87, 67, 37),
+    ('Pop Str 2', 'STR', 87, 67, 38),
+    ('Pop Str 3', 'STR', 87, 67, 39),
+    ('WhiteStrings', 'STR', 87, 67, 40),
+    ('JV Strings', 'STR', 87, 67, 41),
+    ('Marcato', 'STR', 87, 67, 42),
+    ('Strings 1', 'STR', 87, 67, 43),
+    ('Strings 2', 'STR', 87, 67, 44),
+    ('Stringz 101', 'STR', 87, 67, 45),
+    ('Crossed Bows', 'STR', 87, 67, 46),
+    ('Small Str', 'STR', 87, 67, 47),
+    ('Warm Strings', 'STR', 87, 67, 48),
+    ('DynaStrSect1', 'STR', 87, 67, 49),
+    ('DynaStrSect2', 'STR', 87, 67, 50),
+    ('Full Strings', 'STR', 87, 67, 51),
+    ('X StrSection', 'STR', 87, 67, 52),
+    ('Oct Strings', 'STR', 87, 67, 53),
+    ('Strings 3', 'STR', 87, 67, 54),
+    ('Monkey Str', 'STR', 87, 67, 55),
+    ('Hybrid Str 1', 'STR', 87, 67, 56),
+    ('Hybrid Str 2', 'STR', 87, 67, 57),
+    ('Biggie Bows', 'STR', 87, 67, 58),
+    ('Str Stacc mp', 'STR', 87, 67, 59),
+    ('So Staccato', 'STR', 87, 67, 60),
+    ('Long/Stacc', 'STR', 87, 67, 61),
+    ('Pizz/Long', 'STR', 87, 67, 62),
+    ('Vls PizzHall', 'STR', 87, 67, 63),
+    ('DelicatePizz', 'STR', 87, 67, 64),
+    ('Orch Pizz', 'STR', 87, 67, 65),
+    ('BrightViolin', 'STR', 87, 67, 66),
+    ('Bright Cello', 'STR', 87, 67, 67),
+    ('Gang Strangs', 'STR', 87, 67, 68),
+    ('Clustered!?!', 'STR', 87, 67, 69),
+    ('Movie Scene', 'STR', 87, 67, 70),
+    ('Mellow Tron', 'STR', 87, 67, 71),
+    ('Tronic Str', 'STR', 87, 67, 72),
+    ('Wind & Str 1', 'ORC', 87, 67, 73),
+    ('Wind & Str 2', 'ORC', 87, 67, 74),
+    ('Farewell', 'ORC', 87, 67, 75),
+    ('Orch & Horns', 'ORC', 87, 67, 76),
+    ('Soft Orch 1', 'ORC', 87, 67, 77),
+    ('Soft Orch 2', 'ORC', 87, 67, 78),
+    ('Henry IX', 'ORC', 87, 67, 79),
+    ('Ending Scene', 'ORC', 87, 67, 80),
+    ('Symphonika', 'ORC', 87, 67, 81),
+    ('Cheezy Movie', 'HIT', 87, 67, 82),
+    ('Philly Hit', 'HIT', 87, 67, 83),
+    ('Smear Hit 1', 'HIT', 87, 67, 84),
+    ('Smear Hit 2', 'HIT', 87, 67, 85),
+    ('Good Old Hit', 'HIT', 87, 67, 86),
+    ('Mix Hit 1', 'HIT', 87, 67, 87),
+    ('Mix Hit 2', 'HIT', 87, 67, 88),
+    ('Lo-Fi Hit', 'HIT', 87, 67, 89),
+    ('2ble Action', 'HIT', 87, 67, 90),
+    ('In da Cave', 'HIT', 87, 67, 91),
+    ('Housechord', 'HIT', 87, 67, 92),
+    ('Mod Chord', 'HIT', 87, 67, 93),
+    ('Dance Steam', 'HIT', 87, 67, 94),
+    ('Bright Brass', 'BRS', 87, 67, 95),
+    ('BreakOut Brs', 'BRS', 87, 67, 96),
+    ('StackTp Sect', 'BRS', 87, 67, 97),
+    ('Tb Section', 'BRS', 87, 67, 98),
+    ('TpTb Sect.', 'BRS', 87, 67, 99),
+    ('Brass Sect 1', 'BRS', 87, 67, 100),
+    ('Brass Sect 2', 'BRS', 87, 67, 101),
+    ('Brass & Sax', 'BRS', 87, 67, 102),
+    ('Simple Tutti', 'BRS', 87, 67, 103),
+    ('Tpts & Tmbs', 'BRS', 87, 67, 104),
+    ('BrassPartOut', 'BRS', 87, 67, 105),
+    ('Full sForza', 'BRS', 87, 67, 106),
+    ('Stereo Brass', 'BRS', 87, 67, 107),
+    ('F.Horns Sect', 'BRS', 87, 67, 108),
+    ('Solo Tp', 'BRS', 87, 67, 109),
+    ('Ambi Tp', 'BRS', 87, 67, 110),
+    ('Horn Chops', 'BRS', 87, 67, 111),
+    ('Mute Tp', 'BRS', 87, 67, 112),
+    ('Harmon Mute', 'BRS', 87, 67, 113),
+    ('Soft Tb', 'BRS', 87, 67, 114),
+    ('Solo Tb', 'BRS', 87, 67, 115),
+    ('Solo Bone', 'BRS', 87, 67, 116),
+    ('Flugel Horn', 'BRS', 87, 67, 117),
+    ('Spit Flugel', 'BRS', 87, 67, 118),
+    ('XP Horn', 'BRS', 87, 67, 119),
+    ('Grande Tuba', 'BRS', 87, 67, 120),
+    ('JUNO Tuba', 'BRS', 87, 67, 121),
+    ('80s Brass 1', 'SBR', 87, 67, 122),
+    ('Wide Syn Brs', 'SBR', 87, 67, 123),
+    ('Poly Brass', 'SBR', 87, 67, 124),
+    ('JP8000 Brass', 'SBR', 87, 67, 125),
+    ('JUNO Brass', 'SBR', 87, 67, 126),
+    ('DetuneSawBrs', 'SBR', 87, 67, 127),
+    ('J-Pop Brass', 'SBR', 87, 67, 128),
+    ('80s Brass 2', 'SBR', 87, 68, 1),
+    ('80s Brass 3', 'SBR', 87, 68, 2),
+    ('80s Brass 4', 'SBR', 87, 68, 3),
+    ('80s Brass 5', 'SBR', 87, 68, 4),
+    ('Ana Brass', 'SBR', 87, 68, 5),
+    ('Soft Brass', 'SBR', 87, 68, 6),
+    ('Ox Brass', 'SBR', 87, 68, 7),
+    ('Syn Brass 1', 'SBR', 87, 68, 8),
+    ('Syn Brass 2', 'SBR', 87, 68, 9),
+    ('Xpand Brass1', 'SBR', 87, 68, 10),
+    ('Xpand Brass2', 'SBR', 87, 68, 11),
+    ('Super Saw', 'SBR', 87, 68, 12),
+    ('SoftSynBrass', 'SBR', 87, 68, 13),
+    ('Windy Synth', 'SBR', 87, 68, 14),
+    ('Silky JP', 'SBR', 87, 68, 15),
+    ('Silk Brs Pad', 'SBR', 87, 68, 16),
+    ('X-Saw Brass', 'SBR', 87, 68, 17),
+    ('Cheesy Brass', 'SBR', 87, 68, 18),
+    ('Dual Saw Brs', 'SBR', 87, 68, 19),
+    ('JUNO-106 Brs', 'SBR', 87, 68, 20),
+    ('BreakOut Key', 'SBR', 87, 68, 21),
+    ('Stacked Brs', 'SBR', 87, 68, 22),
+    ('Sax Sect. 1', 'SAX', 87, 68, 23),
+    ('Sax Sect. 2', 'SAX', 87, 68, 24),
+    ('Horny Sax', 'SAX', 87, 68, 25),
+    ('JUNO Sop Sax', 'SAX', 87, 68, 26),
+    ('Solo Sop Sax', 'SAX', 87, 68, 27),
+    ('JUNO AltoSax', 'SAX', 87, 68, 28),
+    ('AltoLead Sax', 'SAX', 87, 68, 29),
+    ('FXM Alto Sax', 'SAX', 87, 68, 30),
+    ('XP TnrBrethy', 'SAX', 87, 68, 31),
+    ('JUNO Tnr Sax', 'SAX', 87, 68, 32),
+    ('Fat TenorSax', 'SAX', 87, 68, 33),
+    ('JUNO BariSax', 'SAX', 87, 68, 34),
+    ('JUNO Flute', 'FLT', 87, 68, 35),
+    ('JUNO Piccolo', 'FLT', 87, 68, 36),
+    ('Clarence.net', 'WND', 87, 68, 37),
+    ('JUNO Oboe', 'WND', 87, 68, 38),
+    ('JUNO E.Horn', 'WND', 87, 68, 39),
+    ('JUNO Bassoon', 'WND', 87, 68, 40),
+    ('Good Old Day', 'WND', 87, 68, 41),
+    ('WindWood', 'WND', 87, 68, 42),
+    ('Porta Lead 1', 'HLD', 87, 68, 43),
+    ('Porta Lead 2', 'HLD', 87, 68, 44),
+    ('Solo Saw Ld', 'HLD', 87, 68, 45),
+    ('Wind Syn Ld', 'HLD', 87, 68, 46),
+    ('GR Lead 1', 'HLD', 87, 68, 47),
+    ('Sync Lead', 'HLD', 87, 68, 48),
+    ('JupiterLead1', 'HLD', 87, 68, 49),
+    ('Alpha Spit 1', 'HLD', 87, 68, 50),
+    ('Pro Fat Ld', 'HLD', 87, 68, 51),
+    ('Saw Lead 1', 'HLD', 87, 68, 52),
+    ('Saw Lead 2', 'HLD', 87, 68, 53),
+    ('Saw Lead 3', 'HLD', 87, 68, 54),
+    ('Saw Lead 4', 'HLD', 87, 68, 55),
+    ('Saw Lead 5', 'HLD', 87, 68, 56),
+    ('Saw Lead 6', 'HLD', 87, 68, 57),
+    ('JUNO Lead', 'HLD', 87, 68, 58),
+    ('Jump Poly', 'HLD', 87, 68, 59),
+    ('Octa Juice', 'HLD', 87, 68, 60),
+    ('Octa Saw', 'HLD', 87, 68, 61),
+    ('Octa Sync 1', 'HLD', 87, 68, 62),
+    ('Octa Sync 2', 'HLD', 87, 68, 63),
+    ('Hot Sync', 'HLD', 87, 68, 64),
+    ('Hot Coffee', 'HLD', 87, 68, 65),
+    ('Phase Lead', 'HLD', 87, 68, 66),
+    ('Waspy Lead 1', 'HLD', 87, 68, 67),
+    ('Follow Me 1', 'HLD', 87, 68, 68),
+    ('Follow Me 2', 'HLD', 87, 68, 69),
+    ('Classic Ld 1', 'HLD', 87, 68, 70),
+    ('Classic Ld 2', 'HLD', 87, 68, 71),
+    ('Digi Lead 1', 'HLD', 87, 68, 72),
+    ('Digi Lead 2', 'HLD', 87, 68, 73),
+    ('DC Triangle', 'HLD', 87, 68, 74),
+    ('Sqr-Seqence', 'HLD', 87, 68, 75),
+    ('Pure Square', 'HLD', 87, 68, 76),
+    ('Griggley', 'HLD', 87, 68, 77),
+    ('Legato Saw', 'HLD', 87, 68, 78),
+    ('Dual Profs', 'HLD', 87, 68, 79),
+    ('Gwyo Press', 'HLD', 87, 68, 80),
+    ('Q DualSaws', 'HLD', 87, 68, 81),
+    ('Mogulator Ld', 'HLD', 87, 68, 82),
+    ('DirtyVoltage', 'HLD', 87, 68, 83),
+    ('Clean?', 'HLD', 87, 68, 84),
+    ('Distortion', 'HLD', 87, 68, 85),
+    ('Syn Lead 1', 'HLD', 87, 68, 86),
+    ('Syn Lead 2', 'HLD', 87, 68, 87),
+    ('X-Sink Delay', 'HLD', 87, 68, 88),
+    ('Destroyed Ld', 'HLD', 87, 68, 89),
+    ('Synchro Lead', 'HLD', 87, 68, 90),
+    ('Sync Tank', 'HLD', 87, 68, 91),
+    ('Sync Ld Mono', 'HLD', 87, 68, 92),
+    ('SyncModulate', 'HLD', 87, 68, 93),
+    ('2krazy Brite', 'HLD', 87, 68, 94),
+    ('Distorted MG', 'HLD', 87, 68, 95),
+    ('Dist Lead', 'HLD', 87, 68, 96),
+    ('Ringmod Lead', 'HLD', 87, 68, 97),
+    ('BodyElectric', 'HLD', 87, 68, 98),
+    ('SonicVampire', 'HLD', 87, 68, 99),
+    ('Stimulation', 'HLD', 87, 68, 100),
+    ('Wire Sync', 'HLD', 87, 68, 101),
+    ('Epic Lead', 'HLD', 87, 68, 102),
+    ('Bag Lead', 'HLD', 87, 68, 103),
+    ('Wezcoast', 'HLD', 87, 68, 104),
+    ('HyperJupiter', 'HLD', 87, 68, 105),
+    ('Vintagolizer', 'HLD', 87, 68, 106),
+    ('C64 Lead', 'HLD', 87, 68, 107),
+    ('303 NRG', 'HLD', 87, 68, 108),
+    ('Feat Lead', 'HLD', 87, 68, 109),
+    ('Cell SquLead', 'SLD', 87, 68, 110),
+    ('Theramax 1', 'SLD', 87, 68, 111),
+    ('Pulse Lead 1', 'SLD', 87, 68, 112),
+    ('Pulse Lead 2', 'SLD', 87, 68, 113),
+    ('Mid Saw Ld', 'SLD', 87, 68, 114),
+    ('On Air', 'SLD', 87, 68, 115),
+    ('Tri Lead 1', 'SLD', 87, 68, 116),
+    ('Tri Lead 2', 'SLD', 87, 68, 117),
+    ('Sine Lead 1', 'SLD', 87, 68, 118),
+    ('Sine Lead 2', 'SLD', 87, 68, 119),
+    ('Sqr Lead 1', 'SLD', 87, 68, 120),
+    ('Sqr Lead 2', 'SLD', 87, 68, 121),
+    ('SH Sqr Lead', 'SLD', 87, 68, 122),
+    ('Sinetific', 'SLD', 87, 68, 123),
+    ('JUNO Soft Ld', 'SLD', 87, 68, 124),
+    ('Spooky Lead', 'SLD', 87, 68, 125),
+    ('PeakArpSine', 'SLD', 87, 68, 126),
+    ('Howards Lead', 'SLD', 87, 68, 127),
+    ('SoloNzPeaker', 'SLD', 87, 68, 128),
+    ('R&B Tri Ld 1', 'SLD', 87, 69, 1),
+    ('R&B Tri Ld 2', 'SLD', 87, 69, 2),
+    ('JupiterLead2', 'SLD', 87, 69, 3),
+    ('JupiterLead3', 'SLD', 87, 69, 4),
+    ('Dig-n-Duke', 'SLD', 87, 69, 5),
+    ('Sqr Diamond', 'SLD', 87, 69, 6),
+    ('Soft Lead', 'SLD', 87, 69, 7),
+    ('Soft Saw Ld', 'SLD', 87, 69, 8),
+    ('X-Pulse Lead', 'SLD', 87, 69, 9),
+    ('Mild 2-SawLd', 'SLD', 87, 69, 10),
+    ('Mew Lead', 'SLD', 87, 69, 11),
+    ('Shy Soloist', 'SLD', 87, 69, 12),
+    ('Theramax 2', 'SLD', 87, 69, 13),
+    ('Therasqu', 'SLD', 87, 69, 14),
+    ('GR Lead 2', 'SLD', 87, 69, 15),
+    ('SH-2 Lead', 'SLD', 87, 69, 16),
+    ('Jucy Saw', 'SLD', 87, 69, 17),
+    ('Reso Lead', 'SLD', 87, 69, 18),
+    ('Modulated Ld', 'SLD', 87, 69, 19),
+    ('Synthi Fizz', 'SLD', 87, 69, 20),
+    ('Waspy Lead 2', 'SLD', 87, 69, 21),
+    ('Pulstar Ld', 'SLD', 87, 69, 22),
+    ('Naked Lead', 'SLD', 87, 69, 23),
+    ('Alpha Spit 2', 'SLD', 87, 69, 24),
+    ('JP Saw Lead', 'SLD', 87, 69, 25),
+    ('Violin Lead', 'SLD', 87, 69, 26),
+    ('Mod Lead', 'SLD', 87, 69, 27),
+    ('Tristar', 'SLD', 87, 69, 28),
+    ('Chubby Lead', 'SLD', 87, 69, 29),
+    ('Sneaky Leady', 'SLD', 87, 69, 30),
+    ('Shaku Lead', 'SLD', 87, 69, 31),
+    ('Legato Tkno', 'SLD', 87, 69, 32),
+    ('Reso Saw Ld', 'SLD', 87, 69, 33),
+    ('SliCed Lead', 'SLD', 87, 69, 34),
+    ('Mini Growl', 'SLD', 87, 69, 35),
+    ('Evangelized', 'SLD', 87, 69, 36),
+    ('Air Lead', 'SLD', 87, 69, 37),
+    ('Stacc Heaven', 'SYN', 87, 69, 38),
+    ('Sugar Synth', 'SYN', 87, 69, 39),
+    ('Synth Key', 'SYN', 87, 69, 40),
+    ('Frontier Syn', 'SYN', 87, 69, 41),
+    ('Summer Str', 'SYN', 87, 69, 42),
+    ('JUNO Poly', 'SYN', 87, 69, 43),
+    ('SuperSawSlow', 'SYN', 87, 69, 44),
+    ('Cue Tip', 'SYN', 87, 69, 45),
+    ('Waspy Synth', 'SYN', 87, 69, 46),
+    ('Europe Xpres', 'SYN', 87, 69, 47),
+    ('Squeepy', 'SYN', 87, 69, 48),
+    ('DOC Stack', 'SYN', 87, 69, 49),
+    ('Sweep Lead', 'SYN', 87, 69, 50),
+    ('80s Saws 1', 'SYN', 87, 69, 51),
+    ('80s Saws 2', 'SYN', 87, 69, 52),
+    ('80s Saws 3', 'SYN', 87, 69, 53),
+    ('Digitaless', 'SYN', 87, 69, 54),
+    ('Flip Pad', 'SYN', 87, 69, 55),
+    ('Short Detune', 'SYN', 87, 69, 56),
+    ('forSequence', 'SYN', 87, 69, 57),
+    ('Memory Pluck', 'SYN', 87, 69, 58),
+    ('Metalic Bass', 'SYN', 87, 69, 59),
+    ('Aqua', 'SYN', 87, 69, 60),
+    ('Round SQR', 'SYN', 87, 69, 61),
+    ('Big Planet', 'SYN', 87, 69, 62),
+    ('Wet Atax', 'SYN', 87, 69, 63),
+    ('Houze Clavi', 'SYN', 87, 69, 64),
+    ('Saw Stack', 'SYN', 87, 69, 65),
+    ('Frgile Saws', 'SYN', 87, 69, 66),
+    ('Steamed Sawz', 'SYN', 87, 69, 67),
+    ('RAVtune', 'SYN', 87, 69, 68),
+    ('Bustranza', 'SYN', 87, 69, 69),
+    ('Digi Saw Syn', 'SYN', 87, 69, 70),
+    ('JP OctAttack', 'SYN', 87, 69, 71),
+    ('Oct Unison', 'SYN', 87, 69, 72),
+    ('Xtatic', 'SYN', 87, 69, 73),
+    ('Dirty Combo', 'SYN', 87, 69, 74),
+    ("FM's Attack", 'SYN', 87, 69, 75),
+    ('Digi-vox Syn', 'SYN', 87, 69, 76),
+    ('Fairy Factor', 'SYN', 87, 69, 77),
+    ('Tempest', 'SYN', 87, 69, 78),
+    ('X-Racer', 'SYN', 87, 69, 79),
+    ('TB Booster', 'SYN', 87, 69, 80),
+    ('Syn-Orch/Mod', 'SYN', 87, 69, 81),
+    ('Pressyn', 'SYN', 87, 69, 82),
+    ('High Five', 'SYN', 87, 69, 83),
+    ('Magnetic 5th', 'SYN', 87, 69, 84),
+    ('DigimaX', 'SYN', 87, 69, 85),
+    ('Exhale', 'SYN', 87, 69, 86),
+    ('X-panda', 'SYN', 87, 69, 87),
+    ('Saw Keystep', 'SYN', 87, 69, 88),
+    ('Blue Meanie', 'SYN', 87, 69, 89),
+    ('4mant Cycle', 'SYN', 87, 69, 90),
+    ('Modular', 'SYN', 87, 69, 91),
+    ('Analog Dream', 'SYN', 87, 69, 92),
+    ('DCO Bell Pad', 'SYN', 87, 69, 93),
+    ('Cell Fanta', 'SYN', 87, 69, 94),
+    ('JUNO 5th', 'SYN', 87, 69, 95),
+    ('DoubleBubble', 'SYN', 87, 69, 96),
+    ('JUNO-D Maj7', 'TEK', 87, 69, 97),
+    ('Sweet House', 'TEK', 87, 69, 98),
+    ('Periscope', 'TEK', 87, 69, 99),
+    ('5th Voice', 'TEK', 87, 69, 100),
+    ('HPF Sweep', 'TEK', 87, 69, 101),
+    ('BPF Saw', 'TEK', 87, 69, 102),
+    ('Moon Synth', 'TEK', 87, 69, 103),
+    ('DelyResoSaws', 'TEK', 87, 69, 104),
+    ('JUNO Trance1', 'TEK', 87, 69, 105),
+    ('Trancy Synth', 'TEK', 87, 69, 106),
+    ('Cell Trance', 'TEK', 87, 69, 107),
+    ('Trancy X', 'TEK', 87, 69, 108),
+    ('JUNO Trance2', 'TEK', 87, 69, 109),
+    ('R-Trance', 'TEK', 87, 69, 110),
+    ('Braatz...', 'TEK', 87, 69, 111),
+    ('AllinOneRiff', 'TEK', 87, 69, 112),
+    ('YZ Again', 'TEK', 87, 69, 113),
+    ('Flazzy Lead', 'TEK', 87, 69, 114),
+    ('Coffee Bee', 'TEK', 87, 69, 115),
+    ('TB-Sequence', 'TEK', 87, 69, 116),
+    ('SC-303', 'TEK', 87, 69, 117),
+    ('Dance Saws', 'TEK', 87, 69, 118),
+    ('AluminmWires', 'TEK', 87, 69, 119),
+    ('Fred&Barney', 'TEK', 87, 69, 120),
+    ('Electrostars', 'TEK', 87, 69, 121),
+    ('LoFiSequence', 'TEK', 87, 69, 122),
+    ('MelodicDrums', 'TEK', 87, 69, 123),
+    ('Monkey Arpg', 'TEK', 87, 69, 124),
+    ('TB Wah', 'TEK', 87, 69, 125),
+    ('Waving TB303', 'TEK', 87, 69, 126),
+    ('Digi Seq', 'TEK', 87, 69, 127),
+    ('Seq Saw', 'TEK', 87, 69, 128),
+    ('Reso Seq Saw', 'TEK', 87, 70, 1),
+    ('DetuneSeqSaw', 'TEK', 87, 70, 2),
+    ('Technotribe', 'TEK', 87, 70, 3),
+    ('Teethy Grit', 'TEK', 87, 70, 4),
+    ('Repertition', 'TEK', 87, 70, 5),
+    ('Killerbeez', 'TEK', 87, 70, 6),
+    ('Acid Lead', 'TEK', 87, 70, 7),
+    ('Tranceformer', 'TEK', 87, 70, 8),
+    ('Anadroid', 'TEK', 87, 70, 9),
+    ('Shroomy', 'TEK', 87, 70, 10),
+    ('Noize R us', 'TEK', 87, 70, 11),
+    ('Beep Melodie', 'TEK', 87, 70, 12),
+    ('Morpher', 'TEK', 87, 70, 13),
+    ('Power Synth', 'TEK', 87, 70, 14),
+    ('Hoover Again', 'TEK', 87, 70, 15),
+    ('Alpha Said..', 'TEK', 87, 70, 16),
+    ('Ravers Awake', 'TEK', 87, 70, 17),
+    ('Tekno Gargle', 'TEK', 87, 70, 18),
+    ('Tranceiver', 'TEK', 87, 70, 19),
+    ('Techno Dream', 'TEK', 87, 70, 20),
+    ('Techno Pizz', 'TEK', 87, 70, 21),
+    ('VirtualHuman', 'PLS', 87, 70, 22),
+    ('Strobot', 'PLS', 87, 70, 23),
+    ('Strobe', 'PLS', 87, 70, 24),
+    ('Strobe X', 'PLS', 87, 70, 25),
+    ('Mr. Fourier', 'PLS', 87, 70, 26),
+    ('Rhythmic 5th', 'PLS', 87, 70, 27),
+    ('Sorry4theDLY', 'PLS', 87, 70, 28),
+    ('Cell Pad', 'PLS', 87, 70, 29),
+    ('Shape of X', 'PLS', 87, 70, 30),
+    ('ShapeURMusic', 'PLS', 87, 70, 31),
+    ('Synth Force', 'PLS', 87, 70, 32),
+    ('Trance Split', 'PLS', 87, 70, 33),
+    ('Step Trance', 'PLS', 87, 70, 34),
+    ('Chop Synth', 'PLS', 87, 70, 35),
+    ('Euro Teuro', 'PLS', 87, 70, 36),
+    ('Auto Trance1', 'PLS', 87, 70, 37),
+    ('Eureggae', 'PLS', 87, 70, 38),
+    ('Beat Pad', 'PLS', 87, 70, 39),
+    ('TMT Seq Pad', 'PLS', 87, 70, 40),
+    ('ForYourBreak', 'PLS', 87, 70, 41),
+    ('HPF Slicer', 'PLS', 87, 70, 42),
+    ('Sliced Choir', 'PLS', 87, 70, 43),
+    ('Digi-Doo', 'PLS', 87, 70, 44),
+    ('PanningFrmnt', 'PLS', 87, 70, 45),
+    ('Dirty Beat', 'PLS', 87, 70, 46),
+    ('Electrons', 'PLS', 87, 70, 47),
+    ('Protons', 'PLS', 87, 70, 48),
+    ('Brisk Vortex', 'PLS', 87, 70, 49),
+    ('Throbulax', 'PLS', 87, 70, 50),
+    ('Lonizer', 'PLS', 87, 70, 51),
+    ('diGital Pad', 'PLS', 87, 70, 52),
+    ('StepPitShift', 'PLS', 87, 70, 53),
+    ('Pad Pulses', 'PLS', 87, 70, 54),
+    ('Seq-Pad 1', 'PLS', 87, 70, 55),
+    ('DSP Chaos', 'PLS', 87, 70, 56),
+    ('Dance floor', 'PLS', 87, 70, 57),
+    ('Minor Thirds', 'PLS', 87, 70, 58),
+    ('FX World', 'PLS', 87, 70, 59),
+    ('Nu Trance X', 'PLS', 87, 70, 60),
+    ('Auto 5thSaws', 'PLS', 87, 70, 61),
+    ('Cross Talk', 'PLS', 87, 70, 62),
+    ('Reanimation', 'PLS', 87, 70, 63),
+    ('VoX Chopper', 'PLS', 87, 70, 64),
+    ("Trevor's Pad", 'PLS', 87, 70, 65),
+    ('Fantomas Pad', 'PLS', 87, 70, 66),
+    ('Jazzy Arps', 'PLS', 87, 70, 67),
+    ('Keep Running', 'PLS', 87, 70, 68),
+    ('Step In', 'PLS', 87, 70, 69),
+    ('Echo Echo', 'PLS', 87, 70, 70),
+    ('Keep going', 'PLS', 87, 70, 71),
+    ('Arposphere', 'PLS', 87, 70, 72),
+    ('Voco Riff', 'PLS', 87, 70, 73),
+    ('Pulsator', 'PLS', 87, 70, 74),
+    ('Motion Bass', 'PLS', 87, 70, 75),
+    ('Sine Magic', 'PLS', 87, 70, 76),
+    ('JUNO-D Slice', 'PLS', 87, 70, 77),
+    ('Pulsatron', 'PLS', 87, 70, 78),
+    ('Mega Sync', 'PLS', 87, 70, 79),
+    ('Passing by', 'FX', 87, 70, 80),
+    ('Lazer Points', 'FX', 87, 70, 81),
+    ('Retro Sci-Fi', 'FX', 87, 70, 82),
+    ('Magic Chime', 'FX', 87, 70, 83),
+    ('Try This!', 'FX', 87, 70, 84),
+    ('New Planetz', 'FX', 87, 70, 85),
+    ('Jet Noise', 'FX', 87, 70, 86),
+    ('Chaos 2003', 'FX', 87, 70, 87),
+    ('Control Room', 'FX', 87, 70, 88),
+    ('OutOf sortz', 'FX', 87, 70, 89),
+    ('Scatter', 'FX', 87, 70, 90),
+    ('Low Beat-S', 'FX', 87, 70, 91),
+    ('WaitnOutside', 'FX', 87, 70, 92),
+    ('Breath Echo', 'FX', 87, 70, 93),
+    ('SoundStrange', 'FX', 87, 70, 94),
+    ('Cosmic Pulse', 'FX', 87, 70, 95),
+    ('Faked Piano', 'FX', 87, 70, 96),
+    ('JUNO Crystal', 'FX', 87, 70, 97),
+    ('ResoSweep Dn', 'FX', 87, 70, 98),
+    ('Zap B3 & C4', 'FX', 87, 70, 99),
+    ('PolySweep Nz', 'FX', 87, 70, 100),
+    ('Strange Land', 'FX', 87, 70, 101),
+    ('S&H Voc', 'FX', 87, 70, 102),
+    ('12th Planet', 'FX', 87, 70, 103),
+    ('Scare', 'FX', 87, 70, 104),
+    ('Hillside', 'FX', 87, 70, 105),
+    ('Mod Scanner', 'FX', 87, 70, 106),
+    ('SoundOnSound', 'FX', 87, 70, 107),
+    ('Gasp', 'FX', 87, 70, 108),
+    ('ResoSweep Up', 'FX', 87, 70, 109),
+    ('Magic Wave', 'FX', 87, 70, 110),
+    ('Shangri-La', 'FX', 87, 70, 111),
+    ('CerealKiller', 'FX', 87, 70, 112),
+    ('Cosmic Drops', 'FX', 87, 70, 113),
+    ('Space Echo', 'FX', 87, 70, 114),
+    ('Robot Sci-Fi', 'FX', 87, 70, 115),
+    ('Jazz Scat', 'VOX', 87, 70, 116),
+    ('Jazz Doos', 'VOX', 87, 70, 117),
+    ('Choir Aahs 1', 'VOX', 87, 70, 118),
+    ('Choir Aahs 2', 'VOX', 87, 70, 119),
+    ('Choir Oohs', 'VOX', 87, 70, 120),
+    ('AngelsChoir1', 'VOX', 87, 70, 121),
+    ('AngelsChoir2', 'VOX', 87, 70, 122),
+    ('Syn Opera', 'VOX', 87, 70, 123),
+    ('Angelique', 'VOX', 87, 70, 124),
+    ('Vox Pad 1', 'VOX', 87, 70, 125),
+    ('Vox Pad 2', 'VOX', 87, 70, 126),
+    ('Gospel Oohs', 'VOX', 87, 70, 127),
+    ('Choir&Str', 'VOX', 87, 70, 128),
+    ('SynVox 1', 'VOX', 87, 71, 1),
+    ('SynVox 2', 'VOX', 87, 71, 2),
+    ('Aah Vox', 'VOX', 87, 71, 3),
+    ('Sweet Keys', 'VOX', 87, 71, 4),
+    ('JUNO Synvox', 'VOX', 87, 71, 5),
+    ('Uhmmm', 'VOX', 87, 71, 6),
+    ('Morning Star', 'VOX', 87, 71, 7),
+    ('BeautifulOne', 'VOX', 87, 71, 8),
+    ('Ooze', 'VOX', 87, 71, 9),
+    ('Aerial Choir', 'VOX', 87, 71, 10),
+    ('3D Vox', 'VOX', 87, 71, 11),
+    ('Sample Opera', 'VOX', 87, 71, 12),
+    ('Film Cue', 'VOX', 87, 71, 13),
+    ('Paradise', 'VOX', 87, 71, 14),
+    ('Sad ceremony', 'VOX', 87, 71, 15),
+    ('Lost Voices', 'VOX', 87, 71, 16),
+    ('Beat Vox', 'VOX', 87, 71, 17),
+    ('Talk 2 Me', 'VOX', 87, 71, 18),
+    ('FM Vox', 'VOX', 87, 71, 19),
+    ("Let's Talk!", 'VOX', 87, 71, 20),
+    ('Voc:Di Robt', 'VOX', 87, 71, 21),
+    ('Voc:Di Chr', 'VOX', 87, 71, 22),
+    ('Voc:Di Ens', 'VOX', 87, 71, 23),
+    ('Cosmic Rays', 'BPD', 87, 71, 24),
+    ('Phaser Pad 1', 'BPD', 87, 71, 25),
+    ('PhaseStrings', 'BPD', 87, 71, 26),
+    ('Super SynStr', 'BPD', 87, 71, 27),
+    ('80s Str 1', 'BPD', 87, 71, 28),
+    ('80s Str 2', 'BPD', 87, 71, 29),
+    ('BreakOut Str', 'BPD', 87, 71, 30),
+    ('Frends Syn', 'BPD', 87, 71, 31),
+    ('Comb', 'BPD', 87, 71, 32),
+    ('Voyager', 'BPD', 87, 71, 33),
+    ('Stringship', 'BPD', 87, 71, 34),
+    ('DarknessSide', 'BPD', 87, 71, 35),
+    ('Fat Stacks', 'BPD', 87, 71, 36),
+    ('Strings R Us', 'BPD', 87, 71, 37),
+    ('Electric Pad', 'BPD', 87, 71, 38),
+    ('Neo RS-202', 'BPD', 87, 71, 39),
+    ('OB Rezo Pad', 'BPD', 87, 71, 40),
+    ('Synthi Ens', 'BPD', 87, 71, 41),
+    ('Giant Sweep', 'BPD', 87, 71, 42),
+    ('Mod Dare', 'BPD', 87, 71, 43),
+    ('Cell Space', 'BPD', 87, 71, 44),
+    ('Digi-Swell', 'BPD', 87, 71, 45),
+    ('New Year Day', 'BPD', 87, 71, 46),
+    ('Polar Morn', 'BPD', 87, 71, 47),
+    ('Distant Sun', 'BPD', 87, 71, 48),
+    ('PG Chimes', 'BPD', 87, 71, 49),
+    ('Saturn Rings', 'BPD', 87, 71, 50),
+    ('Brusky', 'BPD', 87, 71, 51),
+    ('2.2 Pad 1', 'BPD', 87, 71, 52),
+    ('2.2 Pad 2', 'BPD', 87, 71, 53),
+    ('2.2 Pad 3', 'BPD', 87, 71, 54),
+    ('SaturnHolida', 'BPD', 87, 71, 55),
+    ('Neuro-Drone', 'BPD', 87, 71, 56),
+    ('In The Pass', 'BPD', 87, 71, 57),
+    ('Polar Night', 'BPD', 87, 71, 58),
+    ('Cell 5th', 'BPD', 87, 71, 59),
+    ('MistOver5ths', 'BPD', 87, 71, 60),
+    ('Gritty Pad', 'BPD', 87, 71, 61),
+    ('India Garden', 'BPD', 87, 71, 62),
+    ('BillionStars', 'BPD', 87, 71, 63),
+    ('Sand Pad', 'BPD', 87, 71, 64),
+    ('ReverseSweep', 'BPD', 87, 71, 65),
+    ('HugeSoundMod', 'BPD', 87, 71, 66),
+    ('Metal Swell', 'BPD', 87, 71, 67),
+    ('NuSoundtrack', 'BPD', 87, 71, 68),
+    ('Phat Strings', 'BPD', 87, 71, 69),
+    ('Hollow', 'SPD', 87, 71, 70),
+    ('Heaven Pad', 'SPD', 87, 71, 71),
+    ('Soft OB Pad', 'SPD', 87, 71, 72),
+    ('Reso Pad', 'SPD', 87, 71, 73),
+    ('Slow Saw Str', 'SPD', 87, 71, 74),
+    ('Terra Nostra', 'SPD', 87, 71, 75),
+    ('Summer Pad', 'SPD', 87, 71, 76),
+    ('Frends Pad', 'SPD', 87, 71, 77),
+    ('Pop Pad', 'SPD', 87, 71, 78),
+    ('Sqr Pad', 'SPD', 87, 71, 79),
+    ('Silk Pad', 'SPD', 87, 71, 80),
+    ('WarmReso Pad', 'SPD', 87, 71, 81),
+    ('Soft Pad', 'SPD', 87, 71, 82),
+    ('Air Pad', 'SPD', 87, 71, 83),
+    ('Soft Breeze', 'SPD', 87, 71, 84),
+    ('JP Strings 1', 'SPD', 87, 71, 85),
+    ('JP Strings 2', 'SPD', 87, 71, 86),
+    ('DelayStrings', 'SPD', 87, 71, 87),
+    ('NorthStrings', 'SPD', 87, 71, 88),
+    ('Syn Strings1', 'SPD', 87, 71, 89),
+    ('Syn Strings2', 'SPD', 87, 71, 90),
+    ('OB Strings 1', 'SPD', 87, 71, 91),
+    ('OB Strings 2', 'SPD', 87, 71, 92),
+    ('Strings Pad', 'SPD', 87, 71, 93),
+    ('R&B SoftPad', 'SPD', 87, 71, 94),
+    ('Phat Pad', 'SPD', 87, 71, 95),
+    ('Phaser Pad 2', 'SPD', 87, 71, 96),
+    ('Mystic Str', 'SPD', 87, 71, 97),
+    ('Glass Organ', 'SPD', 87, 71, 98),
+    ('Wind Pad', 'SPD', 87, 71, 99),
+    ('Combination', 'SPD', 87, 71, 100),
+    ('HumanKindnes', 'SPD', 87, 71, 101),
+    ('Beauty Pad', 'SPD', 87, 71, 102),
+    ('Atmospherics', 'SPD', 87, 71, 103),
+    ('OB Aaahs', 'SPD', 87, 71, 104),
+    ('Vulcano Pad', 'SPD', 87, 71, 105),
+    ('Cloud #9', 'SPD', 87, 71, 106),
+    ('Organic Pad', 'SPD', 87, 71, 107),
+    ('Hum Pad', 'SPD', 87, 71, 108),
+    ('Vox Pad', 'SPD', 87, 71, 109),
+    ('Digital Aahs', 'SPD', 87, 71, 110),
+    ('Tri 5th Pad', 'SPD', 87, 71, 111),
+    ('Movin Pad', 'SPD', 87, 71, 112),
+    ('Seq-Pad 2', 'SPD', 87, 71, 113),
+    ('Follow', 'SPD', 87, 71, 114),
+    ('Consolament', 'SPD', 87, 71, 115),
+    ('Spacious Pad', 'SPD', 87, 71, 116),
+    ('JD Pop Pad', 'SPD', 87, 71, 117),
+    ('JP-8 Phase', 'SPD', 87, 71, 118),
+    ('Nu Epic Pad', 'SPD', 87, 71, 119),
+    ('Flange Dream', 'SPD', 87, 71, 120),
+    ('Evolution X', 'SPD', 87, 71, 121),
+    ('Angelis Pad', 'SPD', 87, 71, 122),
+    ('JUNO-106 Str', 'SPD', 87, 71, 123),
+    ('JupiterMoves', 'SPD', 87, 71, 124),
+    ('Oceanic Pad', 'SPD', 87, 71, 125),
+    ("Fairy's Song", 'SPD', 87, 71, 126),
+    ('Borealis', 'SPD', 87, 71, 127),
+    ('JX Warm Pad', 'SPD', 87, 71, 128),
+    ('Analog Bgrnd', 'SPD', 87, 72, 1),
+    ('Sitar on C', 'PLK', 87, 72, 2),
+    ('JUNO Sitar 1', 'PLK', 87, 72, 3),
+    ('JUNO Sitar 2', 'PLK', 87, 72, 4),
+    ('Sitar Baby', 'PLK', 87, 72, 5),
+    ('Neo Sitar', 'PLK', 87, 72, 6),
+    ('SaraswatiRvr', 'PLK', 87, 72, 7),
+    ('Teky Drop', 'PLK', 87, 72, 8),
+    ('TroubadorEns', 'PLK', 87, 72, 9),
+    ('Elec Sitar', 'PLK', 87, 72, 10),
+    ('Pat is away', 'PLK', 87, 72, 11),
+    ('Nice Kalimba', 'PLK', 87, 72, 12),
+    ('Quiet River', 'PLK', 87, 72, 13),
+    ('Aerial Harp', 'PLK', 87, 72, 14),
+    ('Harpiness', 'PLK', 87, 72, 15),
+    ('Skydiver', 'PLK', 87, 72, 16),
+    ('Jamisen', 'PLK', 87, 72, 17),
+    ('JUNO Koto', 'PLK', 87, 72, 18),
+    ('Monsoon', 'PLK', 87, 72, 19),
+    ('Bend Koto', 'PLK', 87, 72, 20),
+    ('JUNO Banjo', 'FRT', 87, 72, 21),
+    ('Pan Pipes', 'ETH', 87, 72, 22),
+    ('Andes Mood', 'ETH', 87, 72, 23),
+    ('LongDistance', 'ETH', 87, 72, 24),
+    ('Ambi Shaku', 'ETH', 87, 72, 25),
+    ('HimalayaPipe', 'ETH', 87, 72, 26),
+    ('Ethnic Lead', 'ETH', 87, 72, 27),
+    ('Lochscape', 'ETH', 87, 72, 28),
+    ('PipeDream', 'ETH', 87, 72, 29),
+    ('Angel Pipes', 'ETH', 87, 72, 30),
+    ('Far East', 'ETH', 87, 72, 31),
+    ('Wired Synth', 'ETH', 87, 72, 32),
+    ('4DaCommonMan', 'ETH', 87, 72, 33),
+    ('Orgaenia', 'ETH', 87, 72, 34),
+    ('Sleeper', 'ETH', 87, 72, 35),
+    ('Ice Palace', 'ETH', 87, 72, 36),
+    ('Story Harp', 'ETH', 87, 72, 37),
+    ('LostParadise', 'ETH', 87, 72, 38),
+    ('Timpani+Low', 'PRC', 87, 72, 39),
+    ('Timpani Roll', 'PRC', 87, 72, 40),
+    ('Bass Drum', 'PRC', 87, 72, 41),
+    ('Ambidextrous', 'SFX', 87, 72, 42),
+    ('En-co-re', 'SFX', 87, 72, 43),
+    ('Mobile Phone', 'SFX', 87, 72, 44),
+    ('ElectroDisco', 'BTS', 87, 72, 45),
+    ('Groove 007', 'BTS', 87, 72, 46),
+    ('In Da Groove', 'BTS', 87, 72, 47),
+    ('Sweet 80s', 'BTS', 87, 72, 48),
+    ('Auto Trance2', 'BTS', 87, 72, 49),
+    ('JUNO Pop', 'BTS', 87, 72, 50),
+    ('Compusonic 1', 'BTS', 87, 72, 51),
+    ('Compusonic 2', 'BTS', 87, 72, 52),
+    ('Mix Drum 1', 'DRM', 87, 72, 53),
+    ('Mix Drum 2', 'DRM', 87, 72, 54),
+    ('Lounge Kit', 'CMB', 87, 72, 55),
+    ('80s Combo', 'CMB', 87, 72, 56),
+    ('Analog Days', 'CMB', 87, 72, 57),
+    ('Techno Craft', 'CMB', 87, 72, 58),
+    ('NylonGtr E4', 'SMP', 87, 72, 59),
+    ('Pemade C5', 'SMP', 87, 72, 60),
+    ('Shankh G#4', 'SMP', 87, 72, 61),
+    ('RSS SpinnrC4', 'SMP', 87, 72, 62),
+    ('Come On! C4', 'SMP', 87, 72, 63),
+    ('102:PhraseC4', 'SMP', 87, 72, 64),
+    ('Piano 1', 'PNO', 121, 0, 1),
+    ('Piano 1w', 'PNO', 121, 1, 1),
+    ('European Pf', 'PNO', 121, 2, 1),
+    ('Piano 2', 'PNO', 121, 0, 2),
+    ('Piano 2w', 'PNO', 121, 1, 2),
+    ('Piano 3', 'EP', 121, 0, 3),
+    ('Piano 3w', 'EP', 121, 1, 3),
+    ('Honky-tonk', 'PNO', 121, 0, 4),
+    ('Honky-tonk 2', 'PNO', 121, 1, 4),
+    ('E.Piano 1', 'EP', 121, 0, 5),
+    ('St.Soft EP', 'EP', 121, 1, 5),
+    ('FM+SA EP', 'EP', 121, 2, 5),
+    ('Wurly', 'EP', 121, 3, 5),
+    ('E.Piano 2', 'EP', 121, 0, 6),
+    ('Detuned EP 2', 'EP', 121, 1, 6),
+    ('St.FM EP', 'EP', 121, 2, 6),
+    ('EP Legend', 'EP', 121, 3, 6),
+    ('EP Phase', 'EP', 121, 4, 6),
+    ('Harpsichord', 'KEY', 121, 0, 7),
+    ('Coupled Hps.', 'KEY', 121, 1, 7),
+    ('Harpsi.w', 'KEY', 121, 2, 7),
+    ('Harpsi.o', 'KEY', 121, 3, 7),
+    ('Clav.', 'KEY', 121, 0, 8),
+    ('Pulse Clav', 'KEY', 121, 1, 8),
+    ('Celesta', 'KEY', 121, 0, 9),
+    ('Glockenspiel', 'BEL', 121, 0, 10),
+    ('Music Box', 'BEL', 121, 0, 11),
+    ('Vibraphone', 'MLT', 121, 0, 12),
+    ('Vibraphone w', 'MLT', 121, 1, 12),
+    ('Marimba', 'MLT', 121, 0, 13),
+    ('Marimba w', 'MLT', 121, 1, 13),
+    ('Xylophone', 'MLT', 121, 0, 14),
+    ('Tubular-bell', 'BEL', 121, 0, 15),
+    ('Church Bell', 'BEL', 121, 1, 15),
+    ('Carillon', 'BEL', 121, 2, 15),
+    ('Santur', 'PLK', 121, 0, 16),
+    ('Organ 1', 'ORG', 121, 0, 17),
+    ('Trem. Organ', 'ORG', 121, 1, 17),
+    ('60’s Organ 1', 'ORG', 121, 2, 17),
+    ('70’s E.Organ', 'ORG', 121, 3, 17),
+    ('Organ 2', 'ORG', 121, 0, 18),
+    ('Chorus Or.2', 'ORG', 121, 1, 18),
+    ('Perc. Organ', 'ORG', 121, 2, 18),
+    ('Organ 3', 'ORG', 121, 0, 19),
+    ('Church Org.1', 'ORG', 121, 0, 20),
+    ('Church Org.2', 'ORG', 121, 1, 20),
+    ('Church Org.3', 'ORG', 121, 2, 20),
+    ('Reed Organ', 'ORG', 121, 0, 21),
+    ('Puff Organ', 'ORG', 121, 1, 21),
+    ('Accordion Fr', 'ACD', 121, 0, 22),
+    ('Accordion It', 'ACD', 121, 1, 22),
+    ('Harmonica', 'HRM', 121, 0, 23),
+    ('Bandoneon', 'ACD', 121, 0, 24),
+    ('Nylon-str.Gt', 'AGT', 121, 0, 25),
+    ('Ukulele', 'AGT', 121, 1, 25),
+    ('Nylon Gt.o', 'AGT', 121, 2, 25),
+    ('Nylon Gt.2', 'AGT', 121, 3, 25),
+    ('Steel-str.Gt', 'AGT', 121, 0, 26),
+    ('12-str.Gt', 'AGT', 121, 1, 26),
+    ('Mandolin', 'AGT', 121, 2, 26),
+    ('Steel + Body', 'AGT', 121, 3, 26),
+    ('Jazz Gt.', 'EGT', 121, 0, 27),
+    ('Pedal Steel', 'EGT', 121, 1, 27),
+    ('Clean Gt.', 'EGT', 121, 0, 28),
+    ('Chorus Gt.', 'EGT', 121, 1, 28),
+    ('Mid Tone GTR', 'EGT', 121, 2, 28),
+    ('Muted Gt.', 'EGT', 121, 0, 29),
+    ('Funk Pop', 'EGT', 121, 1, 29),
+    ('Funk Gt.2', 'EGT', 121, 2, 29),
+    ('Jazz Man', 'EGT', 121, 3, 29),
+    ('Overdrive Gt', 'DGT', 121, 0, 30),
+    ('Guitar Pinch', 'DGT', 121, 1, 30),
+    ('DistortionGt', 'DGT', 121, 0, 31),
+    ('Feedback Gt.', 'DGT', 121, 1, 31),
+    ('Dist Rtm GTR', 'DGT', 121, 2, 31),
+    ('Gt.Harmonics', 'EGT', 121, 0, 32),
+    ('Gt. Feedback', 'EGT', 121, 1, 32),
+    ('Acoustic Bs.', 'BS', 121, 0, 33),
+    ('Fingered Bs.', 'BS', 121, 0, 34),
+    ('Finger Slap', 'BS', 121, 1, 34),
+    ('Picked Bass', 'BS', 121, 0, 35),
+    ('Fretless Bs.', 'BS', 121, 0, 36),
+    ('Slap Bass 1', 'BS', 121, 0, 37),
+    ('Slap Bass 2', 'BS', 121, 0, 38),
+    ('Synth Bass 1', 'SBS', 121, 0, 39),
+    ('SynthBass101', 'SBS', 121, 1, 39),
+    ('Acid Bass', 'SBS', 121, 2, 39),
+    ('Clavi Bass', 'SBS', 121, 3, 40),
+    ('Hammer', 'SBS', 121, 4, 40),
+    ('Synth Bass 2', 'SBS', 121, 0, 40),
+    ('Beef FM Bass', 'SBS', 121, 1, 40),
+    ('RubberBass 2', 'SBS', 121, 2, 40),
+    ('Attack Pulse', 'SBS', 121, 3, 40),
+    ('Violin', 'STR', 121, 0, 41),
+    ('Slow Violin', 'STR', 121, 1, 41),
+    ('Viola', 'STR', 121, 0, 42),
+    ('Cello', 'STR', 121, 0, 43),
+    ('Contrabass', 'STR', 121, 0, 44),
+    ('Tremolo Str', 'STR', 121, 0, 45),
+    ('PizzicatoStr', 'STR', 121, 0, 46),
+    ('Harp', 'PLK', 121, 0, 47),
+    ('Yang Qin', 'PLK', 121, 1, 47),
+    ('Timpani', 'PRC', 121, 0, 48),
+    ('Strings', 'STR', 121, 0, 49),
+    ('Orchestra', 'ORC', 121, 1, 49),
+    ('60s Strings', 'STR', 121, 2, 49),
+    ('Slow Strings', 'STR', 121, 0, 50),
+    ('Syn.Strings1', 'STR', 121, 0, 51),
+    ('Syn.Strings3', 'STR', 121, 1, 51),
+    ('Syn.Strings2', 'SPD', 121, 0, 52),
+    ('Choir Aahs', 'VOX', 121, 0, 53),
+    ('Chorus Aahs', 'VOX', 121, 1, 53),
+    ('Voice Oohs', 'VOX', 121, 0, 54),
+    ('Humming', 'VOX', 121, 1, 54),
+    ('SynVox', 'VOX', 121, 0, 55),
+    ('Analog Voice', 'VOX', 121, 1, 55),
+    ('OrchestraHit', 'HIT', 121, 0, 56),
+    ('Bass Hit', 'HIT', 121, 1, 56),
+    ('6th Hit', 'HIT', 121, 2, 56),
+    ('Euro Hit', 'HIT', 121, 3, 56),
+    ('Trumpet', 'BRS', 121, 0, 57),
+    ('Dark Trumpet', 'BRS', 121, 1, 57),
+    ('Trombone', 'BRS', 121, 0, 58),
+    ('Trombone 2', 'BRS', 121, 1, 58),
+    ('Bright Tb', 'BRS', 121, 2, 58),
+    ('Tuba', 'BRS', 121, 0, 59),
+    ('MutedTrumpet', 'BRS', 121, 0, 60),
+    ('MuteTrumpet2', 'BRS', 121, 1, 60),
+    ('French Horns', 'BRS', 121, 0, 61),
+    ('Fr.Horn 2', 'BRS', 121, 1, 61),
+    ('Brass 1', 'BRS', 121, 0, 62),
+    ('Brass 2', 'BRS', 121, 1, 62),
+    ('Synth Brass1', 'SBR', 121, 0, 63),
+    ('Pro Brass', 'SBR', 121, 1, 63),
+    ('Oct SynBrass', 'SBR', 121, 2, 63),
+    ('Jump Brass', 'SBR', 121, 3, 63),
+    ('Synth Brass2', 'SBR', 121, 0, 64),
+    ('SynBrass sfz', 'SBR', 121, 1, 64),
+    ('Velo Brass 1', 'SBR', 121, 2, 64),
+    ('Soprano Sax', 'SAX', 121, 0, 65),
+    ('Alto Sax', 'SAX', 121, 0, 66),
+    ('Tenor Sax', 'SAX', 121, 0, 67),
+    ('Baritone Sax', 'SAX', 121, 0, 68),
+    ('Oboe', 'WND', 121, 0, 69),
+    ('English Horn', 'WND', 121, 0, 70),
+    ('Bassoon', 'WND', 121, 0, 71),
+    ('Clarinet', 'WND', 121, 0, 72),
+    ('Piccolo', 'FLT', 121, 0, 73),
+    ('Flute', 'FLT', 121, 0, 74),
+    ('Recorder', 'FLT', 121, 0, 75),
+    ('Pan Flute', 'FLT', 121, 0, 76),
+    ('Bottle Blow', 'FLT', 121, 0, 77),
+    ('Shakuhachi', 'ETH', 121, 0, 78),
+    ('Whistle', 'FLT', 121, 0, 79),
+    ('Ocarina', 'FLT', 121, 0, 80),
+    ('Square Wave', 'HLD', 121, 0, 81),
+    ('MG Square', 'HLD', 121, 1, 81),
+    ('2600 Sine', 'HLD', 121, 2, 81),
+    ('Saw Wave', 'HLD', 121, 0, 82),
+    ('OB2 Saw', 'HLD', 121, 1, 82),
+    ('Doctor Solo', 'HLD', 121, 2, 82),
+    ('Natural Lead', 'HLD', 121, 3, 82),
+    ('SequencedSaw', 'HLD', 121, 4, 82),
+    ('Syn.Calliope', 'SLD', 121, 0, 83),
+    ('Chiffer Lead', 'SLD', 121, 0, 84),
+    ('Charang', 'HLD', 121, 0, 85),
+    ('Wire Lead', 'HLD', 121, 1, 85),
+    ('Solo Vox', 'SLD', 121, 0, 86),
+    ('5th Saw Wave', 'HLD', 121, 0, 87),
+    ('Bass & Lead', 'HLD', 121, 0, 88),
+    ('Delayed Lead', 'HLD', 121, 1, 88),
+    ('Fantasia', 'SYN', 121, 0, 89),
+    ('Warm Pad', 'SPD', 121, 0, 90),
+    ('Sine Pad', 'SPD', 121, 1, 90),
+    ('Polysynth', 'SYN', 121, 0, 91),
+    ('Space Voice', 'VOX', 121, 0, 92),
+    ('Itopia', 'VOX', 121, 1, 92),
+    ('Bowed Glass', 'SPD', 121, 0, 93),
+    ('Metal Pad', 'BPD', 121, 0, 94),
+    ('Halo Pad', 'BPD', 121, 0, 95),
+    ('Sweep Pad', 'SPD', 121, 0, 96),
+    ('Ice Rain', 'SYN', 121, 0, 97),
+    ('Soundtrack', 'SPD', 121, 0, 98),
+    ('Crystal', 'BEL', 121, 0, 99),
+    ('Syn Mallet', 'BEL', 121, 1, 99),
+    ('Atmosphere', 'AGT', 121, 0, 100),
+    ('Brightness', 'SYN', 121, 0, 101),
+    ('Goblin', 'PLS', 121, 0, 102),
+    ('Echo Drops', 'BPD', 121, 0, 103),
+    ('Echo Bell', 'BPD', 121, 1, 103),
+    ('Echo Pan', 'BPD', 121, 2, 103),
+    ('Star Theme', 'BPD', 121, 0, 104),
+    ('Sitar', 'PLK', 121, 0, 105),
+    ('Sitar 2', 'PLK', 121, 1, 105),
+    ('Banjo', 'FRT', 121, 0, 106),
+    ('Shamisen', 'PLK', 121, 0, 107),
+    ('Koto', 'PLK', 121, 0, 108),
+    ('Taisho Koto', 'PLK', 121, 1, 108),
+    ('Kalimba', 'PLK', 121, 0, 109),
+    ('Bagpipe', 'ETH', 121, 0, 110),
+    ('Fiddle', 'STR', 121, 0, 111),
+    ('Shanai', 'ETH', 121, 0, 112),
+    ('Tinkle Bell', 'BEL', 121, 0, 113),
+    ('Agogo', 'PRC', 121, 0, 114),
+    ('Steel Drums', 'MLT', 121, 0, 115),
+    ('Woodblock', 'PRC', 121, 0, 116),
+    ('Castanets', 'PRC', 121, 1, 116),
+    ('Taiko', 'PRC', 121, 0, 117),
+    ('Concert BD', 'PRC', 121, 1, 117),
+    ('Melo. Tom 1', 'PRC', 121, 0, 118),
+    ('Melo. Tom 2', 'PRC', 121, 1, 118),
+    ('Synth Drum', 'PRC', 121, 0, 119),
+    ('808 Tom', 'PRC', 121, 1, 119),
+    ('Elec Perc', 'PRC', 121, 2, 119),
+    ('Reverse Cym.', 'PRC', 121, 0, 120),
+    ('Gt.FretNoise', 'AGT', 121, 0, 121),
+    ('Gt.Cut Noise', 'AGT', 121, 1, 121),
+    ('String Slap', 'AGT', 121, 2, 121),
+    ('Breath Noise', 'FX', 121, 0, 122),
+    ('Fl.Key Click', 'FX', 121, 1, 122),
+    ('Seashore', 'SFX', 121, 0, 123),
+    ('Rain', 'SFX', 121, 1, 123),
+    ('Thunder', 'SFX', 121, 2, 123),
+    ('Wind', 'SFX', 121, 3, 123),
+    ('Stream', 'SFX', 121, 4, 123),
+    ('Bubble', 'SFX', 121, 5, 123),
+    ('Bird', 'SFX', 121, 0, 124),
+    ('Dog', 'SFX', 121, 1, 124),
+    ('Horse-Gallop', 'SFX', 121, 2, 124),
+    ('Bird 2', 'SFX', 121, 3, 124),
+    ('Telephone 1', 'SFX', 121, 0, 125),
+    ('Telephone 2', 'SFX', 121, 1, 125),
+    ('DoorCreaking', 'SFX', 121, 2, 125),
+    ('Door', 'SFX', 121, 3, 125),
+    ('Scratch', 'SFX', 121, 4, 125),
+    ('Wind Chimes', 'SFX', 121, 5, 125),
+    ('Helicopter', 'SFX', 121, 0, 126),
+    ('Car-Engine', 'SFX', 121, 1, 126),
+    ('Car-Stop', 'SFX', 121, 2, 126),
+    ('Car-Pass', 'SFX', 121, 3, 126),
+    ('Car-Crash', 'SFX', 121, 4, 126),
+    ('Siren', 'SFX', 121, 5, 126),
+    ('Train', 'SFX', 121, 6, 126),
+    ('Jetplane', 'SFX', 121, 7, 126),
+    ('Starship', 'SFX', 121, 8, 126),
+    ('Burst Noise', 'SFX', 121, 9, 16),
+    ('Applause', 'SFX', 121, 0, 127),
+    ('Laughing', 'SFX', 121, 1, 127),
+    ('Screaming', 'SFX', 121, 2, 127),
+    ('Punch', 'SFX', 121, 3, 127),
+    ('Heart Beat', 'SFX', 121, 4, 127),
+    ('Footsteps', 'SFX', 121, 5, 127),
+    ('Gun Shot', 'SFX', 121, 0, 128),
+    ('Machine Gun', 'SFX', 121, 1, 128),
+    ('Lasergun', 'SFX', 121, 2, 128),
+    ('Explosion', 'SFX', 121, 3, 128),
+    ('GO Grand', 'PNO', 0, 68, 1),
+    ('Bright  Grand', 'PNO', 87, 73, 2),
+    ('European Pf', 'PNO', 87, 73, 3),
+    ('Go Grand 2', 'PNO', 87, 73, 4),
+    ('ConcertGrand', 'PNO', 87, 73, 5),
+    ('Mellow Grand', 'PNO', 87, 73, 6),
+    ('Honky-Tonk', 'PNO', 87, 73, 7),
+    ('GO Grand+Str', 'PNO', 87, 73, 8),
+    ('GO Grand+Pad', 'PNO', 87, 73, 9),
+    ('CoupleHarpsi', 'KEY', 87, 73, 10),
+    ('Vintage EP', 'EP', 87, 73, 11),
+    ('Phase EP', 'EP', 87, 73, 12),
+    ('TremEP Stage', 'EP', 87, 73, 13),
+    ('Wurly Trem', 'EP', 87, 73, 14),
+    ('FM Chorus EP', 'EP', 87, 73, 15),
+    ('D50 Fantasia', 'BEL', 87, 73, 16),
+    ('Clavi', 'KEY', 87, 73, 17),
+    ('FullDraw Org', 'ORG', 87, 73, 18),
+    ('FullDrawSlow', 'ORG', 87, 73, 19),
+    ('FullDrawFast', 'ORG', 87, 73, 20),
+    ('Perc Organ', 'ORG', 87, 73, 21),
+    ('Chapel Organ', 'ORG', 87, 73, 22),
+    ('Positive Org', 'ORG', 87, 73, 23),
+    ('Accordion', 'ACD', 87, 73, 24),
+    ('Jazz Scat', 'VOX', 87, 73, 25),
+    ('Voice Doo', 'VOX', 87, 73, 26),
+    ('Choir Aahs', 'VOX', 87, 73, 27),
+    ('Strings', 'STR', 87, 73, 28),
+    ('Violin', 'STR', 87, 73, 29),
+    ('Flute', 'FLT', 87, 73, 30),
+    ('Trombone', 'BRS', 87, 73, 31),
+    ('SoftNyln Gtr', 'AGT', 87, 73, 32),
+    ('Vibraphone', 'BEL', 87, 73, 33),
+    ('Saw Lead', 'SYN', 87, 73, 34),
+    ('Super SynPad', 'SYN', 87, 73, 35),
+    ('Jump Brass', 'BRS', 87, 73, 36),
+    ('Fingerd Bass', 'BS', 87, 73, 37),
+    ('AccousticBass', 'BS', 87, 73, 38),
+    ('Standard Kit', 'DRM', 120, 0, 1),
+    ('SFX Kit', 'SFX', 120, 0, 57),
+)
+
+# sorted (normalized name, row)
+NAME_INDEX = (
+    ('102phrasec4', 1087),
+    ('12strgt', 1146),
+    ('12strguitar', 238),
+    ('12thplanet', 870),
+    ('22pad1', 947),
+    ('22pad2', 948),
+    ('22pad3', 949),
+    ('2600sine', 1245),
+    ('2bleaction', 473),
+    ('2krazybrite', 605),
+    ('303nrg', 619),
+    ('3dvox', 906),
+    ('4dacommonman', 1056),
+    ('4mantcycle', 729),
+    ('50steeldrms', 223),
+    ('5thkey', 207),
+    ('5thsawwave', 1256),
+    ('5thvoice', 739),
+    ('60sorg1', 147),
+    ('60sorg2', 148),
+    ('60sorgan1', 1126),
+    ('60sstrings', 1193),
+    ('6thhit', 1206),
+    ('70seorgan', 1127),
+    ('808tom', 1300),
+    ('80sbrass1', 505),
+    ('80sbrass2', 512),
+    ('80sbrass3', 513),
+    ('80sbrass4', 514),
+    ('80sbrass5', 515),
+    ('80scombo', 1079),
+    ('80sep1', 69),
+    ('80sep2', 87),
+    ('80ssaws1', 690),
+    ('80ssaws2', 691),
+    ('80ssaws3', 692),
+    ('80sstr1', 923),
+    ('80sstr2', 924),
+    ('88stagegrand', 0),
+    ('88stggrand2', 1),
+    ('88stggrand3', 2),
+    ('aahvox', 898),
+    ('abigpick', 307),
+    ('acbass1', 281),
+    ('acbass2', 282),
+    ('acbass3', 283),
+    ('accordion', 1367),
+    ('accordionfr', 1137),
+    ('accordionit', 1138),
+    ('accousticbass', 1381),
+    ('acdgbass', 390),
+    ('acidbass', 1174),
+    ('acidlead', 774),
+    ('acidpunch', 379),
+    ('acousticbs', 1165),
+    ('aerialchoir', 905),
+    ('aerialharp', 1037),
+    ('agentines', 92),
+    ('agogo', 1291),
+    ('airievibez', 215),
+    ('airlead', 676),
+    ('airpad', 978),
+    ('airpluck', 225),
+    ('allinoneriff', 751),
+    ('allroundbs', 299),
+    ('alpharesobs', 404),
+    ('alphasaid', 783),
+    ('alphaspit1', 561),
+    ('alphaspit2', 663),
+    ('alphasynbs1', 332),
+    ('alphasynbs2', 333),
+    ('alphasynbs3', 400),
+    ('altoleadsax', 540),
+    ('altosax', 1228),
+    ('aluminmwires', 758),
+    ('amadeus', 183),
+    ('ambidextrous', 1065),
+    ('ambientpiano', 42),
+    ('ambishaku', 1048),
+    ('ambitp', 493),
+    ('anabrass', 516),
+    ('anadroid', 776),
+    ('analogbgrnd', 1024),
+    ('analogclavi1', 164),
+    ('analogclavi2', 175),
+    ('analogdays', 1080),
+    ('analogdream', 731),
+    ('analogvoice', 1203),
+    ('andesmood', 1046),
+    ('angelique', 891),
+    ('angelispad', 1017),
+    ('angelpipes', 1053),
+    ('angelschoir1', 888),
+    ('angelschoir2', 889),
+    ('applause', 1334),
+    ('aqua', 699),
+    ('aquaorgpno', 152),
+    ('arposphere', 839),
+    ('atmosphere', 1273),
+    ('atmospherics', 998),
+    ('attackpulse', 1180),
+    ('auto5thsaws', 828),
+    ('autotrance1', 804),
+    ('autotrance2', 1072),
+    ('back2the60s', 72),
+    ('backegrand', 35),
+    ('baglead', 614),
+    ('bagpipe', 1287),
+    ('balladeer', 103),
+    ('bandoneon', 1140),
+    ('banjo', 1282),
+    ('baritonesax', 1230),
+    ('basement', 310),
+    ('bassdrum', 1064),
+    ('basshit', 1205),
+    ('basslead', 1257),
+    ('bassoon', 1233),
+    ('beatpad', 806),
+    ('beatvox', 912),
+    ('beautifulone', 903),
+    ('beautypad', 997),
+    ('beeffmbass', 1178),
+    ('beepinbass', 388),
+    ('beepmelodie', 779),
+    ('bellmonitor', 208),
+    ('bellring', 205),
+    ('bendkoto', 1043),
+    ('biggiebows', 441),
+    ('bigmini1', 322),
+    ('bigmini2', 323),
+    ('bigmini3', 397),
+    ('bigplanet', 701),
+    ('billionstars', 958),
+    ('bird', 1314),
+    ('bird2', 1317),
+    ('bitingclavi', 177),
+    ('blendpiano', 38),
+    ('bluemeanie', 728),
+    ('bluesharp', 232),
+    ('bodyelectric', 609),
+    ('borealis', 1022),
+    ('borg1', 124),
+    ('borg2', 125),
+    ('borg3', 126),
+    ('borg4', 127),
+    ('bottleblow', 1239),
+    ('bowedglass', 1265),
+    ('bpfclaviph', 179),
+    ('bpfsaw', 741),
+    ('braatz', 750),
+    ('brass1', 1218),
+    ('brass2', 1219),
+    ('brasspartout', 488),
+    ('brasssax', 485),
+    ('brasssect1', 483),
+    ('brasssect2', 484),
+    ('breakoutbrs', 479),
+    ('breakoutkey', 532),
+    ('breakoutstr', 925),
+    ('breathecho', 860),
+    ('breathnoise', 1306),
+    ('brightbrass', 478),
+    ('brightcello', 450),
+    ('brightgrand', 1345),
+    ('brightness', 1274),
+    ('brightnylon', 242),
+    ('brighttb', 1212),
+    ('brightviolin', 449),
+    ('brilltremep', 93),
+    ('briskvortex', 816),
+    ('brusky', 946),
+    ('bscheeze', 347),
+    ('bsmc', 344),
+    ('bsmg', 340),
+    ('bspedal', 345),
+    ('bsrelease', 346),
+    ('bsreso', 341),
+    ('bssh', 342),
+    ('bstb', 343),
+    ('bubble', 1313),
+    ('burstnoise', 1333),
+    ('bustranza', 708),
+    ('c64lead', 618),
+    ('candybell', 194),
+    ('carcrash', 1328),
+    ('carengine', 1325),
+    ('carillon', 1122),
+    ('carpass', 1327),
+    ('carstop', 1326),
+    ('castanets', 1294),
+    ('cathedral', 155),
+    ('celesta', 1112),
+    ('celestatrem', 197),
+    ('celestialep', 97),
+    ('cell5th', 954),
+    ('cellclavi', 169),
+    ('cellfanta', 733),
+    ('cello', 1184),
+    ('cellpad', 796),
+    ('cellspace', 939),
+    ('cellsqulead', 621),
+    ('celltrance', 746),
+    ('cerealkiller', 879),
+    ('chamberstr1', 411),
+    ('chamberstr2', 412),
+    ('chaos2003', 854),
+    ('chapelorgan', 154),
+    ('chapelorgan', 1365),
+    ('charang', 1253),
+    ('cheesybrass', 529),
+    ('cheezymovie', 465),
+    ('chickenbass', 304),
+    ('chifferlead', 1252),
+    ('chime', 204),
+    ('choiraahs', 1198),
+    ('choiraahs', 1370),
+    ('choiraahs1', 885),
+    ('choiraahs2', 886),
+    ('choiroohs', 887),
+    ('choirstr', 895),
+    ('chopsynth', 802),
+    ('chorusaahs', 1199),
+    ('chorusbass', 306),
+    ('chorusgt', 1152),
+    ('chorusor2', 1129),
+    ('chubbylead', 668),
+    ('chunkatk', 276),
+    ('churchbell', 1121),
+    ('churchorg1', 1132),
+    ('churchorg2', 1133),
+    ('churchorg3', 1134),
+    ('cicadapiano', 24),
+    ('clarencenet', 548),
+    ('clarinet', 1234),
+    ('classicld1', 581),
+    ('classicld2', 582),
+    ('clav', 1110),
+    ('clavi', 1360),
+    ('clavi1', 160),
+    ('clavi2', 161),
+    ('clavi3', 170),
+    ('clavi4', 171),
+    ('clavi5', 172),
+    ('clavibass', 1175),
+    ('clean', 595),
+    ('cleangt', 1151),
+    ('cleangtr1', 251),
+    ('cleangtr2', 252),
+    ('cloud9', 1001),
+    ('clustered', 452),
+    ('cmpdfngbs', 286),
+    ('coffeebee', 754),
+    ('comb', 927),
+    ('combination', 995),
+    ('comeonc4', 1086),
+    ('compstlgtr', 235),
+    ('compusonic1', 1074),
+    ('compusonic2', 1075),
+    ('concertbd', 1296),
+    ('concertgrand', 11),
+    ('concertgrand', 1348),
+    ('consolament', 1010),
+    ('contrabass', 1185),
+    ('controlroom', 855),
+    ('cosmicdrops', 880),
+    ('cosmicpulse', 862),
+    ('cosmicrays', 919),
+    ('coupledhps', 1107),
+    ('coupleharpsi', 1353),
+    ('crimsongtr', 262),
+    ('crossedbows', 429),
+    ('crosstalk', 829),
+    ('crummyorgan', 151),
+    ('crunchtwin', 272),
+    ('crystal', 1271),
+    ('crystalep', 94),
+    ('cuetip', 684),
+    ('cutterclavi', 167),
+    ('d50fantasia', 1359),
+    ('d50fantasia1', 185),
+    ('d50fantasia2', 186),
+    ('dancefloor', 824),
+    ('dancesaws', 757),
+    ('dancesteam', 477),
+    ('darkgrand', 36),
+    ('darknessside', 930),
+    ('darktrumpet', 1209),
+    ('dbarorg1', 128),
+    ('dbarorg2', 129),
+    ('dbarorg3', 130),
+    ('dbarorg4', 131),
+    ('dbarorg5', 132),
+    ('dbarorg6', 133),
+    ('dbarorg7', 134),
+    ('dbarorg8', 135),
+    ('dcobass', 360),
+    ('dcobellpad', 732),
+    ('dctriangle', 585),
+    ('delayedlead', 1258),
+    ('delayquartet', 419),
+    ('delaystrings', 982),
+    ('delicatepizz', 447),
+    ('delyresosaws', 743),
+    ('destroyedbs', 394),
+    ('destroyedld', 600),
+    ('detunebass', 381),
+    ('detunedep2', 1102),
+    ('detunesawbrs', 510),
+    ('detuneseqsaw', 769),
+    ('digidoo', 811),
+    ('digilead1', 583),
+    ('digilead2', 584),
+    ('digimax', 724),
+    ('digisawsyn', 709),
+    ('digiseq', 766),
+    ('digiswell', 940),
+    ('digitalaahs', 1005),
+    ('digitaless', 693),
+    ('digitalpad', 819),
+    ('digivoxsyn', 715),
+    ('dignduke', 644),
+    ('dirtybeat', 813),
+    ('dirtycombo', 713),
+    ('dirtyvoltage', 594),
+    ('distantsun', 943),
+    ('distbee', 145),
+    ('distfingerz', 270),
+    ('distlead', 607),
+    ('distortedmg', 606),
+    ('distortion', 596),
+    ('distortiongt', 1160),
+    ('distrtmgtr', 1162),
+    ('docstack', 688),
+    ('doctorsolo', 1248),
+    ('dog', 1315),
+    ('door', 1321),
+    ('doorcreaking', 1320),
+    ('doublebubble', 735),
+    ('downrightbs', 285),
+    ('dozebass1', 336),
+    ('dozebass2', 359),
+    ('dreamingbox', 189),
+    ('dreamingep', 102),
+    ('dropbass', 396),
+    ('dspchaos', 823),
+    ('dualprofs', 590),
+    ('dualsawbrs', 530),
+    ('dustbass', 377),
+    ('dynastrsect1', 432),
+    ('dynastrsect2', 433),
+    ('dynoep', 70),
+    ('dynojazzgtr', 250),
+    ('echobell', 1277),
+    ('echodrops', 1276),
+    ('echoecho', 837),
+    ('echopan', 1278),
+    ('egrand', 34),
+    ('elecperc', 1301),
+    ('elecsitar', 1033),
+    ('electricpad', 933),
+    ('electrodisco', 1068),
+    ('electrons', 814),
+    ('electrorubb', 355),
+    ('electrostars', 760),
+    ('encore', 1066),
+    ('endingscene', 463),
+    ('englishhorn', 1232),
+    ('enorjizor', 357),
+    ('epbell1', 89),
+    ('epbell2', 90),
+    ('epchorus1', 65),
+    ('epchorus2', 66),
+    ('epchorus3', 67),
+    ('epiano', 71),
+    ('epiano1', 1097),
+    ('epiano2', 1101),
+    ('epiclead', 613),
+    ('eplayer', 86),
+    ('eplegend', 1104),
+    ('epphase', 1105),
+    ('epstack', 109),
+    ('eptrem1', 62),
+    ('eptrem2', 63),
+    ('eptrem3', 64),
+    ('ethniclead', 1050),
+    ('ethnokeys', 220),
+    ('eureggae', 805),
+    ('eurohit', 1207),
+    ('europeanpf', 1090),
+    ('europeanpf', 1346),
+    ('europexpres', 686),
+    ('euroteuro', 803),
+    ('evangelized', 675),
+    ('evolutionx', 1016),
+    ('exhale', 725),
+    ('explosion', 1343),
+    ('fairyfactor', 716),
+    ('fairypiano', 8),
+    ('fairyssong', 1021),
+    ('fakedpiano', 863),
+    ('fantasia', 1259),
+    ('fantomaspad', 833),
+    ('fareast', 1054),
+    ('farewell', 458),
+    ('fatrubberbs', 314),
+    ('fatstacks', 931),
+    ('fattenorsax', 544),
+    ('fazeebass', 406),
+    ('featlead', 620),
+    ('feedbackgt', 1161),
+    ('fhornssect', 491),
+    ('fiddle', 1288),
+    ('filmcue', 908),
+    ('fingerbs1', 289),
+    ('fingerbs2', 290),
+    ('fingerbs3', 291),
+    ('fingerdbass', 1380),
+    ('fingeredbs', 1166),
+    ('fingermaster', 287),
+    ('fingerslap', 1167),
+    ('flangedream', 1015),
+    ('flangerep', 53),
+    ('flatbass', 353),
+    ('flazzylead', 753),
+    ('flippad', 694),
+    ('flkeyclick', 1307),
+    ('flugelhorn', 500),
+    ('flute', 1236),
+    ('flute', 1373),
+    ('fm777', 78),
+    ('fmchorusep', 1358),
+    ('fmep1', 47),
+    ('fmep2', 79),
+    ('fmep3', 80),
+    ('fmep4', 81),
+    ('fmepad', 108),
+    ('fmepmix', 77),
+    ('fmheaven', 195),
+    ('fmsaep', 1099),
+    ('fmsattack', 714),
+    ('fmsynbell', 188),
+    ('fmvox', 914),
+    ('fmwood', 218),
+    ('follow', 1009),
+    ('followme1', 579),
+    ('followme2', 580),
+    ('fonkyfonky', 107),
+    ('footsteps', 1339),
+    ('forsequence', 696),
+    ('foryourbreak', 808),
+    ('foundation', 312),
+    ('fredbarney', 759),
+    ('frenchhorns', 1216),
+    ('frendsbell', 187),
+    ('frendspad', 972),
+    ('frendssyn', 926),
+    ('fretlessbs', 1169),
+    ('fretlessbs1', 292),
+    ('fretlessbs2', 293),
+    ('fretlessbs3', 294),
+    ('frgilesaws', 705),
+    ('frhorn2', 1217),
+    ('frontiersyn', 680),
+    ('fulldrawfast', 1363),
+    ('fulldraworg', 117),
+    ('fulldraworg', 1361),
+    ('fulldrawslow', 1362),
+    ('fullsforza', 489),
+    ('fullstoporg', 116),
+    ('fullstrings', 434),
+    ('funkgt2', 1156),
+    ('funkgtr', 256),
+    ('funkpop', 1155),
+    ('funkyd', 173),
+    ('funkyline', 174),
+    ('fuzzgtr', 271),
+    ('fxmaltosax', 541),
+    ('fxpiano', 41),
+    ('fxworld', 826),
+    ('gangstrangs', 451),
+    ('garagebass1', 315),
+    ('garagebass2', 383),
+    ('gashedbass', 372),
+    ('gasp', 875),
+    ('giantsweep', 937),
+    ('glassorgan', 993),
+    ('glideiator', 378),
+    ('glocken', 198),
+    ('glockenspiel', 1113),
+    ('goblin', 1275),
+    ('gogrand', 1344),
+    ('gogrand2', 1347),
+    ('gograndpad', 1352),
+    ('gograndstr', 1351),
+    ('goodoldday', 552),
+    ('goodoldhit', 469),
+    ('gospeloohs', 894),
+    ('grainedbell', 203),
+    ('grandetuba', 503),
+    ('grandfm', 37),
+    ('grandhall', 23),
+    ('grandpipe', 156),
+    ('greenbullet', 233),
+    ('griggley', 588),
+    ('grittypad', 956),
+    ('grlead1', 558),
+    ('grlead2', 654),
+    ('groove007', 1069),
+    ('gtcutnoise', 1304),
+    ('gtfeedback', 1164),
+    ('gtfretnoise', 1303),
+    ('gtharmonics', 1163),
+    ('gtorgclean', 114),
+    ('gtorgstack', 112),
+    ('gtorgstd', 113),
+    ('guinguette', 230),
+    ('guitarpinch', 1159),
+    ('gunshot', 1340),
+    ('gwyopress', 591),
+    ('hallconcert', 13),
+    ('halopad', 1267),
+    ('hammer', 1176),
+    ('hardrockorg1', 110),
+    ('hardrockorg2', 111),
+    ('harmonica', 1139),
+    ('harmonmute', 496),
+    ('harp', 1188),
+    ('harpiness', 1038),
+    ('harpsichord', 1106),
+    ('harpsio', 1109),
+    ('harpsiw', 1108),
+    ('harpsyclavi', 181),
+    ('heartbeat', 1338),
+    ('heavenpad', 966),
+    ('helicopter', 1324),
+    ('henryix', 462),
+    ('hienergybs', 407),
+    ('highfive', 722),
+    ('hillside', 872),
+    ('himalayaice', 190),
+    ('himalayapipe', 1049),
+    ('hollow', 965),
+    ('honkytonk', 1095),
+    ('honkytonk', 1350),
+    ('honkytonk2', 1096),
+    ('hooveragain', 782),
+    ('hornchops', 494),
+    ('hornysax', 536),
+    ('horsegallop', 1316),
+    ('hotcoffee', 576),
+    ('hotsync', 575),
+    ('housechord', 475),
+    ('houzeclavi', 703),
+    ('howardslead', 638),
+    ('hpfslicer', 809),
+    ('hpfsweep', 740),
+    ('hugesoundmod', 961),
+    ('humankindnes', 996),
+    ('humming', 1201),
+    ('humpad', 1003),
+    ('hurtlinggtr', 278),
+    ('hybridstr1', 439),
+    ('hybridstr2', 440),
+    ('hyperjupiter', 616),
+    ('icepalace', 1059),
+    ('icerain', 1269),
+    ('icykeys', 227),
+    ('indacave', 474),
+    ('indagroove', 1070),
+    ('indiagarden', 957),
+    ('inthepass', 952),
+    ('intrusivebs', 399),
+    ('itopia', 1264),
+    ('jamisen', 1040),
+    ('jazzdoos', 884),
+    ('jazzgt', 1149),
+    ('jazzguitar1', 248),
+    ('jazzguitar2', 249),
+    ('jazzman', 1157),
+    ('jazzscat', 883),
+    ('jazzscat', 1368),
+    ('jazzyarps', 834),
+    ('jdpiano1', 30),
+    ('jdpiano2', 31),
+    ('jdpianostr', 32),
+    ('jdpoppad', 1012),
+    ('jetnoise', 853),
+    ('jetplane', 1331),
+    ('jp8000brass', 508),
+    ('jp8phase', 1013),
+    ('jpoctattack', 710),
+    ('jpopbrass', 511),
+    ('jpsawlead', 664),
+    ('jpstrings1', 980),
+    ('jpstrings2', 981),
+    ('jucysaw', 656),
+    ('jumpbrass', 1223),
+    ('jumpbrass', 1379),
+    ('jumppoly', 570),
+    ('junglebass', 385),
+    ('juno106brs', 531),
+    ('juno106bs', 351),
+    ('juno106str', 1018),
+    ('juno5th', 734),
+    ('juno60bass', 402),
+    ('junoacidbs', 318),
+    ('junoaltosax', 539),
+    ('junobanjo', 1044),
+    ('junobarisax', 545),
+    ('junobassoon', 551),
+    ('junobell', 202),
+    ('junobrass', 509),
+    ('junocelesta', 196),
+    ('junocrystal', 864),
+    ('junodmaj7', 736),
+    ('junodslice', 844),
+    ('junoehorn', 550),
+    ('junoflute', 546),
+    ('junoharm', 231),
+    ('junoharpsi', 182),
+    ('junokoto', 1041),
+    ('junolead', 569),
+    ('junomarimba', 216),
+    ('junonylon', 234),
+    ('junooboe', 549),
+    ('junopercorg', 119),
+    ('junopiano1', 3),
+    ('junopiano2', 4),
+    ('junopiccolo', 547),
+    ('junopoly', 682),
+    ('junopop', 1073),
+    ('junoreso', 331),
+    ('junositar1', 1026),
+    ('junositar2', 1027),
+    ('junosoftld', 635),
+    ('junosopsax', 537),
+    ('junosteeldr', 222),
+    ('junostrings', 410),
+    ('junosynvox', 900),
+    ('junotnrsax', 543),
+    ('junotrance1', 744),
+    ('junotrance2', 748),
+    ('junotuba', 504),
+    ('jupiterlead1', 560),
+    ('jupiterlead2', 642),
+    ('jupiterlead3', 643),
+    ('jupitermoves', 1019),
+    ('jvstrings', 424),
+    ('jxwarmpad', 1023),
+    ('kalimba', 1286),
+    ('kalimbells', 201),
+    ('keepgoing', 838),
+    ('keeprunning', 835),
+    ('kickinbass', 375),
+    ('killerbeez', 773),
+    ('kindakurt', 260),
+    ('koto', 1284),
+    ('larsen', 273),
+    ('lasergun', 1342),
+    ('laughing', 1335),
+    ('layers', 22),
+    ('lazerpoints', 848),
+    ('legatosaw', 589),
+    ('legatotkno', 671),
+    ('leoep', 74),
+    ('letstalk', 915),
+    ('lobass', 382),
+    ('lochscape', 1051),
+    ('locovoco', 391),
+    ('lofihit', 472),
+    ('lofipercorg', 146),
+    ('lofisequence', 761),
+    ('lofitb', 395),
+    ('lonesomeroad', 91),
+    ('longdistance', 1047),
+    ('longstacc', 444),
+    ('lonizer', 818),
+    ('lostparadise', 1061),
+    ('lostvoices', 911),
+    ('loudgtr', 266),
+    ('loungekit', 1078),
+    ('lowbass', 311),
+    ('lowbeats', 858),
+    ('lowfatbass', 358),
+    ('lownzbass', 408),
+    ('lpdist', 277),
+    ('machinegun', 1341),
+    ('magicchime', 850),
+    ('magicwave', 877),
+    ('magnetic5th', 723),
+    ('mandolin', 1147),
+    ('marcato', 425),
+    ('marimba', 1117),
+    ('marimbaw', 1118),
+    ('maskedopera', 159),
+    ('mc404bass', 349),
+    ('mctbbass', 389),
+    ('meditatepno', 40),
+    ('megasync', 846),
+    ('mellowgrand', 1349),
+    ('mellowtron', 454),
+    ('mellowtune', 14),
+    ('melodicdrums', 762),
+    ('melotom1', 1297),
+    ('melotom2', 1298),
+    ('memorypluck', 697),
+    ('metalicbass', 698),
+    ('metalpad', 1266),
+    ('metalswell', 962),
+    ('mewlead', 650),
+    ('mgsquare', 1244),
+    ('mgsuboscbs', 363),
+    ('midsawld', 625),
+    ('midtonegtr', 1153),
+    ('mild2sawld', 649),
+    ('minigrowl', 674),
+    ('minilike', 348),
+    ('minorthirds', 825),
+    ('mistover5ths', 955),
+    ('mixdrum1', 1076),
+    ('mixdrum2', 1077),
+    ('mixhit1', 470),
+    ('mixhit2', 471),
+    ('mk2stgphsr', 96),
+    ('mks50synbs', 371),
+    ('mobilephone', 1067),
+    ('modchord', 476),
+    ('moddare', 938),
+    ('modlead', 666),
+    ('modscanner', 873),
+    ('modular', 730),
+    ('modulatedld', 658),
+    ('mogulatorld', 593),
+    ('monkeyarpg', 763),
+    ('monkeystr', 438),
+    ('monopiano1', 15),
+    ('monopiano2', 16),
+    ('monopiano3', 17),
+    ('monsoon', 1042),
+    ('monsterbass', 319),
+    ('moogybass1', 329),
+    ('moogybass2', 330),
+    ('moonsynth', 742),
+    ('morningstar', 902),
+    ('morpher', 780),
+    ('motionbass', 842),
+    ('moviescene', 453),
+    ('movinpad', 1007),
+    ('mrfourier', 793),
+    ('muboxpad', 192),
+    ('muffledmg', 398),
+    ('musicbells', 184),
+    ('musicbox', 1114),
+    ('musicbox1', 199),
+    ('musicbox2', 200),
+    ('mutedgt', 1154),
+    ('mutedtrumpet', 1214),
+    ('mutetp', 495),
+    ('mutetrumpet2', 1215),
+    ('mysticstr', 992),
+    ('nakedlead', 662),
+    ('naturallead', 1249),
+    ('neors202', 934),
+    ('neositar', 1029),
+    ('neurodrone', 951),
+    ('newagefrtls', 296),
+    ('newplanetz', 852),
+    ('newyearday', 941),
+    ('nicekalimba', 1035),
+    ('niceoctgtr', 261),
+    ('noizerus', 778),
+    ('northstrings', 983),
+    ('notabass', 366),
+    ('nuepicpad', 1014),
+    ('nusoundtrack', 963),
+    ('nutrancex', 827),
+    ('nylondelay', 244),
+    ('nylongt2', 1144),
+    ('nylongto', 1143),
+    ('nylongtr', 239),
+    ('nylongtre4', 1082),
+    ('nylonstrgt', 1141),
+    ('ob2saw', 1247),
+    ('obaaahs', 999),
+    ('oboe', 1231),
+    ('obrezopad', 935),
+    ('obstrings1', 986),
+    ('obstrings2', 987),
+    ('ocarina', 1242),
+    ('oceanicpad', 1020),
+    ('octajuice', 571),
+    ('octasaw', 572),
+    ('octasync1', 573),
+    ('octasync2', 574),
+    ('octsearinggt', 269),
+    ('octstrings', 436),
+    ('octsynbrass', 1222),
+    ('octunison', 711),
+    ('oilcanbass', 320),
+    ('oildrumbass', 376),
+    ('onair', 626),
+    ('ooze', 904),
+    ('orchestra', 1192),
+    ('orchestrahit', 1204),
+    ('orchhorns', 459),
+    ('orchpizz', 448),
+    ('orgaenia', 1057),
+    ('organ1', 1124),
+    ('organ2', 1128),
+    ('organ3', 1131),
+    ('organicpad', 1002),
+    ('outofsortz', 856),
+    ('overd6', 168),
+    ('overdrivegt', 1158),
+    ('oxbrass', 518),
+    ('padpulses', 821),
+    ('panflute', 1238),
+    ('panningfrmnt', 812),
+    ('panpipes', 1045),
+    ('paradise', 909),
+    ('passingby', 847),
+    ('patisaway', 1034),
+    ('pbass', 297),
+    ('peakarpsine', 637),
+    ('pedalsquare', 335),
+    ('pedalsteel', 1150),
+    ('pedalsynbs', 321),
+    ('pemadec5', 1083),
+    ('percorgan', 1130),
+    ('percorgan', 1364),
+    ('percorgan1', 115),
+    ('percorgan2', 136),
+    ('periscope', 738),
+    ('pgchimes', 944),
+    ('phaseclavi1', 162),
+    ('phaseclavi2', 163),
+    ('phaseep', 1355),
+    ('phaseep1', 51),
+    ('phaseep2', 68),
+    ('phaselead', 577),
+    ('phaserpad1', 920),
+    ('phaserpad2', 991),
+    ('phasestgep', 52),
+    ('phasestrings', 921),
+    ('phatpad', 990),
+    ('phatstrings', 964),
+    ('phillyhit', 466),
+    ('phonoorgan', 139),
+    ('piano1', 1088),
+    ('piano1w', 1089),
+    ('piano2', 1091),
+    ('piano2w', 1092),
+    ('piano3', 1093),
+    ('piano3w', 1094),
+    ('pianooz', 39),
+    ('pianopad1', 18),
+    ('pianopad2', 19),
+    ('pianostr1', 7),
+    ('pianostr2', 21),
+    ('pianovox', 20),
+    ('piccolo', 1235),
+    ('pickbass1', 300),
+    ('pickbass2', 301),
+    ('pickedbass', 1168),
+    ('pickgtr', 253),
+    ('pipedream', 1052),
+    ('pipeorgan1', 157),
+    ('pipeorgan2', 158),
+    ('pizzicato', 414),
+    ('pizzicatostr', 1187),
+    ('pizzlong', 445),
+    ('pizzstacc', 415),
+    ('plugged', 263),
+    ('plugngig1', 258),
+    ('plugngig2', 259),
+    ('polarmorn', 942),
+    ('polarnight', 953),
+    ('polybrass', 507),
+    ('polysweepnz', 867),
+    ('polysynth', 1262),
+    ('popbell', 193),
+    ('popep', 88),
+    ('poporgan1', 121),
+    ('poporgan2', 122),
+    ('poporgan3', 123),
+    ('poppad', 973),
+    ('poppiano1', 9),
+    ('poppiano2', 10),
+    ('poppiano3', 26),
+    ('poppiano4', 27),
+    ('popstr1', 420),
+    ('popstr2', 421),
+    ('popstr3', 422),
+    ('portalead1', 554),
+    ('portalead2', 555),
+    ('positiveorg', 153),
+    ('positiveorg', 1366),
+    ('powerchord', 279),
+    ('powersynth', 781),
+    ('premasshum', 236),
+    ('pressyn', 721),
+    ('probrass', 1221),
+    ('profatld', 562),
+    ('protons', 815),
+    ('psychoep1', 98),
+    ('psychoep2', 99),
+    ('pufforgan', 1136),
+    ('pulsator', 841),
+    ('pulsatron', 845),
+    ('pulseclav', 1111),
+    ('pulseclavi', 165),
+    ('pulselead1', 623),
+    ('pulselead2', 624),
+    ('pulstarld', 661),
+    ('punch', 1337),
+    ('punchmg1', 370),
+    ('punchmg2', 354),
+    ('punker1', 264),
+    ('punker2', 280),
+    ('pureep', 43),
+    ('pureeptrem', 44),
+    ('purenylon', 243),
+    ('puresquare', 587),
+    ('purevibe', 213),
+    ('purewurly1', 48),
+    ('purewurly2', 82),
+    ('purewurly3', 83),
+    ('pwmclavi', 176),
+    ('qbass', 373),
+    ('qdualsaws', 592),
+    ('quietriver', 1036),
+    ('radiopiano', 28),
+    ('rain', 1309),
+    ('randommood', 417),
+    ('rapsody', 25),
+    ('raversawake', 784),
+    ('ravtune', 707),
+    ('rbbass1', 326),
+    ('rbbass2', 327),
+    ('rbbass3', 328),
+    ('rbbass4', 356),
+    ('rbbass5', 364),
+    ('rbbass6', 365),
+    ('rbbass7', 386),
+    ('rborgan1', 141),
+    ('rborgan2', 142),
+    ('rbsoftpad', 989),
+    ('rbtrild1', 640),
+    ('rbtrild2', 641),
+    ('reanimation', 830),
+    ('recorder', 1237),
+    ('reedorgan', 1135),
+    ('remember', 104),
+    ('repertition', 772),
+    ('resoclavi', 178),
+    ('resolead', 657),
+    ('resopad', 968),
+    ('resosawld', 672),
+    ('resoseqsaw', 768),
+    ('resosweepdn', 865),
+    ('resosweepup', 876),
+    ('resosynbs1', 316),
+    ('resosynbs2', 367),
+    ('retroscifi', 849),
+    ('return2base', 288),
+    ('reversecym', 1302),
+    ('reversesweep', 960),
+    ('rhythmic5th', 794),
+    ('rhythmnb', 138),
+    ('richfretless', 295),
+    ('richgrand1', 5),
+    ('richgrand2', 6),
+    ('ringmodlead', 608),
+    ('ringyvibes', 214),
+    ('robotscifi', 882),
+    ('rochnoorg', 140),
+    ('rockindly', 265),
+    ('rokkinpf', 29),
+    ('roomybass', 298),
+    ('roundsqr', 700),
+    ('rssspinnrc4', 1085),
+    ('rtrance', 749),
+    ('rubberbass2', 1179),
+    ('sadancepno', 33),
+    ('sadceremony', 910),
+    ('saepiano1', 46),
+    ('saepiano2', 75),
+    ('saeptrem', 76),
+    ('saharastr', 416),
+    ('sampleopera', 907),
+    ('sandpad', 959),
+    ('santur', 1123),
+    ('saraswatirvr', 1030),
+    ('saturnholida', 950),
+    ('saturnrings', 945),
+    ('sawkeystep', 727),
+    ('sawlead', 1377),
+    ('sawlead1', 563),
+    ('sawlead2', 564),
+    ('sawlead3', 565),
+    ('sawlead4', 566),
+    ('sawlead5', 567),
+    ('sawlead6', 568),
+    ('sawmgbass1', 338),
+    ('sawmgbass2', 362),
+    ('sawstack', 704),
+    ('sawwave', 1246),
+    ('saxsect1', 534),
+    ('saxsect2', 535),
+    ('sc303', 756),
+    ('scare', 871),
+    ('scatter', 857),
+    ('scratch', 1322),
+    ('screaming', 1336),
+    ('searingcosm', 268),
+    ('searinggtr', 267),
+    ('seashore', 1308),
+    ('seqpad1', 822),
+    ('seqpad2', 1008),
+    ('seqsaw', 767),
+    ('sequencedsaw', 1250),
+    ('sfxkit', 1383),
+    ('sh101bs1', 325),
+    ('sh101bs2', 369),
+    ('sh101vibe', 405),
+    ('sh1bass', 368),
+    ('sh2bs', 324),
+    ('sh2lead', 655),
+    ('shakuhachi', 1240),
+    ('shakulead', 670),
+    ('shamisen', 1283),
+    ('shanai', 1289),
+    ('shangrila', 878),
+    ('shankhg4', 1084),
+    ('shapeofx', 797),
+    ('shapeurmusic', 798),
+    ('shbass', 393),
+    ('shortdetune', 695),
+    ('shroomy', 777),
+    ('shsawtooth', 313),
+    ('shsqrlead', 633),
+    ('shsquare', 334),
+    ('shvoc', 869),
+    ('shysoloist', 651),
+    ('silkbrspad', 527),
+    ('silkpad', 975),
+    ('silkyjp', 526),
+    ('simpletutti', 486),
+    ('simplybasic', 387),
+    ('sinelead1', 629),
+    ('sinelead2', 630),
+    ('sinemagic', 843),
+    ('sinep', 106),
+    ('sinepad', 1261),
+    ('sinetific', 634),
+    ('siren', 1329),
+    ('sitar', 1280),
+    ('sitar2', 1281),
+    ('sitarbaby', 1028),
+    ('sitaronc', 1025),
+    ('skydiver', 1039),
+    ('slapbass', 308),
+    ('slapbass1', 1170),
+    ('slapbass2', 1171),
+    ('slapwfx', 309),
+    ('sleeper', 1058),
+    ('slicedchoir', 810),
+    ('slicedlead', 673),
+    ('slowsawstr', 969),
+    ('slowstrings', 1194),
+    ('slowviolin', 1182),
+    ('smallstr', 430),
+    ('smearhit1', 467),
+    ('smearhit2', 468),
+    ('smokyorgan', 149),
+    ('smoothbass', 352),
+    ('snappyclavi', 180),
+    ('sneakyleady', 669),
+    ('snugbass', 305),
+    ('soapopera', 150),
+    ('softbrass', 517),
+    ('softbreeze', 979),
+    ('softlead', 646),
+    ('softmarimba', 217),
+    ('softnylngtr', 240),
+    ('softnylngtr', 1375),
+    ('softobpad', 967),
+    ('softorch1', 460),
+    ('softorch2', 461),
+    ('softpad', 977),
+    ('softsawld', 647),
+    ('softsynbass', 350),
+    ('softsynbrass', 524),
+    ('softtb', 497),
+    ('sogood', 247),
+    ('solobone', 499),
+    ('solonzpeaker', 639),
+    ('solosawld', 556),
+    ('solosopsax', 538),
+    ('solotb', 498),
+    ('solotp', 492),
+    ('solovox', 1255),
+    ('sonicvampire', 610),
+    ('sopranosax', 1227),
+    ('sorry4thedly', 795),
+    ('sostaccato', 443),
+    ('soundonsound', 874),
+    ('soundstrange', 861),
+    ('soundtrack', 1270),
+    ('spaceecho', 881),
+    ('spacevoice', 1263),
+    ('spaciouspad', 1011),
+    ('spitflugel', 501),
+    ('spookylead', 636),
+    ('sqrdiamond', 645),
+    ('sqrlead1', 631),
+    ('sqrlead2', 632),
+    ('sqrpad', 974),
+    ('sqrseqence', 586),
+    ('squarebass', 339),
+    ('squarewave', 1243),
+    ('squeepy', 687),
+    ('squeezeme', 228),
+    ('staccato', 413),
+    ('staccheaven', 677),
+    ('stackedbrs', 533),
+    ('stacktpsect', 480),
+    ('stagecabinet', 60),
+    ('stageep1', 58),
+    ('stageep2', 59),
+    ('stageeptrem', 61),
+    ('stagephazer', 45),
+    ('stakdraworg', 118),
+    ('standardkit', 1382),
+    ('starship', 1332),
+    ('startheme', 1279),
+    ('steamedsawz', 706),
+    ('steelbody', 1148),
+    ('steeldrums', 1292),
+    ('steelstrgt', 1145),
+    ('stepice', 210),
+    ('stepin', 836),
+    ('steppitshift', 820),
+    ('steptrance', 801),
+    ('stereobrass', 490),
+    ('stfmep', 1103),
+    ('stimulation', 611),
+    ('stormbass', 403),
+    ('storyharp', 1060),
+    ('strangeland', 868),
+    ('stratgtr1', 254),
+    ('stratgtr2', 255),
+    ('stratseqnce', 257),
+    ('stream', 1312),
+    ('stringens', 409),
+    ('strings', 1191),
+    ('strings', 1371),
+    ('strings1', 426),
+    ('strings2', 427),
+    ('strings3', 437),
+    ('stringship', 929),
+    ('stringslap', 1305),
+    ('stringspad', 988),
+    ('stringsrus', 932),
+    ('stringz101', 428),
+    ('strobe', 791),
+    ('strobex', 792),
+    ('strobot', 790),
+    ('strstaccmp', 442),
+    ('stsoftep', 1098),
+    ('subsonic', 384),
+    ('sugarsynth', 678),
+    ('summerpad', 971),
+    ('summerstr', 681),
+    ('superdistld', 144),
+    ('superdistorg', 143),
+    ('supergdx', 374),
+    ('supersaw', 523),
+    ('supersawslow', 683),
+    ('supersynpad', 1378),
+    ('supersynstr', 922),
+    ('sweeplead', 689),
+    ('sweeppad', 1268),
+    ('sweet80s', 1071),
+    ('sweethouse', 737),
+    ('sweetkeys', 899),
+    ('symphonika', 464),
+    ('synbrass1', 519),
+    ('synbrass2', 520),
+    ('synbrasssfz', 1225),
+    ('syncalliope', 1251),
+    ('synchrolead', 601),
+    ('syncldmono', 603),
+    ('synclead', 559),
+    ('syncmodulate', 604),
+    ('synctank', 602),
+    ('synergymlt', 221),
+    ('synlead1', 597),
+    ('synlead2', 598),
+    ('synmallet', 1272),
+    ('synopera', 890),
+    ('synorchmod', 720),
+    ('synstrings1', 984),
+    ('synstrings1', 1195),
+    ('synstrings2', 985),
+    ('synstrings2', 1197),
+    ('synstrings3', 1196),
+    ('synthbass1', 1172),
+    ('synthbass101', 1173),
+    ('synthbass2', 1177),
+    ('synthbrass1', 1220),
+    ('synthbrass2', 1224),
+    ('synthdrum', 1299),
+    ('synthforce', 799),
+    ('synthiens', 936),
+    ('synthifizz', 659),
+    ('synthkey', 679),
+    ('synvox', 1202),
+    ('synvox1', 896),
+    ('synvox2', 897),
+    ('taiko', 1295),
+    ('taishokoto', 1285),
+    ('talk2me', 913),
+    ('tbbooster', 719),
+    ('tbdistbs', 317),
+    ('tbsection', 481),
+    ('tbsequence', 755),
+    ('tbwah', 764),
+    ('technocraft', 1081),
+    ('technodream', 787),
+    ('technopizz', 788),
+    ('technotribe', 770),
+    ('teethygrit', 771),
+    ('teknogargle', 785),
+    ('tekydrop', 1031),
+    ('telephone1', 1318),
+    ('telephone2', 1319),
+    ('telstageep', 54),
+    ('tempest', 717),
+    ('tenorsax', 1229),
+    ('terranostra', 970),
+    ('theramax1', 622),
+    ('theramax2', 652),
+    ('therasqu', 653),
+    ('thicksteel', 245),
+    ('throbulax', 817),
+    ('thumbup', 302),
+    ('thunder', 1310),
+    ('timpani', 1190),
+    ('timpanilow', 1062),
+    ('timpaniroll', 1063),
+    ('tineep', 73),
+    ('tineeppad', 100),
+    ('tinklebell', 1290),
+    ('tmtseqpad', 807),
+    ('touchdrive', 275),
+    ('toybox', 226),
+    ('tptbsect', 482),
+    ('tptstmbs', 487),
+    ('train', 1330),
+    ('tranceformer', 775),
+    ('tranceiver', 786),
+    ('trancesplit', 800),
+    ('trancysynth', 745),
+    ('trancyx', 747),
+    ('transistorbs', 401),
+    ('tremepstage', 1356),
+    ('tremolostr', 1186),
+    ('tremorgan', 1125),
+    ('tremovibe', 274),
+    ('trevorspad', 832),
+    ('tri5thpad', 1006),
+    ('trilead1', 627),
+    ('trilead2', 628),
+    ('tristar', 667),
+    ('trombone', 1210),
+    ('trombone', 1374),
+    ('trombone2', 1211),
+    ('tronicstr', 455),
+    ('troubadorens', 1032),
+    ('trumpet', 1208),
+    ('trythis', 851),
+    ('tuba', 1213),
+    ('tubbymute', 303),
+    ('tubularbell', 206),
+    ('tubularbell', 1120),
+    ('tubyruesday', 209),
+    ('uhmmm', 901),
+    ('ukulele', 1142),
+    ('ultiacbass', 284),
+    ('unclemartin', 237),
+    ('unisonbass', 380),
+    ('unplugit', 392),
+    ('velobrass1', 1226),
+    ('velspdwurly', 50),
+    ('vibeep', 105),
+    ('vibetrem1', 211),
+    ('vibetrem2', 212),
+    ('vibraphone', 1115),
+    ('vibraphone', 1376),
+    ('vibraphonew', 1116),
+    ('vintageclavi', 166),
+    ('vintageep', 1354),
+    ('vintageep1', 55),
+    ('vintageep2', 56),
+    ('vintageep3', 57),
+    ('vintagetine', 95),
+    ('vintagolizer', 617),
+    ('viola', 1183),
+    ('violin', 1181),
+    ('violin', 1372),
+    ('violinlead', 665),
+    ('virtualhuman', 789),
+    ('virtualrnbs1', 337),
+    ('virtualrnbs2', 361),
+    ('vkhold4speed', 120),
+    ('vlspizzhall', 446),
+    ('vocdichr', 917),
+    ('vocdiens', 918),
+    ('vocdirobt', 916),
+    ('vocoriff', 840),
+    ('vodkakordion', 229),
+    ('voicedoo', 1369),
+    ('voiceoohs', 1200),
+    ('voxchopper', 831),
+    ('voxpad', 1004),
+    ('voxpad1', 892),
+    ('voxpad2', 893),
+    ('voyager', 928),
+    ('vulcanopad', 1000),
+    ('waitnoutside', 859),
+    ('warmpad', 1260),
+    ('warmresopad', 976),
+    ('warmstrings', 431),
+    ('warmtune', 12),
+    ('waspylead1', 578),
+    ('waspylead2', 660),
+    ('waspysynth', 685),
+    ('wavingtb303', 765),
+    ('wetatax', 702),
+    ('wetnylngtr', 241),
+    ('wezcoast', 615),
+    ('whistle', 1241),
+    ('whitestrings', 423),
+    ('wideacgtr', 246),
+    ('widesynbrs', 506),
+    ('wind', 1311),
+    ('windchimes', 1323),
+    ('windpad', 994),
+    ('windstr1', 456),
+    ('windstr2', 457),
+    ('windsynld', 557),
+    ('windwood', 553),
+    ('windysynth', 525),
+    ('wineglass', 191),
+    ('wiredsynth', 1055),
+    ('wirelead', 1254),
+    ('wiresync', 612),
+    ('woodblock', 1293),
+    ('wurly', 1100),
+    ('wurlypad', 101),
+    ('wurlytrem', 1357),
+    ('wurlytrem1', 49),
+    ('wurlytrem2', 84),
+    ('wurlytrem3', 85),
+    ('xhallstr', 418),
+    ('xpanda', 726),
+    ('xpandbrass1', 521),
+    ('xpandbrass2', 522),
+    ('xpercorgan', 137),
+    ('xphorn', 502),
+    ('xptnrbrethy', 542),
+    ('xpulselead', 648),
+    ('xracer', 718),
+    ('xsawbrass', 528),
+    ('xsinkdelay', 599),
+    ('xstrsection', 435),
+    ('xtatic', 712),
+    ('xylo', 219),
+    ('xylophone', 1119),
+    ('xylosizer', 224),
+    ('yangqin', 1189),
+    ('yzagain', 752),
+    ('zapb3c4', 866),
+)
+
+# category -> rows
+CATEGORY_INDEX = {
+    'PNO': (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 1088, 1089, 1090, 1091, 1092, 1095, 1096, 1344, 1345, 1346, 1347, 1348, 1349, 1350, 1351, 1352),
+    'EP': (43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 1093, 1094, 1097, 1098, 1099, 1100, 1101, 1102, 1103, 1104, 1105, 1354, 1355, 1356, 1357, 1358),
+    'ORG': (110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136, 137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150, 151, 152, 153, 154, 155, 156, 157, 158, 159, 1124, 1125, 1126, 1127, 1128, 1129, 1130, 1131, 1132, 1133, 1134, 1135, 1136, 1361, 1362, 1363, 1364, 1365, 1366),
+    'KEY': (160, 161, 162, 163, 164, 165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178, 179, 180, 181, 182, 183, 1106, 1107, 1108, 1109, 1110, 1111, 1112, 1353, 1360),
+    'BEL': (184, 185, 186, 187, 188, 189, 190, 191, 192, 193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206, 207, 208, 209, 210, 1113, 1114, 1120, 1121, 1122, 1271, 1272, 1290, 1359, 1376),
+    'MLT': (211, 212, 213, 214, 215, 216, 217, 218, 219, 220, 221, 222, 223, 224, 225, 226, 227, 1115, 1116, 1117, 1118, 1119, 1292),
+    'ACD': (228, 229, 230, 1137, 1138, 1140, 1367),
+    'HRM': (231, 232, 233, 1139),
+    'AGT': (234, 235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 1141, 1142, 1143, 1144, 1145, 1146, 1147, 1148, 1273, 1303, 1304, 1305, 1375),
+    'EGT': (248, 249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262, 1149, 1150, 1151, 1152, 1153, 1154, 1155, 1156, 1157, 1163, 1164),
+    'DGT': (263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276, 277, 278, 279, 280, 1158, 1159, 1160, 1161, 1162),
+    'BS': (281, 282, 283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304, 305, 306, 307, 308, 309, 310, 1165, 1166, 1167, 1168, 1169, 1170, 1171, 1380, 1381),
+    'SBS': (311, 312, 313, 314, 315, 316, 317, 318, 319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332, 333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360, 361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377, 378, 379, 380, 381, 382, 383, 384, 385, 386, 387, 388, 389, 390, 391, 392, 393, 394, 395, 396, 397, 398, 399, 400, 401, 402, 403, 404, 405, 406, 407, 408, 1172, 1173, 1174, 1175, 1176, 1177, 1178, 1179, 1180),
+    'STR': (409, 410, 411, 412, 413, 414, 415, 416, 417, 418, 419, 420, 421, 422, 423, 424, 425, 426, 427, 428, 429, 430, 431, 432, 433, 434, 435, 436, 437, 438, 439, 440, 441, 442, 443, 444, 445, 446, 447, 448, 449, 450, 451, 452, 453, 454, 455, 1181, 1182, 1183, 1184, 1185, 1186, 1187, 1191, 1193, 1194, 1195, 1196, 1288, 1371, 1372),
+    'ORC': (456, 457, 458, 459, 460, 461, 462, 463, 464, 1192),
+    'HIT': (465, 466, 467, 468, 469, 470, 471, 472, 473, 474, 475, 476, 477, 1204, 1205, 1206, 1207),
+    'BRS': (478, 479, 480, 481, 482, 483, 484, 485, 486, 487, 488, 489, 490, 491, 492, 493, 494, 495, 496, 497, 498, 499, 500, 501, 502, 503, 504, 1208, 1209, 1210, 1211, 1212, 1213, 1214, 1215, 1216, 1217, 1218, 1219, 1374, 1379),
+    'SBR': (505, 506, 507, 508, 509, 510, 511, 512, 513, 514, 515, 516, 517, 518, 519, 520, 521, 522, 523, 524, 525, 526, 527, 528, 529, 530, 531, 532, 533, 1220, 1221, 1222, 1223, 1224, 1225, 1226),
+    'SAX': (534, 535, 536, 537, 538, 539, 540, 541, 542, 543, 544, 545, 1227, 1228, 1229, 1230),
+    'FLT': (546, 547, 1235, 1236, 1237, 1238, 1239, 1241, 1242, 1373),
+    'WND': (548, 549, 550, 551, 552, 553, 1231, 1232, 1233, 1234),
+    'HLD': (554, 555, 556, 557, 558, 559, 560, 561, 562, 563, 564, 565, 566, 567, 568, 569, 570, 571, 572, 573, 574, 575, 576, 577, 578, 579, 580, 581, 582, 583, 584, 585, 586, 587, 588, 589, 590, 591, 592, 593, 594, 595, 596, 597, 598, 599, 600, 601, 602, 603, 604, 605, 606, 607, 608, 609, 610, 611, 612, 613, 614, 615, 616, 617, 618, 619, 620, 1243, 1244, 1245, 1246, 1247, 1248, 1249, 1250, 1253, 1254, 1256, 1257, 1258),
+    'SLD': (621, 622, 623, 624, 625, 626, 627, 628, 629, 630, 631, 632, 633, 634, 635, 636, 637, 638, 639, 640, 641, 642, 643, 644, 645, 646, 647, 648, 649, 650, 651, 652, 653, 654, 655, 656, 657, 658, 659, 660, 661, 662, 663, 664, 665, 666, 667, 668, 669, 670, 671, 672, 673, 674, 675, 676, 1251, 1252, 1255),
+    'SYN': (677, 678, 679, 680, 681, 682, 683, 684, 685, 686, 687, 688, 689, 690, 691, 692, 693, 694, 695, 696, 697, 698, 699, 700, 701, 702, 703, 704, 705, 706, 707, 708, 709, 710, 711, 712, 713, 714, 715, 716, 717, 718, 719, 720, 721, 722, 723, 724, 725, 726, 727, 728, 729, 730, 731, 732, 733, 734, 735, 1259, 1262, 1269, 1274, 1377, 1378),
+    'TEK': (736, 737, 738, 739, 740, 741, 742, 743, 744, 745, 746, 747, 748, 749, 750, 751, 752, 753, 754, 755, 756, 757, 758, 759, 760, 761, 762, 763, 764, 765, 766, 767, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779, 780, 781, 782, 783, 784, 785, 786, 787, 788),
+    'PLS': (789, 790, 791, 792, 793, 794, 795, 796, 797, 798, 799, 800, 801, 802, 803, 804, 805, 806, 807, 808, 809, 810, 811, 812, 813, 814, 815, 816, 817, 818, 819, 820, 821, 822, 823, 824, 825, 826, 827, 828, 829, 830, 831, 832, 833, 834, 835, 836, 837, 838, 839, 840, 841, 842, 843, 844, 845, 846, 1275),
+    'FX': (847, 848, 849, 850, 851, 852, 853, 854, 855, 856, 857, 858, 859, 860, 861, 862, 863, 864, 865, 866, 867, 868, 869, 870, 871, 872, 873, 874, 875, 876, 877, 878, 879, 880, 881, 882, 1306, 1307),
+    'VOX': (883, 884, 885, 886, 887, 888, 889, 890, 891, 892, 893, 894, 895, 896, 897, 898, 899, 900, 901, 902, 903, 904, 905, 906, 907, 908, 909, 910, 911, 912, 913, 914, 915, 916, 917, 918, 1198, 1199, 1200, 1201, 1202, 1203, 1263, 1264, 1368, 1369, 1370),
+    'BPD': (919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 930, 931, 932, 933, 934, 935, 936, 937, 938, 939, 940, 941, 942, 943, 944, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 1266, 1267, 1276, 1277, 1278, 1279),
+    'SPD': (965, 966, 967, 968, 969, 970, 971, 972, 973, 974, 975, 976, 977, 978, 979, 980, 981, 982, 983, 984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 996, 997, 998, 999, 1000, 1001, 1002, 1003, 1004, 1005, 1006, 1007, 1008, 1009, 1010, 1011, 1012, 1013, 1014, 1015, 1016, 1017, 1018, 1019, 1020, 1021, 1022, 1023, 1024, 1197, 1260, 1261, 1265, 1268, 1270),
+    'PLK': (1025, 1026, 1027, 1028, 1029, 1030, 1031, 1032, 1033, 1034, 1035, 1036, 1037, 1038, 1039, 1040, 1041, 1042, 1043, 1123, 1188, 1189, 1280, 1281, 1283, 1284, 1285, 1286),
+    'FRT': (1044, 1282),
+    'ETH': (1045, 1046, 1047, 1048, 1049, 1050, 1051, 1052, 1053, 1054, 1055, 1056, 1057, 1058, 1059, 1060, 1061, 1240, 1287, 1289),
+    'PRC': (1062, 1063, 1064, 1190, 1291, 1293, 1294, 1295, 1296, 1297, 1298, 1299, 1300, 1301, 1302),
+    'SFX': (1065, 1066, 1067, 1308, 1309, 1310, 1311, 1312, 1313, 1314, 1315, 1316, 1317, 1318, 1319, 1320, 1321, 1322, 1323, 1324, 1325, 1326, 1327, 1328, 1329, 1330, 1331, 1332, 1333, 1334, 1335, 1336, 1337, 1338, 1339, 1340, 1341, 1342, 1343, 1383),
+    'BTS': (1068, 1069, 1070, 1071, 1072, 1073, 1074, 1075),
+    'DRM': (1076, 1077, 1382),
+    'CMB': (1078, 1079, 1080, 1081),
+    'SMP': (1082, 1083, 1084, 1085, 1086, 1087),
+}
+
+# (MSB, LSB, PC) -> row
+NUMBER_INDEX = {
+    (87, 64, 1): 0,
+    (87, 64, 2): 1,
+    (87, 64, 3): 2,
+    (87, 64, 4): 3,
+    (87, 64, 5): 4,
+    (87, 64, 6): 5,
+    (87, 64, 7): 6,
+    (87, 64, 8): 7,
+    (87, 64, 9): 8,
+    (87, 64, 10): 9,
+    (87, 64, 11): 10,
+    (87, 64, 12): 11,
+    (87, 64, 13): 12,
+    (87, 64, 14): 13,
+    (87, 64, 15): 14,
+    (87, 64, 16): 15,
+    (87, 64, 17): 16,
+    (87, 64, 18): 17,
+    (87, 64, 19): 18,
+    (87, 64, 20): 19,
+    (87, 64, 21): 20,
+    (87, 64, 22): 21,
+    (87, 64, 23): 22,
+    (87, 64, 24): 23,
+    (87, 64, 25): 24,
+    (87, 64, 26): 25,
+    (87, 64, 27): 26,
+    (87, 64, 28): 27,
+    (87, 64, 29): 28,
+    (87, 64, 30): 29,
+    (87, 64, 31): 30,
+    (87, 64, 32): 31,
+    (87, 64, 33): 32,
+    (87, 64, 34): 33,
+    (87, 64, 35): 34,
+    (87, 64, 36): 35,
+    (87, 64, 37): 36,
+    (87, 64, 38): 37,
+    (87, 64, 39): 38,
+    (87, 64, 40): 39,
+    (87, 64, 41): 40,
+    (87, 64, 42): 41,
+    (87, 64, 43): 42,
+    (87, 64, 44): 43,
+    (87, 64, 45): 44,
+    (87, 64, 46): 45,
+    (87, 64, 47): 46,
+    (87, 64, 48): 47,
+    (87, 64, 49): 48,
+    (87, 64, 50): 49,
+    (87, 64, 51): 50,
+    (87, 64, 52): 51,
+    (87, 64, 53): 52,
+    (87, 64, 54): 53,
+    (87, 64, 55): 54,
+    (87, 64, 56): 55,
+    (87, 64, 57): 56,
+    (87, 64, 58): 57,
+    (87, 64, 59): 58,
+    (87, 64, 60): 59,
+    (87, 64, 61): 60,
+    (87, 64, 62): 61,
+    (87, 64, 63): 62,
+    (87, 64, 64): 63,
+    (87, 64, 65): 64,
+    (87, 64, 66): 65,
+    (87, 64, 67): 66,
+    (87, 64, 68): 67,
+    (87, 64, 69): 68,
+    (87, 64, 70): 69,
+    (87, 64, 71): 70,
+    (87, 64, 72): 71,
+    (87, 64, 73): 72,
+    (87, 64, 74): 73,
+    (87, 64, 75): 74,
+    (87, 64, 76): 75,
+    (87, 64, 77): 76,
+    (87, 64, 78): 77,
+    (87, 64, 79): 78,
+    (87, 64, 80): 79,
+    (87, 64, 81): 80,
+    (87, 64, 82): 81,
+    (87, 64, 83): 82,
+    (87, 64, 84): 83,
+    (87, 64, 85): 84,
+    (87, 64, 86): 85,
+    (87, 64, 87): 86,
+    (87, 64, 88): 87,
+    (87, 64, 89): 88,
+    (87, 64, 90): 89,
+    (87, 64, 91): 90,
+    (87, 64, 92): 91,
+    (87, 64, 93): 92,
+    (87, 64, 94): 93,
+    (87, 64, 95): 94,
+    (87, 64, 96): 95,
+    (87, 64, 97): 96,
+    (87, 64, 98): 97,
+    (87, 64, 99): 98,
+    (87, 64, 100): 99,
+    (87, 64, 101): 100,
+    (87, 64, 102): 101,
+    (87, 64, 103): 102,
+    (87, 64, 104): 103,
+    (87, 64, 105): 104,
+    (87, 64, 106): 105,
+    (87, 64, 107): 106,
+    (87, 64, 108): 107,
+    (87, 64, 109): 108,
+    (87, 64, 110): 109,
+    (87, 64, 111): 110,
+    (87, 64, 112): 111,
+    (87, 64, 113): 112,
+    (87, 64, 114): 113,
+    (87, 64, 115): 114,
+    (87, 64, 116): 115,
+    (87, 64, 117): 116,
+    (87, 64, 118): 117,
+    (87, 64, 119): 118,
+    (87, 64, 120): 119,
+    (87, 64, 121): 120,
+    (87, 64, 122): 121,
+    (87, 64, 123): 122,
+    (87, 64, 124): 123,
+    (87, 64, 125): 124,
+    (87, 64, 126): 125,
+    (87, 64, 127): 126,
+    (87, 64, 128): 127,
+    (87, 65, 1): 128,
+    (87, 65, 2): 129,
+    (87, 65, 3): 130,
+    (87, 65, 4): 131,
+    (87, 65, 5): 132,
+    (87, 65, 6): 133,
+    (87, 65, 7): 134,
+    (87, 65, 8): 135,
+    (87, 65, 9): 136,
+    (87, 65, 10): 137,
+    (87, 65, 11): 138,
+    (87, 65, 12): 139,
+    (87, 65, 13): 140,
+    (87, 65, 14): 141,
+    (87, 65, 15): 142,
+    (87, 65, 16): 143,
+    (87, 65, 17): 144,
+    (87, 65, 18): 145,
+    (87, 65, 19): 146,
+    (87, 65, 20): 147,
+    (87, 65, 21): 148,
+    (87, 65, 22): 149,
+    (87, 65, 23): 150,
+    (87, 65, 24): 151,
+    (87, 65, 25): 152,
+    (87, 65, 26): 153,
+    (87, 65, 27): 154,
+    (87, 65, 28): 155,
+    (87, 65, 29): 156,
+    (87, 65, 30): 157,
+    (87, 65, 31): 158,
+    (87, 65, 32): 159,
+    (87, 65, 33): 160,
+    (87, 65, 34): 161,
+    (87, 65, 35): 162,
+    (87, 65, 36): 163,
+    (87, 65, 37): 164,
+    (87, 65, 38): 165,
+    (87, 65, 39): 166,
+    (87, 65, 40): 167,
+    (87, 65, 41): 168,
+    (87, 65, 42): 169,
+    (87, 65, 43): 170,
+    (87, 65, 44): 171,
+    (87, 65, 45): 172,
+    (87, 65, 46): 173,
+    (87, 65, 47): 174,
+    (87, 65, 48): 175,
+    (87, 65, 49): 176,
+    (87, 65, 50): 177,
+    (87, 65, 51): 178,
+    (87, 65, 52): 179,
+    (87, 65, 53): 180,
+    (87, 65, 54): 181,
+    (87, 65, 55): 182,
+    (87, 65, 56): 183,
+    (87, 65, 57): 184,
+    (87, 65, 58): 185,
+    (87, 65, 59): 186,
+    (87, 65, 60): 187,
+    (87, 65, 61): 188,
+    (87, 65, 62): 189,
+    (87, 65, 63): 190,
+    (87, 65, 64): 191,
+    (87, 65, 65): 192,
+    (87, 65, 66): 193,
+    (87, 65, 67): 194,
+    (87, 65, 68): 195,
+    (87, 65, 69): 196,
+    (87, 65, 70): 197,
+    (87, 65, 71): 198,
+    (87, 65, 72): 199,
+    (87, 65, 73): 200,
+    (87, 65, 74): 201,
+    (87, 65, 75): 202,
+    (87, 65, 76): 203,
+    (87, 65, 77): 204,
+    (87, 65, 78): 205,
+    (87, 65, 79): 206,
+    (87, 65, 80): 207,
+    (87, 65, 81): 208,
+    (87, 65, 82): 209,
+    (87, 65, 83): 210,
+    (87, 65, 84): 211,
+    (87, 65, 85): 212,
+    (87, 65, 86): 213,
+    (87, 65, 87): 214,
+    (87, 65, 88): 215,
+    (87, 65, 89): 216,
+    (87, 65, 90): 217,
+    (87, 65, 91): 218,
+    (87, 65, 92): 219,
+    (87, 65, 93): 220,
+    (87, 65, 94): 221,
+    (87, 65, 95): 222,
+    (87, 65, 96): 223,
+    (87, 65, 97): 224,
+    (87, 65, 98): 225,
+    (87, 65, 99): 226,
+    (87, 65, 100): 227,
+    (87, 65, 101): 228,
+    (87, 65, 102): 229,
+    (87, 65, 103): 230,
+    (87, 65, 104): 231,
+    (87, 65, 105): 232,
+    (87, 65, 106): 233,
+    (87, 65, 107): 234,
+    (87, 65, 108): 235,
+    (87, 65, 109): 236,
+    (87, 65, 110): 237,
+    (87, 65, 111): 238,
+    (87, 65, 112): 239,
+    (87, 65, 113): 240,
+    (87, 65, 114): 241,
+    (87, 65, 115): 242,
+    (87, 65, 116): 243,
+    (87, 65, 117): 244,
+    (87, 65, 118): 245,
+    (87, 65, 119): 246,
+    (87, 65, 120): 247,
+    (87, 65, 121): 248,
+    (87, 65, 122): 249,
+    (87, 65, 123): 250,
+    (87, 65, 124): 251,
+    (87, 65, 125): 252,
+    (87, 65, 126): 253,
+    (87, 65, 127): 254,
+    (87, 65, 128): 255,
+    (87, 66, 1): 256,
+    (87, 66, 2): 257,
+    (87, 66, 3): 258,
+    (87, 66, 4): 259,
+    (87, 66, 5): 260,
+    (87, 66, 6): 261,
+    (87, 66, 7): 262,
+    (87, 66, 8): 263,
+    (87, 66, 9): 264,
+    (87, 66, 10): 265,
+    (87, 66, 11): 266,
+    (87, 66, 12): 267,
+    (87, 66, 13): 268,
+    (87, 66, 14): 269,
+    (87, 66, 15): 270,
+    (87, 66, 16): 271,
+    (87, 66, 17): 272,
+    (87, 66, 18): 273,
+    (87, 66, 19): 274,
+    (87, 66, 20): 275,
+    (87, 66, 21): 276,
+    (87, 66, 22): 277,
+    (87, 66, 23): 278,
+    (87, 66, 24): 279,
+    (87, 66, 25): 280,
+    (87, 66, 26): 281,
+    (87, 66, 27): 282,
+    (87, 66, 28): 283,
+    (87, 66, 29): 284,
+    (87, 66, 30): 285,
+    (87, 66, 31): 286,
+    (87, 66, 32): 287,
+    (87, 66, 33): 288,
+    (87, 66, 34): 289,
+    (87, 66, 35): 290,
+    (87, 66, 36): 291,
+    (87, 66, 37): 292,
+    (87, 66, 38): 293,
+    (87, 66, 39): 294,
+    (87, 66, 40): 295,
+    (87, 66, 41): 296,
+    (87, 66, 42): 297,
+    (87, 66, 43): 298,
+    (87, 66, 44): 299,
+    (87, 66, 45): 300,
+    (87, 66, 46): 301,
+    (87, 66, 47): 302,
+    (87, 66, 48): 303,
+    (87, 66, 49): 304,
+    (87, 66, 50): 305,
+    (87, 66, 51): 306,
+    (87, 66, 52): 307,
+    (87, 66, 53): 308,
+    (87, 66, 54): 309,
+    (87, 66, 55): 310,
+    (87, 66, 56): 311,
+    (87, 66, 57): 312,
+    (87, 66, 58): 313,
+    (87, 66, 59): 314,
+    (87, 66, 60): 315,
+    (87, 66, 61): 316,
+    (87, 66, 62): 317,
+    (87, 66, 63): 318,
+    (87, 66, 64): 319,
+    (87, 66, 65): 320,
+    (87, 66, 66): 321,
+    (87, 66, 67): 322,
+    (87, 66, 68): 323,
+    (87, 66, 69): 324,
+    (87, 66, 70): 325,
+    (87, 66, 71): 326,
+    (87, 66, 72): 327,
+    (87, 66, 73): 328,
+    (87, 66, 74): 329,
+    (87, 66, 75): 330,
+    (87, 66, 76): 331,
+    (87, 66, 77): 332,
+    (87, 66, 78): 333,
+    (87, 66, 79): 334,
+    (87, 66, 80): 335,
+    (87, 66, 81): 336,
+    (87, 66, 82): 337,
+    (87, 66, 83): 338,
+    (87, 66, 84): 339,
+    (87, 66, 85): 340,
+    (87, 66, 86): 341,
+    (87, 66, 87): 342,
+    (87, 66, 88): 343,
+    (87, 66, 89): 344,
+    (87, 66, 90): 345,
+    (87, 66, 91): 346,
+    (87, 66, 92): 347,
+    (87, 66, 93): 348,
+    (87, 66, 94): 349,
+    (87, 66, 95): 350,
+    (87, 66, 96): 351,
+    (87, 66, 97): 352,
+    (87, 66, 98): 353,
+    (87, 66, 99): 354,
+    (87, 66, 100): 355,
+    (87, 66, 101): 356,
+    (87, 66, 102): 357,
+    (87, 66, 103): 358,
+    (87, 66, 104): 359,
+    (87, 66, 105): 360,
+    (87, 66, 106): 361,
+    (87, 66, 107): 362,
+    (87, 66, 108): 363,
+    (87, 66, 109): 364,
+    (87, 66, 110): 365,
+    (87, 66, 111): 366,
+    (87, 66, 112): 367,
+    (87, 66, 113): 368,
+    (87, 66, 114): 369,
+    (87, 66, 115): 370,
+    (87, 66, 116): 371,
+    (87, 66, 117): 372,
+    (87, 66, 118): 373,
+    (87, 66, 119): 374,
+    (87, 66, 120): 375,
+    (87, 66, 121): 376,
+    (87, 66, 122): 377,
+    (87, 66, 123): 378,
+    (87, 66, 124): 379,
+    (87, 66, 125): 380,
+    (87, 66, 126): 381,
+    (87, 66, 127): 382,
+    (87, 66, 128): 383,
+    (87, 67, 1): 384,
+    (87, 67, 2): 385,
+    (87, 67, 3): 386,
+    (87, 67, 4): 387,
+    (87, 67, 5): 388,
+    (87, 67, 6): 389,
+    (87, 67, 7): 390,
+    (87, 67, 8): 391,
+    (87, 67, 9): 392,
+    (87, 67, 10): 393,
+    (87, 67, 11): 394,
+    (87, 67, 12): 395,
+    (87, 67, 13): 396,
+    (87, 67, 14): 397,
+    (87, 67, 15): 398,
+    (87, 67, 16): 399,
+    (87, 67, 17): 400,
+    (87, 67, 18): 401,
+    (87, 67, 19): 402,
+    (87, 67, 20): 403,
+    (87, 67, 21): 404,
+    (87, 67, 22): 405,
+    (87, 67, 23): 406,
+    (87, 67, 24): 407,
+    (87, 67, 25): 408,
+    (87, 67, 26): 409,
+    (87, 67, 27): 410,
+    (87, 67, 28): 411,
+    (87, 67, 29): 412,
+    (87, 67, 30): 413,
+    (87, 67, 31): 414,
+    (87, 67, 32): 415,
+    (87, 67, 33): 416,
+    (87, 67, 34): 417,
+    (87, 67, 35): 418,
+    (87, 67, 36): 419,
+    (87, 67, 37): 420,
+    (87, 67, 38): 421,
+    (87, 67, 39): 422,
+    (87, 67, 40): 423,
+    (87, 67, 41): 424,
+    (87, 67, 42): 425,
+    (87, 67, 43): 426,
+    (87, 67, 44): 427,
+    (87, 67, 45): 428,
+    (87, 67, 46): 429,
+    (87, 67, 47): 430,
+    (87, 67, 48): 431,
+    (87, 67, 49): 432,
+    (87, 67, 50): 433,
+    (87, 67, 51): 434,
+    (87, 67, 52): 435,
+    (87, 67, 53): 436,
+    (87, 67, 54): 437,
+    (87, 67, 55): 438,
+    (87, 67, 56): 439,
+    (87, 67, 57): 440,
+    (87, 67, 58): 441,
+    (87, 67, 59): 442,
+    (87, 67, 60): 443,
+    (87, 67, 61): 444,
+    (87, 67, 62): 445,
+    (87, 67, 63): 446,
+    (87, 67, 64): 447,
+    (87, 67, 65): 448,
+    (87, 67, 66): 449,
+    (87, 67, 67): 450,
+    (87, 67, 68): 451,
+    (87, 67, 69): 452,
+    (87, 67, 70): 453,
+    (87, 67, 71): 454,
+    (87, 67, 72): 455,
+    (87, 67, 73): 456,
+    (87, 67, 74): 457,
+    (87, 67, 75): 458,
+    (87, 67, 76): 459,
+    (87, 67, 77): 460,
+    (87, 67, 78): 461,
+    (87, 67, 79): 462,
+    (87, 67, 80): 463,
+    (87, 67, 81): 464,
+    (87, 67, 82): 465,
+    (87, 67, 83): 466,
+    (87, 67, 84): 467,
+    (87, 67, 85): 468,
+    (87, 67, 86): 469,
+    (87, 67, 87): 470,
+    (87, 67, 88): 471,
+    (87, 67, 89): 472,
+    (87, 67, 90): 473,
+    (87, 67, 91): 474,
+    (87, 67, 92): 475,
+    (87, 67, 93): 476,
+    (87, 67, 94): 477,
+    (87, 67, 95): 478,
+    (87, 67, 96): 479,
+    (87, 67, 97): 480,
+    (87, 67, 98): 481,
+    (87, 67, 99): 482,
+    (87, 67, 100): 483,
+    (87, 67, 101): 484,
+    (87, 67, 102): 485,
+    (87, 67, 103): 486,
+    (87, 67, 104): 487,
+    (87, 67, 105): 488,
+    (87, 67, 106): 489,
+    (87, 67, 107): 490,
+    (87, 67, 108): 491,
+    (87, 67, 109): 492,
+    (87, 67, 110): 493,
+    (87, 67, 111): 494,
+    (87, 67, 112): 495,
+    (87, 67, 113): 496,
+    (87, 67, 114): 497,
+    (87, 67, 115): 498,
+    (87, 67, 116): 499,
+    (87, 67, 117): 500,
+    (87, 67, 118): 501,
+    (87, 67, 119): 502,
+    (87, 67, 120): 503,
+    (87, 67, 121): 504,
+    (87, 67, 122): 505,
+    (87, 67, 123): 506,
+    (87, 67, 124): 507,
+    (87, 67, 125): 508,
+    (87, 67, 126): 509,
+    (87, 67, 127): 510,
+    (87, 67, 128): 511,
+    (87, 68, 1): 512,
+    (87, 68, 2): 513,
+    (87, 68, 3): 514,
+    (87, 68, 4): 515,
+    (87, 68, 5): 516,
+    (87, 68, 6): 517,
+    (87, 68, 7): 518,
+    (87, 68, 8): 519,
+    (87, 68, 9): 520,
+    (87, 68, 10): 521,
+    (87, 68, 11): 522,
+    (87, 68, 12): 523,
+    (87, 68, 13): 524,
+    (87, 68, 14): 525,
+    (87, 68, 15): 526,
+    (87, 68, 16): 527,
+    (87, 68, 17): 528,
+    (87, 68, 18): 529,
+    (87, 68, 19): 530,
+    (87, 68, 20): 531,
+    (87, 68, 21): 532,
+    (87, 68, 22): 533,
+    (87, 68, 23): 534,
+    (87, 68, 24): 535,
+    (87, 68, 25): 536,
+    (87, 68, 26): 537,
+    (87, 68, 27): 538,
+    (87, 68, 28): 539,
+    (87, 68, 29): 540,
+    (87, 68, 30): 541,
+    (87, 68, 31): 542,
+    (87, 68, 32): 543,
+    (87, 68, 33): 544,
+    (87, 68, 34): 545,
+    (87, 68, 35): 546,
+    (87, 68, 36): 547,
+    (87, 68, 37): 548,
+    (87, 68, 38): 549,
+    (87, 68, 39): 550,
+    (87, 68, 40): 551,
+    (87, 68, 41): 552,
+    (87, 68, 42): 553,
+    (87, 68, 43): 554,
+    (87, 68, 44): 555,
+    (87, 68, 45): 556,
+    (87, 68, 46): 557,
+    (87, 68, 47): 558,
+    (87, 68, 48): 559,
+    (87, 68, 49): 560,
+    (87, 68, 50): 561,
+    (87, 68, 51): 562,
+    (87, 68, 52): 563,
+    (87, 68, 53): 564,
+    (87, 68, 54): 565,
+    (87, 68, 55): 566,
+    (87, 68, 56): 567,
+    (87, 68, 57): 568,
+    (87, 68, 58): 569,
+    (87, 68, 59): 570,
+    (87, 68, 60): 571,
+    (87, 68, 61): 572,
+    (87, 68, 62): 573,
+    (87, 68, 63): 574,
+    (87, 68, 64): 575,
+    (87, 68, 65): 576,
+    (87, 68, 66): 577,
+    (87, 68, 67): 578,
+    (87, 68, 68): 579,
+    (87, 68, 69): 580,
+    (87, 68, 70): 581,
+    (87, 68, 71): 582,
+    (87, 68, 72): 583,
+    (87, 68, 73): 584,
+    (87, 68, 74): 585,
+    (87, 68, 75): 586,
+    (87, 68, 76): 587,
+    (87, 68, 77): 588,
+    (87, 68, 78): 589,
+    (87, 68, 79): 590,
+    (87, 68, 80): 591,
+    (87, 68, 81): 592,
+    (87, 68, 82): 593,
+    (87, 68, 83): 594,
+    (87, 68, 84): 595,
+    (87, 68, 85): 596,
+    (87, 68, 86): 597,
+    (87, 68, 87): 598,
+    (87, 68, 88): 599,
+    (87, 68, 89): 600,
+    (87, 68, 90): 601,
+    (87, 68, 91): 602,
+    (87, 68, 92): 603,
+    (87, 68, 93): 604,
+    (87, 68, 94): 605,
+    (87, 68, 95): 606,
+    (87, 68, 96): 607,
+    (87, 68, 97): 608,
+    (87, 68, 98): 609,
+    (87, 68, 99): 610,
+    (87, 68, 100): 611,
+    (87, 68, 101): 612,
+    (87, 68, 102): 613,
+    (87, 68, 103): 614,
+    (87, 68, 104): 615,
+    (87, 68, 105): 616,
+    (87, 68, 106): 617,
+    (87, 68, 107): 618,
+    (87, 68, 108): 619,
+    (87, 68, 109): 620,
+    (87, 68, 110): 621,
+    (87, 68, 111): 622,
+    (87, 68, 112): 623,
+    (87, 68, 113): 624,
+    (87, 68, 114): 625,
+    (87, 68, 115): 626,
+    (87, 68, 116): 627,
+    (87, 68, 117): 628,
+    (87, 68, 118): 629,
+    (87, 68, 119): 630,
+    (87, 68, 120): 631,
+    (87, 68, 121): 632,
+    (87, 68, 122): 633,
+    (87, 68, 123): 634,
+    (87, 68, 124): 635,
+    (87, 68, 125): 636,
+    (87, 68, 126): 637,
+    (87, 68, 127): 638,
+    (87, 68, 128): 639,
+    (87, 69, 1): 640,
+    (87, 69, 2): 641,
+    (87, 69, 3): 642,
+    (87, 69, 4): 643,
+    (87, 69, 5): 644,
+    (87, 69, 6): 645,
+    (87, 69, 7): 646,
+    (87, 69, 8): 647,
+    (87, 69, 9): 648,
+    (87, 69, 10): 649,
+    (87, 69, 11): 650,
+    (87, 69, 12): 651,
+    (87, 69, 13): 652,
+    (87, 69, 14): 653,
+    (87, 69, 15): 654,
+    (87, 69, 16): 655,
+    (87, 69, 17): 656,
+    (87, 69, 18): 657,
+    (87, 69, 19): 658,
+    (87, 69, 20): 659,
+    (87, 69, 21): 660,
+    (87, 69, 22): 661,
+    (87, 69, 23): 662,
+    (87, 69, 24): 663,
+    (87, 69, 25): 664,
+    (87, 69, 26): 665,
+    (87, 69, 27): 666,
+    (87, 69, 28): 667,
+    (87, 69, 29): 668,
+    (87, 69, 30): 669,
+    (87, 69, 31): 670,
+    (87, 69, 32): 671,
+    (87, 69, 33): 672,
+    (87, 69, 34): 673,
+    (87, 69, 35): 674,
+    (87, 69, 36): 675,
+    (87, 69, 37): 676,
+    (87, 69, 38): 677,
+    (87, 69, 39): 678,
+    (87, 69, 40): 679,
+    (87, 69, 41): 680,
+    (87, 69, 42): 681,
+    (87, 69, 43): 682,
+    (87, 69, 44): 683,
+    (87, 69, 45): 684,
+    (87, 69, 46): 685,
+    (87, 69, 47): 686,
+    (87, 69, 48): 687,
+    (87, 69, 49): 688,
+    (87, 69, 50): 689,
+    (87, 69, 51): 690,
+    (87, 69, 52): 691,
+    (87, 69, 53): 692,
+    (87, 69, 54): 693,
+    (87, 69, 55): 694,
+    (87, 69, 56): 695,
+    (87, 69, 57): 696,
+    (87, 69, 58): 697,
+    (87, 69, 59): 698,
+    (87, 69, 60): 699,
+    (87, 69, 61): 700,
+    (87, 69, 62): 701,
+    (87, 69, 63): 702,
+    (87, 69, 64): 703,
+    (87, 69, 65): 704,
+    (87, 69, 66): 705,
+    (87, 69, 67): 706,
+    (87, 69, 68): 707,
+    (87, 69, 69): 708,
+    (87, 69, 70): 709,
+    (87, 69, 71): 710,
+    (87, 69, 72): 711,
+    (87, 69, 73): 712,
+    (87, 69, 74): 713,
+    (87, 69, 75): 714,
+    (87, 69, 76): 715,
+    (87, 69, 77): 716,
+    (87, 69, 78): 717,
+    (87, 69, 79): 718,
+    (87, 69, 80): 719,
+    (87, 69, 81): 720,
+    (87, 69, 82): 721,
+    (87, 69, 83): 722,
+    (87, 69, 84): 723,
+    (87, 69, 85): 724,
+    (87, 69, 86): 725,
+    (87, 69, 87): 726,
+    (87, 69, 88): 727,
+    (87, 69, 89): 728,
+    (87, 69, 90): 729,
+    (87, 69, 91): 730,
+    (87, 69, 92): 731,
+    (87, 69, 93): 732,
+    (87, 69, 94): 733,
+    (87, 69, 95): 734,
+    (87, 69, 96): 735,
+    (87, 69, 97): 736,
+    (87, 69, 98): 737,
+    (87, 69, 99): 738,
+    (87, 69, 100): 739,
+    (87, 69, 101): 740,
+    (87, 69, 102): 741,
+    (87, 69, 103): 742,
+    (87, 69, 104): 743,
+    (87, 69, 105): 744,
+    (87, 69, 106): 745,
+    (87, 69, 107): 746,
+    (87, 69, 108): 747,
+    (87, 69, 109): 748,
+    (87, 69, 110): 749,
+    (87, 69, 111): 750,
+    (87, 69, 112): 751,
+    (87, 69, 113): 752,
+    (87, 69, 114): 753,
+    (87, 69, 115): 754,
+    (87, 69, 116): 755,
+    (87, 69, 117): 756,
+    (87, 69, 118): 757,
+    (87, 69, 119): 758,
+    (87, 69, 120): 759,
+    (87, 69, 121): 760,
+    (87, 69, 122): 761,
+    (87, 69, 123): 762,
+    (87, 69, 124): 763,
+    (87, 69, 125): 764,
+    (87, 69, 126): 765,
+    (87, 69, 127): 766,
+    (87, 69, 128): 767,
+    (87, 70, 1): 768,
+    (87, 70, 2): 769,
+    (87, 70, 3): 770,
+    (87, 70, 4): 771,
+    (87, 70, 5): 772,
+    (87, 70, 6): 773,
+    (87, 70, 7): 774,
+    (87, 70, 8): 775,
+    (87, 70, 9): 776,
+    (87, 70, 10): 777,
+    (87, 70, 11): 778,
+    (87, 70, 12): 779,
+    (87, 70, 13): 780,
+    (87, 70, 14): 781,
+    (87, 70, 15): 782,
+    (87, 70, 16): 783,
+    (87, 70, 17): 784,
+    (87, 70, 18): 785,
+    (87, 70, 19): 786,
+    (87, 70, 20): 787,
+    (87, 70, 21): 788,
+    (87, 70, 22): 789,
+    (87, 70, 23): 790,
+    (87, 70, 24): 791,
+    (87, 70, 25): 792,
+    (87, 70, 26): 793,
+    (87, 70, 27): 794,
+    (87, 70, 28): 795,
+    (87, 70, 29): 796,
+    (87, 70, 30): 797,
+    (87, 70, 31): 798,
+    (87, 70, 32): 799,
+    (87, 70, 33): 800,
+    (87, 70, 34): 801,
+    (87, 70, 35): 802,
+    (87, 70, 36): 803,
+    (87, 70, 37): 804,
+    (87, 70, 38): 805,
+    (87, 70, 39): 806,
+    (87, 70, 40): 807,
+    (87, 70, 41): 808,
+    (87, 70, 42): 809,
+    (87, 70, 43): 810,
+    (87, 70, 44): 811,
+    (87, 70, 45): 812,
+    (87, 70, 46): 813,
+    (87, 70, 47): 814,
+    (87, 70, 48): 815,
+    (87, 70, 49): 816,
+    (87, 70, 50): 817,
+    (87, 70, 51): 818,
+    (87, 70, 52): 819,
+    (87, 70, 53): 820,
+    (87, 70, 54): 821,
+    (87, 70, 55): 822,
+    (87, 70, 56): 823,
+    (87, 70, 57): 824,
+    (87, 70, 58): 825,
+    (87, 70, 59): 826,
+    (87, 70, 60): 827,
+    (87, 70, 61): 828,
+    (87, 70, 62): 829,
+    (87, 70, 63): 830,
+    (87, 70, 64): 831,
+    (87, 70, 65): 832,
+    (87, 70, 66): 833,
+    (87, 70, 67): 834,
+    (87, 70, 68): 835,
+    (87, 70, 69): 836,
+    (87, 70, 70): 837,
+    (87, 70, 71): 838,
+    (87, 70, 72): 839,
+    (87, 70, 73): 840,
+    (87, 70, 74): 841,
+    (87, 70, 75): 842,
+    (87, 70, 76): 843,
+    (87, 70, 77): 844,
+    (87, 70, 78): 845,
+    (87, 70, 79): 846,
+    (87, 70, 80): 847,
+    (87, 70, 81): 848,
+    (87, 70, 82): 849,
+    (87, 70, 83): 850,
+    (87, 70, 84): 851,
+    (87, 70, 85): 852,
+    (87, 70, 86): 853,
+    (87, 70, 87): 854,
+    (87, 70, 88): 855,
+    (87, 70, 89): 856,
+    (87, 70, 90): 857,
+    (87, 70, 91): 858,
+    (87, 70, 92): 859,
+    (87, 70, 93): 860,
+    (87, 70, 94): 861,
+    (87, 70, 95): 862,
+    (87, 70, 96): 863,
+    (87, 70, 97): 864,
+    (87, 70, 98): 865,
+    (87, 70, 99): 866,
+    (87, 70, 100): 867,
+    (87, 70, 101): 868,
+    (87, 70, 102): 869,
+    (87, 70, 103): 870,
+    (87, 70, 104): 871,
+    (87, 70, 105): 872,
+    (87, 70, 106): 873,
+    (87, 70, 107): 874,
+    (87, 70, 108): 875,
+    (87, 70, 109): 876,
+    (87, 70, 110): 877,
+    (87, 70, 111): 878,
+    (87, 70, 112): 879,
+    (87, 70, 113): 880,
+    (87, 70, 114): 881,
+    (87, 70, 115): 882,
+    (87, 70, 116): 883,
+    (87, 70, 117): 884,
+    (87, 70, 118): 885,
+    (87, 70, 119): 886,
+    (87, 70, 120): 887,
+    (87, 70, 121): 888,
+    (87, 70, 122): 889,
+    (87, 70, 123): 890,
+    (87, 70, 124): 891,
+    (87, 70, 125): 892,
+    (87, 70, 126): 893,
+    (87, 70, 127): 894,
+    (87, 70, 128): 895,
+    (87, 71, 1): 896,
+    (87, 71, 2): 897,
+    (87, 71, 3): 898,
+    (87, 71, 4): 899,
+    (87, 71, 5): 900,
+    (87, 71, 6): 901,
+    (87, 71, 7): 902,
+    (87, 71, 8): 903,
+    (87, 71, 9): 904,
+    (87, 71, 10): 905,
+    (87, 71, 11): 906,
+    (87, 71, 12): 907,
+    (87, 71, 13): 908,
+    (87, 71, 14): 909,
+    (87, 71, 15): 910,
+    (87, 71, 16): 911,
+    (87, 71, 17): 912,
+    (87, 71, 18): 913,
+    (87, 71, 19): 914,
+    (87, 71, 20): 915,
+    (87, 71, 21): 916,
+    (87, 71, 22): 917,
+    (87, 71, 23): 918,
+    (87, 71, 24): 919,
+    (87, 71, 25): 920,
+    (87, 71, 26): 921,
+    (87, 71, 27): 922,
+    (87, 71, 28): 923,
+    (87, 71, 29): 924,
+    (87, 71, 30): 925,
+    (87, 71, 31): 926,
+    (87, 71, 32): 927,
+    (87, 71, 33): 928,
+    (87, 71, 34): 929,
+    (87, 71, 35): 930,
+    (87, 71, 36): 931,
+    (87, 71, 37): 932,
+    (87, 71, 38): 933,
+    (87, 71, 39): 934,
+    (87, 71, 40): 935,
+    (87, 71, 41): 936,
+    (87, 71, 42): 937,
+    (87, 71, 43): 938,
+    (87, 71, 44): 939,
+    (87, 71, 45): 940,
+    (87, 71, 46): 941,
+    (87, 71, 47): 942,
+    (87, 71, 48): 943,
+    (87, 71, 49): 944,
+    (87, 71, 50): 945,
+    (87, 71, 51): 946,
+    (87, 71, 52): 947,
+    (87, 71, 53): 948,
+    (87, 71, 54): 949,
+    (87, 71, 55): 950,
+    (87, 71, 56): 951,
+    (87, 71, 57): 952,
+    (87, 71, 58): 953,
+    (87, 71, 59): 954,
+    (87, 71, 60): 955,
+    (87, 71, 61): 956,
+    (87, 71, 62): 957,
+    (87, 71, 63): 958,
+    (87, 71, 64): 959,
+    (87, 71, 65): 960,
+    (87, 71, 66): 961,
+    (87, 71, 67): 962,
+    (87, 71, 68): 963,
+    (87, 71, 69): 964,
+    (87, 71, 70): 965,
+    (87, 71, 71): 966,
+    (87, 71, 72): 967,
+    (87, 71, 73): 968,
+    (87, 71, 74): 969,
+    (87, 71, 75): 970,
+    (87, 71, 76): 971,
+    (87, 71, 77): 972,
+    (87, 71, 78): 973,
+    (87, 71, 79): 974,
+    (87, 71, 80): 975,
+    (87, 71, 81): 976,
+    (87, 71, 82): 977,
+    (87, 71, 83): 978,
+    (87, 71, 84): 979,
+    (87, 71, 85): 980,
+    (87, 71, 86): 981,
+    (87, 71, 87): 982,
+    (87, 71, 88): 983,
+    (87, 71, 89): 984,
+    (87, 71, 90): 985,
+    (87, 71, 91): 986,
+    (87, 71, 92): 987,
+    (87, 71, 93): 988,
+    (87, 71, 94): 989,
+    (87, 71, 95): 990,
+    (87, 71, 96): 991,
+    (87, 71, 97): 992,
+    (87, 71, 98): 993,
+    (87, 71, 99): 994,
+    (87, 71, 100): 995,
+    (87, 71, 101): 996,
+    (87, 71, 102): 997,
+    (87, 71, 103): 998,
+    (87, 71, 104): 999,
+    (87, 71, 105): 1000,
+    (87, 71, 106): 1001,
+    (87, 71, 107): 1002,
+    (87, 71, 108): 1003,
+    (87, 71, 109): 1004,
+    (87, 71, 110): 1005,
+    (87, 71, 111): 1006,
+    (87, 71, 112): 1007,
+    (87, 71, 113): 1008,
+    (87, 71, 114): 1009,
+    (87, 71, 115): 1010,
+    (87, 71, 116): 1011,
+    (87, 71, 117): 1012,
+    (87, 71, 118): 1013,
+    (87, 71, 119): 1014,
+    (87, 71, 120): 1015,
+    (87, 71, 121): 1016,
+    (87, 71, 122): 1017,
+    (87, 71, 123): 1018,
+    (87, 71, 124): 1019,
+    (87, 71, 125): 1020,
+    (87, 71, 126): 1021,
+    (87, 71, 127): 1022,
+    (87, 71, 128): 1023,
+    (87, 72, 1): 1024,
+    (87, 72, 2): 1025,
+    (87, 72, 3): 1026,
+    (87, 72, 4): 1027,
+    (87, 72, 5): 1028,
+    (87, 72, 6): 1029,
+    (87, 72, 7): 1030,
+    (87, 72, 8): 1031,
+    (87, 72, 9): 1032,
+    (87, 72, 10): 1033,
+    (87, 72, 11): 1034,
+    (87, 72, 12): 1035,
+    (87, 72, 13): 1036,
+    (87, 72, 14): 1037,
+    (87, 72, 15): 1038,
+    (87, 72, 16): 1039,
+    (87, 72, 17): 1040,
+    (87, 72, 18): 1041,
+    (87, 72, 19): 1042,
+    (87, 72, 20): 1043,
+    (87, 72, 21): 1044,
+    (87, 72, 22): 1045,
+    (87, 72, 23): 1046,
+    (87, 72, 24): 1047,
+    (87, 72, 25): 1048,
+    (87, 72, 26): 1049,
+    (87, 72, 27): 1050,
+    (87, 72, 28): 1051,
+    (87, 72, 29): 1052,
+    (87, 72, 30): 1053,
+    (87, 72, 31): 1054,
+    (87, 72, 32): 1055,
+    (87, 72, 33): 1056,
+    (87, 72, 34): 1057,
+    (87, 72, 35): 1058,
+    (87, 72, 36): 1059,
+    (87, 72, 37): 1060,
+    (87, 72, 38): 1061,
+    (87, 72, 39): 1062,
+    (87, 72, 40): 1063,
+    (87, 72, 41): 1064,
+    (87, 72, 42): 1065,
+    (87, 72, 43): 1066,
+    (87, 72, 44): 1067,
+    (87, 72, 45): 1068,
+    (87, 72, 46): 1069,
+    (87, 72, 47): 1070,
+    (87, 72, 48): 1071,
+    (87, 72, 49): 1072,
+    (87, 72, 50): 1073,
+    (87, 72, 51): 1074,
+    (87, 72, 52): 1075,
+    (87, 72, 53): 1076,
+    (87, 72, 54): 1077,
+    (87, 72, 55): 1078,
+    (87, 72, 56): 1079,
+    (87, 72, 57): 1080,
+    (87, 72, 58): 1081,
+    (87, 72, 59): 1082,
+    (87, 72, 60): 1083,
+    (87, 72, 61): 1084,
+    (87, 72, 62): 1085,
+    (87, 72, 63): 1086,
+    (87, 72, 64): 1087,
+    (121, 0, 1): 1088,
+    (121, 1, 1): 1089,
+    (121, 2, 1): 1090,
+    (121, 0, 2): 1091,
+    (121, 1, 2): 1092,
+    (121, 0, 3): 1093,
+    (121, 1, 3): 1094,
+    (121, 0, 4): 1095,
+    (121, 1, 4): 1096,
+    (121, 0, 5): 1097,
+    (121, 1, 5): 1098,
+    (121, 2, 5): 1099,
+    (121, 3, 5): 1100,
+    (121, 0, 6): 1101,
+    (121, 1, 6): 1102,
+    (121, 2, 6): 1103,
+    (121, 3, 6): 1104,
+    (121, 4, 6): 1105,
+    (121, 0, 7): 1106,
+    (121, 1, 7): 1107,
+    (121, 2, 7): 1108,
+    (121, 3, 7): 1109,
+    (121, 0, 8): 1110,
+    (121, 1, 8): 1111,
+    (121, 0, 9): 1112,
+    (121, 0, 10): 1113,
+    (121, 0, 11): 1114,
+    (121, 0, 12): 1115,
+    (121, 1, 12): 1116,
+    (121, 0, 13): 1117,
+    (121, 1, 13): 1118,
+    (121, 0, 14): 1119,
+    (121, 0, 15): 1120,
+    (121, 1, 15): 1121,
+    (121, 2, 15): 1122,
+    (121, 0, 16): 1123,
+    (121, 0, 17): 1124,
+    (121, 1, 17): 1125,
+    (121, 2, 17): 1126,
+    (121, 3, 17): 1127,
+    (121, 0, 18): 1128,
+    (121, 1, 18): 1129,
+    (121, 2, 18): 1130,
+    (121, 0, 19): 1131,
+    (121, 0, 20): 1132,
+    (121, 1, 20): 1133,
+    (121, 2, 20): 1134,
+    (121, 0, 21): 1135,
+    (121, 1, 21): 1136,
+    (121, 0, 22): 1137,
+    (121, 1, 22): 1138,
+    (121, 0, 23): 1139,
+    (121, 0, 24): 1140,
+    (121, 0, 25): 1141,
+    (121, 1, 25): 1142,
+    (121, 2, 25): 1143,
+    (121, 3, 25): 1144,
+    (121, 0, 26): 1145,
+    (121, 1, 26): 1146,
+    (121, 2, 26): 1147,
+    (121, 3, 26): 1148,
+    (121, 0, 27): 1149,
+    (121, 1, 27): 1150,
+    (121, 0, 28): 1151,
+    (121, 1, 28): 1152,
+    (121, 2, 28): 1153,
+    (121, 0, 29): 1154,
+    (121, 1, 29): 1155,
+    (121, 2, 29): 1156,
+    (121, 3, 29): 1157,
+    (121, 0, 30): 1158,
+    (121, 1, 30): 1159,
+    (121, 0, 31): 1160,
+    (121, 1, 31): 1161,
+    (121, 2, 31): 1162,
+    (121, 0, 32): 1163,
+    (121, 1, 32): 1164,
+    (121, 0, 33): 1165,
+    (121, 0, 34): 1166,
+    (121, 1, 34): 1167,
+    (121, 0, 35): 1168,
+    (121, 0, 36): 1169,
+    (121, 0, 37): 1170,
+    (121, 0, 38): 1171,
+    (121, 0, 39): 1172,
+    (121, 1, 39): 1173,
+    (121, 2, 39): 1174,
+    (121, 3, 40): 1175,
+    (121, 4, 40): 1176,
+    (121, 0, 40): 1177,
+    (121, 1, 40): 1178,
+    (121, 2, 40): 1179,
+    (121, 0, 41): 1181,
+    (121, 1, 41): 1182,
+    (121, 0, 42): 1183,
+    (121, 0, 43): 1184,
+    (121, 0, 44): 1185,
+    (121, 0, 45): 1186,
+    (121, 0, 46): 1187,
+    (121, 0, 47): 1188,
+    (121, 1, 47): 1189,
+    (121, 0, 48): 1190,
+    (121, 0, 49): 1191,
+    (121, 1, 49): 1192,
+    (121, 2, 49): 1193,
+    (121, 0, 50): 1194,
+    (121, 0, 51): 1195,
+    (121, 1, 51): 1196,
+    (121, 0, 52): 1197,
+    (121, 0, 53): 1198,
+    (121, 1, 53): 1199,
+    (121, 0, 54): 1200,
+    (121, 1, 54): 1201,
+    (121, 0, 55): 1202,
+    (121, 1, 55): 1203,
+    (121, 0, 56): 1204,
+    (121, 1, 56): 1205,
+    (121, 2, 56): 1206,
+    (121, 3, 56): 1207,
+    (121, 0, 57): 1208,
+    (121, 1, 57): 1209,
+    (121, 0, 58): 1210,
+    (121, 1, 58): 1211,
+    (121, 2, 58): 1212,
+    (121, 0, 59): 1213,
+    (121, 0, 60): 1214,
+    (121, 1, 60): 1215,
+    (121, 0, 61): 1216,
+    (121, 1, 61): 1217,
+    (121, 0, 62): 1218,
+    (121, 1, 62): 1219,
+    (121, 0, 63): 1220,
+    (121, 1, 63): 1221,
+    (121, 2, 63): 1222,
+    (121, 3, 63): 1223,
+    (121, 0, 64): 1224,
+    (121, 1, 64): 1225,
+    (121, 2, 64): 1226,
+    (121, 0, 65): 1227,
+    (121, 0, 66): 1228,
+    (121, 0, 67): 1229,
+    (121, 0, 68): 1230,
+    (121, 0, 69): 1231,
+    (121, 0, 70): 1232,
+    (121, 0, 71): 1233,
+    (121, 0, 72): 1234,
+    (121, 0, 73): 1235,
+    (121, 0, 74): 1236,
+    (121, 0, 75): 1237,
+    (121, 0, 76): 1238,
+    (121, 0, 77): 1239,
+    (121, 0, 78): 1240,
+    (121, 0, 79): 1241,
+    (121, 0, 80): 1242,
+    (121, 0, 81): 1243,
+    (121, 1, 81): 1244,
+    (121, 2, 81): 1245,
+    (121, 0, 82): 1246,
+    (121, 1, 82): 1247,
+    (121, 2, 82): 1248,
+    (121, 3, 82): 1249,
+    (121, 4, 82): 1250,
+    (121, 0, 83): 1251,
+    (121, 0, 84): 1252,
+    (121, 0, 85): 1253,
+    (121, 1, 85): 1254,
+    (121, 0, 86): 1255,
+    (121, 0, 87): 1256,
+    (121, 0, 88): 1257,
+    (121, 1, 88): 1258,
+    (121, 0, 89): 1259,
+    (121, 0, 90): 1260,
+    (121, 1, 90): 1261,
+    (121, 0, 91): 1262,
+    (121, 0, 92): 1263,
+    (121, 1, 92): 1264,
+    (121, 0, 93): 1265,
+    (121, 0, 94): 1266,
+    (121, 0, 95): 1267,
+    (121, 0, 96): 1268,
+    (121, 0, 97): 1269,
+    (121, 0, 98): 1270,
+    (121, 0, 99): 1271,
+    (121, 1, 99): 1272,
+    (121, 0, 100): 1273,
+    (121, 0, 101): 1274,
+    (121, 0, 102): 1275,
+    (121, 0, 103): 1276,
+    (121, 1, 103): 1277,
+    (121, 2, 103): 1278,
+    (121, 0, 104): 1279,
+    (121, 0, 105): 1280,
+    (121, 1, 105): 1281,
+    (121, 0, 106): 1282,
+    (121, 0, 107): 1283,
+    (121, 0, 108): 1284,
+    (121, 1, 108): 1285,
+    (121, 0, 109): 1286,
+    (121, 0, 110): 1287,
+    (121, 0, 111): 1288,
+    (121, 0, 112): 1289,
+    (121, 0, 113): 1290,
+    (121, 0, 114): 1291,
+    (121, 0, 115): 1292,
+    (121, 0, 116): 1293,
+    (121, 1, 116): 1294,
+    (121, 0, 117): 1295,
+    (121, 1, 117): 1296,
+    (121, 0, 118): 1297,
+    (121, 1, 118): 1298,
+    (121, 0, 119): 1299,
+    (121, 1, 119): 1300,
+    (121, 2, 119): 1301,
+    (121, 0, 120): 1302,
+    (121, 0, 121): 1303,
+    (121, 1, 121): 1304,
+    (121, 2, 121): 1305,
+    (121, 0, 122): 1306,
+    (121, 1, 122): 1307,
+    (121, 0, 123): 1308,
+    (121, 1, 123): 1309,
+    (121, 2, 123): 1310,
+    (121, 3, 123): 1311,
+    (121, 4, 123): 1312,
+    (121, 5, 123): 1313,
+    (121, 0, 124): 1314,
+    (121, 1, 124): 1315,
+    (121, 2, 124): 1316,
+    (121, 3, 124): 1317,
+    (121, 0, 125): 1318,
+    (121, 1, 125): 1319,
+    (121, 2, 125): 1320,
+    (121, 3, 125): 1321,
+    (121, 4, 125): 1322,
+    (121, 5, 125): 1323,
+    (121, 0, 126): 1324,
+    (121, 1, 126): 1325,
+    (121, 2, 126): 1326,
+    (121, 3, 126): 1327,
+    (121, 4, 126): 1328,
+    (121, 5, 126): 1329,
+    (121, 6, 126): 1330,
+    (121, 7, 126): 1331,
+    (121, 8, 126): 1332,
+    (121, 9, 16): 1333,
+    (121, 0, 127): 1334,
+    (121, 1, 127): 1335,
+    (121, 2, 127): 1336,
+    (121, 3, 127): 1337,
+    (121, 4, 127): 1338,
+    (121, 5, 127): 1339,
+    (121, 0, 128): 1340,
+    (121, 1, 128): 1341,
+    (121, 2, 128): 1342,
+    (121, 3, 128): 1343,
+    (0, 68, 1): 1344,
+    (87, 73, 2): 1345,
+    (87, 73, 3): 1346,
+    (87, 73, 4): 1347,
+    (87, 73, 5): 1348,
+    (87, 73, 6): 1349,
+    (87, 73, 7): 1350,
+    (87, 73, 8): 1351,
+    (87, 73, 9): 1352,
+    (87, 73, 10): 1353,
+    (87, 73, 11): 1354,
+    (87, 73, 12): 1355,
+    (87, 73, 13): 1356,
+    (87, 73, 14): 1357,
+    (87, 73, 15): 1358,
+    (87, 73, 16): 1359,
+    (87, 73, 17): 1360,
+    (87, 73, 18): 1361,
+    (87, 73, 19): 1362,
+    (87, 73, 20): 1363,
+    (87, 73, 21): 1364,
+    (87, 73, 22): 1365,
+    (87, 73, 23): 1366,
+    (87, 73, 24): 1367,
+    (87, 73, 25): 1368,
+    (87, 73, 26): 1369,
+    (87, 73, 27): 1370,
+    (87, 73, 28): 1371,
+    (87, 73, 29): 1372,
+    (87, 73, 30): 1373,
+    (87, 73, 31): 1374,
+    (87, 73, 32): 1375,
+    (87, 73, 33): 1376,
+    (87, 73, 34): 1377,
+    (87, 73, 35): 1378,
+    (87, 73, 36): 1379,
+    (87, 73, 37): 1380,
+    (87, 73, 38): 1381,
+    (120, 0, 1): 1382,
+    (120, 0, 57): 1383,
+}
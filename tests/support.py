@@ -0,0 +1,39 @@
+"""Shared fixtures of the goplus.py tests: a MidiManager talking to the built-in KeyboardEmulator."""
+import os, sys, unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import goplus as g
+
+MODEL_ID = g.MODEL_IDS['GK']
+
+def open_emulated(emulator=None, **options):
+    """Returns an open MidiManager and the emulator it talks to.
+    MidiManager options (timeout, retries, use_shadow, tx_rate) are passed on, the rest go to the emulator.
+    """
+    manager_options = {key: options.pop(key) for key in ("timeout", "retries", "use_shadow", "tx_rate") if key in options}
+    if emulator is None:
+        emulator = g.KeyboardEmulator('GK', latency=options.pop("latency", 0.001), seed=1, **options)
+    midi_manager = g.MidiManager(None, emulator=emulator, **manager_options)
+    midi_manager.open_devices()
+    return midi_manager, emulator
+
+def device_bytes(emulator, addr, size):
+    """The bytes the emulated keyboard holds at a 7-bit address."""
+    memory = emulator.memory[MODEL_ID]
+    start = g.reassemble_from_7bit(addr)
+    return [memory[start + i] for i in range(size)]
+
+def set_device_bytes(emulator, addr, offset, *values):
+    """Changes bytes on the emulated keyboard behind the MidiManager's back, like an edit on the panel."""
+    memory = emulator.memory[MODEL_ID]
+    start = g.reassemble_from_7bit(addr) + offset
+    for i, value in enumerate(values):
+        memory[start + i] = value
+
+class EmulatorTestCase(unittest.TestCase):
+    """Gives each test a fresh emulator and a MidiManager opened with emulator_options."""
+    emulator_options = {}
+    def setUp(self):
+        self.midi_manager, self.emulator = open_emulated(**self.emulator_options)
+        self.addCleanup(self.emulator.close)
+        self.addCleanup(self.midi_manager.close_devices)
@@ -0,0 +1,57 @@
+import unittest
+
+from support import EmulatorTestCase, MODEL_ID, device_bytes, g, open_emulated
+
+def offset_address(addr, offset):
+    return g.slice_to_7bit(g.reassemble_from_7bit(addr) + offset)
+
+class SpanlessEmulator(g.KeyboardEmulator):
+    """Ignores RQ1s larger than max_read, like a device that does not answer spans covering unmapped addresses."""
+    max_read = 20
+    def read(self, model_id, address, size):
+        if size <= self.max_read:
+            super().read(model_id, address, size)
+
+class PlanBlockReadsTest(unittest.TestCase):
+    def test_close_blocks_share_a_span(self):
+        addr = g.calculate_part_address(1)
+        blocks = [(offset_address(addr, 30), 10), (addr, 10), (offset_address(addr, 12), 10)]
+        self.assertEqual(g.plan_block_reads(blocks), [(addr, 40, [1, 2, 0])])
+
+    def test_distant_blocks_are_read_on_their_own(self):
+        blocks = [(g.calculate_part_address(num), g.PART_SIZE) for num in (1, 2)]
+        self.assertEqual(g.plan_block_reads(blocks), [(addr, size, [i]) for i, (addr, size) in enumerate(blocks)])
+
+    def test_gap_and_max_size_limit_merging(self):
+        addr = g.calculate_part_address(1)
+        gap = (addr, 10), (offset_address(addr, 10 + g.RQ1_OVERHEAD + 1), 10)
+        self.assertEqual(len(g.plan_block_reads(gap)), 2)
+        self.assertEqual(len(g.plan_block_reads(gap, merge_gap=g.RQ1_OVERHEAD + 1)), 1)
+        self.assertEqual(len(g.plan_block_reads(gap, max_size=20, merge_gap=g.RQ1_OVERHEAD + 1)), 2)
+        self.assertEqual(len(g.plan_block_reads(gap[:1] + ((offset_address(addr, 10), 10),), merge_gap=None)), 2)
+
+class CoalescedReadTest(EmulatorTestCase):
+    emulator_options = {"use_shadow": False}
+
+    def test_coalesced_read_fills_each_block(self):
+        addr = g.calculate_part_address(1)
+        blocks = [(addr, 10), (offset_address(addr, 20), 10)]
+        received = []
+        self.midi_manager.listeners.append(received.append)
+        data = g.read_map_blocks(blocks, MODEL_ID, self.midi_manager)
+        self.assertEqual(data, [device_bytes(self.emulator, block_addr, size) for block_addr, size in blocks])
+        self.assertEqual(len(received), 1) # one reply to one RQ1 covering both
+
+    def test_unanswered_span_falls_back_to_a_read_per_block(self):
+        midi_manager, emulator = open_emulated(SpanlessEmulator('GK', latency=0.001, seed=1), timeout=0.02, retries=1, use_shadow=False)
+        self.addCleanup(emulator.close)
+        self.addCleanup(midi_manager.close_devices)
+        addr = g.calculate_part_address(1)
+        blocks = [(addr, 15), (offset_address(addr, 20), 15)]
+        self.assertEqual(g.read_map_blocks(blocks, MODEL_ID, midi_manager),
+                         [device_bytes(emulator, block_addr, size) for block_addr, size in blocks])
+        self.assertEqual(midi_manager.stats.counters["split reads"], 1)
+        self.assertEqual(midi_manager.stats.counters["timeouts"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import random, unittest
+
+from support import g
+
+DATA_MODELS = (g.PART_MODEL, g.ZONE_MODEL, g.SETUP_MODEL, g.SYS_COMMON_MODEL, g.SYS_CTRL_MODEL, g.PATCH_COMMON_MODEL)
+
+class CodecTest(unittest.TestCase):
+    def test_codec_matches_param_lists(self):
+        rng = random.Random(0)
+        for data_model in DATA_MODELS:
+            codec = g.codec_for(data_model)
+            for _ in range(20):
+                values = codec.random_values(rng)
+                data_bytes = list(codec.encode(values))
+                params = g.bytes_to_params(data_bytes, data_model)
+                self.assertEqual([param["value"] for param in params], codec.decode(data_bytes))
+                self.assertEqual(g.params_to_bytes(params), data_bytes)
+                self.assertEqual(codec.decode(data_bytes), values)
+
+    def test_decode_many_matches_decode(self):
+        rng = random.Random(1)
+        codec = g.codec_for(g.PART_MODEL)
+        blocks = [list(codec.encode(codec.random_values(rng))) for _ in range(5)]
+        self.assertEqual(codec.decode_many(blocks), [codec.decode(data_bytes) for data_bytes in blocks])
+
+    def test_template_holds_init_values(self):
+        for data_model in (g.PART_MODEL, g.ZONE_MODEL, g.PATCH_COMMON_MODEL):
+            codec = g.codec_for(data_model)
+            self.assertEqual(list(codec.template), g.params_to_bytes([dict(param) for param in data_model]))
+
+    def test_codecs_are_shared(self):
+        self.assertIs(g.codec_for(g.PART_MODEL), g.codec_for(g.PART_MODEL))
+
+if __name__ == "__main__":
+    unittest.main()
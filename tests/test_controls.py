@@ -0,0 +1,40 @@
+import unittest
+
+from support import EmulatorTestCase
+
+class RecordingPort:
+    def __init__(self):
+        self.messages = []
+    def send_message(self, message):
+        self.messages.append(tuple(message))
+
+class SendControlsTest(EmulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.port = self.midi_manager.tx.midi_out = RecordingPort()
+
+    def send(self, events):
+        del self.port.messages[:]
+        self.midi_manager.send_controls(events).result(timeout=5)
+        return self.port.messages
+
+    def test_nrpn_select_is_sent_once(self):
+        self.assertEqual(self.send([("nrpn", 1, 1, 8, 64, 0), ("nrpn", 1, 1, 8, 70, 0)]),
+                         [(0xB0, 0x63, 1), (0xB0, 0x62, 8), (0xB0, 0x06, 64), (0xB0, 0x26, 0), (0xB0, 0x06, 70), (0xB0, 0x26, 0)])
+        self.assertEqual(self.send([("nrpn", 1, 1, 8, 72, 0)]), [(0xB0, 0x06, 72), (0xB0, 0x26, 0)]) # still selected
+
+    def test_select_is_sent_again_after_a_change(self):
+        messages = self.send([("nrpn", 1, 1, 8, 64, 0), ("nrpn", 1, 1, 9, 64, 0), ("nrpn", 2, 1, 9, 64, 0)])
+        self.assertEqual([message[:2] for message in messages if message[1] in (0x63, 0x62)],
+                         [(0xB0, 0x63), (0xB0, 0x62), (0xB0, 0x63), (0xB0, 0x62), (0xB1, 0x63), (0xB1, 0x62)])
+        self.send([("cc", 2, 0x63, 5)]) # selected by the caller, no longer known
+        self.assertEqual(self.send([("nrpn", 2, 1, 9, 64, 0)])[:2], [(0xB1, 0x63, 1), (0xB1, 0x62, 9)])
+
+    def test_rpn_is_closed_at_the_end_of_the_burst(self):
+        self.assertEqual(self.send([("rpn", 1, 0, 0, 2, 0), ("rpn", 1, 0, 0, 12, 0)]),
+                         [(0xB0, 0x65, 0), (0xB0, 0x64, 0), (0xB0, 0x06, 2), (0xB0, 0x26, 0),
+                          (0xB0, 0x06, 12), (0xB0, 0x26, 0), (0xB0, 0x65, 0x7F), (0xB0, 0x64, 0x7F)])
+        self.assertEqual(self.send([("rpn", 1, 0, 0, 2, 0)])[:2], [(0xB0, 0x65, 0), (0xB0, 0x64, 0)]) # selected again after the null function
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from support import EmulatorTestCase, MODEL_ID, device_bytes, g, set_device_bytes
+
+LEVEL = "PartLevel(CC#7)"
+LEVEL_OFFSET = 7
+
+class DiffRangesTest(unittest.TestCase):
+    def test_diff_ranges(self):
+        old = [0] * 64
+        new = list(old)
+        new[3] = new[5] = new[50] = 1
+        self.assertEqual(g.diff_ranges(old, new), [(3, 6), (50, 51)])
+        self.assertEqual(g.diff_ranges(old, old), [])
+        self.assertEqual(g.diff_ranges(old, new, merge_gap=1), [(3, 4), (5, 6), (50, 51)])
+
+class DeltaWriteTest(EmulatorTestCase):
+    def test_write_map_delta_sends_only_changes(self):
+        addr = g.calculate_part_address(1)
+        old = g.read_map_data(addr, g.PART_SIZE, MODEL_ID, self.midi_manager)
+        new = list(old)
+        new[LEVEL_OFFSET] = (new[LEVEL_OFFSET] + 1) % 128
+        new[30] = (new[30] + 1) % 128 # reverb send, far from the level
+        self.midi_manager.stats.reset()
+        self.assertEqual(g.write_map_delta(addr, old, new, MODEL_ID, self.midi_manager), 2)
+        self.midi_manager.tx.flush() # the emulator applies a DT1 as soon as it is handed over
+        self.assertEqual(self.midi_manager.stats.counters["dt1 bytes sent"], 2 * (g.DT1_OVERHEAD + 1))
+        self.assertEqual(device_bytes(self.emulator, addr, g.PART_SIZE), new)
+        self.assertEqual(g.write_map_delta(addr, new, new, MODEL_ID, self.midi_manager), 0)
+
+    def test_update_params_diffs_against_the_device(self):
+        addr = g.calculate_part_address(1)
+        level = g.get_params(g.PART_MODEL, addr, MODEL_ID, self.midi_manager)[LEVEL]
+        set_device_bytes(self.emulator, addr, LEVEL_OFFSET, 5) # changed on the keyboard, the shadow still holds the old level
+        block = g.update_params(g.PART_MODEL, addr, {LEVEL: level}, MODEL_ID, self.midi_manager)
+        self.midi_manager.tx.flush()
+        self.assertEqual(block[LEVEL], level)
+        self.assertEqual(device_bytes(self.emulator, addr, g.PART_SIZE)[LEVEL_OFFSET], level)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from support import EmulatorTestCase, MODEL_ID, device_bytes, g
+
+class DispatcherTest(EmulatorTestCase):
+    emulator_options = {"use_shadow": False}
+
+    def test_concurrent_reads_get_their_own_replies(self):
+        futures = [self.midi_manager.request_read(g.calculate_zone_address(num), g.ZONE_SIZE, MODEL_ID) for num in range(1, 17)]
+        for num, future in enumerate(futures, 1):
+            self.assertEqual(future.result(timeout=5), device_bytes(self.emulator, g.calculate_zone_address(num), g.ZONE_SIZE))
+        self.assertEqual(self.midi_manager.pending_reads, [])
+
+    def test_listeners_see_every_message(self):
+        received = []
+        self.midi_manager.listeners.append(received.append)
+        g.read_map_data(g.SETUP, g.SETUP_SIZE, MODEL_ID, self.midi_manager)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0][7], g.DT1)
+
+class RetryTest(EmulatorTestCase):
+    emulator_options = {"drop": 0.1, "timeout": 0.05, "retries": 20, "use_shadow": False}
+
+    def test_reads_complete_despite_drops(self):
+        blocks = [(g.calculate_part_address(num), g.PART_SIZE) for num in range(1, 17)]
+        blocks_data = g.read_map_blocks(blocks, MODEL_ID, self.midi_manager)
+        self.assertEqual(blocks_data, [device_bytes(self.emulator, addr, size) for addr, size in blocks])
+        self.assertGreater(self.midi_manager.stats.counters["retries"], 0)
+
+class TimeoutTest(EmulatorTestCase):
+    emulator_options = {"drop": 1.0, "timeout": 0.02, "retries": 1}
+
+    def test_unanswered_read_times_out(self):
+        future = self.midi_manager.request_read(g.SETUP, g.SETUP_SIZE, MODEL_ID)
+        with self.assertRaises(g.SysExTimeoutError):
+            future.result(timeout=10)
+        self.assertEqual(self.midi_manager.stats.counters["timeouts"], 1)
+        self.assertEqual(self.midi_manager.pending_reads, [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from support import EmulatorTestCase, MODEL_ID, device_bytes, g, open_emulated
+
+class EmulatorTest(EmulatorTestCase):
+    emulator_options = {"max_sysex": 16}
+
+    def test_identity_names_the_model(self):
+        for model in ('GK', 'GP'):
+            midi_manager, emulator = open_emulated(g.KeyboardEmulator(model, latency=0.001))
+            self.addCleanup(emulator.close)
+            self.addCleanup(midi_manager.close_devices)
+            self.assertEqual(g.model_from_identity(g.request_identity(midi_manager).result(timeout=5)), model)
+
+    def test_replies_are_split_into_small_dt1s(self):
+        received = []
+        self.midi_manager.listeners.append(received.append)
+        data = g.read_map_data(g.calculate_part_address(1), g.PART_SIZE, MODEL_ID, self.midi_manager)
+        self.assertEqual(data, device_bytes(self.emulator, g.calculate_part_address(1), g.PART_SIZE))
+        self.assertEqual([len(message) - g.DT1_OVERHEAD for message in received], [16, 16, 16, 1])
+
+    def test_writes_with_a_bad_checksum_are_ignored(self):
+        addr = g.calculate_part_address(1)
+        before = device_bytes(self.emulator, addr, g.PART_SIZE)
+        message = bytearray(g.construct_dt1_command(MODEL_ID, addr, [1]))
+        message[-2] ^= 1
+        self.emulator.send_message(message)
+        self.assertEqual(device_bytes(self.emulator, addr, g.PART_SIZE), before)
+        self.emulator.send_message(g.construct_dt1_command(MODEL_ID, addr, [1]))
+        self.assertEqual(device_bytes(self.emulator, addr, 1), [1])
+
+if __name__ == "__main__":
+    unittest.main()
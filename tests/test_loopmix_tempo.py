@@ -0,0 +1,45 @@
+import unittest
+
+from support import EmulatorTestCase, g, open_emulated
+
+def stored_tempo(emulator):
+    """The two 7-bit tempo bytes the emulated keyboard holds."""
+    aux = emulator.memory[g.MODEL_ID_AUX]
+    start = g.reassemble_from_7bit(g.LOOPMIX_TEMPO_ADDR)
+    return [aux[start], aux[start + 1]]
+
+class DroppingEmulator(g.KeyboardEmulator):
+    """Ignores every third tempo step, like a keyboard sent steps faster than it takes them."""
+    steps = 0
+    def write(self, model_id, address, data):
+        if model_id == g.MODEL_ID_AUX and address in (g.TEMPO_UP_ADDR, g.TEMPO_DOWN_ADDR):
+            self.steps += 1
+            if self.steps % 3 == 0:
+                return
+        super().write(model_id, address, data)
+
+class LoopmixTempoTest(EmulatorTestCase):
+    def test_tempo_is_stepped_to_the_target(self):
+        self.assertEqual(g.set_loopmix_tempo(135, self.midi_manager), (120, 135, 15))
+        self.assertEqual(stored_tempo(self.emulator), [1, 7]) # 135 = 1 * 128 + 7
+        self.assertEqual(g.set_loopmix_tempo(100, self.midi_manager)[1:], (100, 35))
+        self.assertEqual(stored_tempo(self.emulator), [0, 100])
+
+    def test_tempo_stops_at_the_limits(self):
+        self.assertEqual(g.set_loopmix_tempo(300, self.midi_manager)[1], 250)
+        self.assertEqual(stored_tempo(self.emulator), [1, 122])
+        self.assertEqual(g.set_loopmix_tempo(20, self.midi_manager)[1], 40)
+        self.assertEqual(stored_tempo(self.emulator), [0, 40])
+
+    def test_dropped_steps_are_resent_with_more_spacing(self):
+        midi_manager, emulator = open_emulated(DroppingEmulator('GK', latency=0.001, seed=1))
+        self.addCleanup(emulator.close)
+        self.addCleanup(midi_manager.close_devices)
+        initial, tempo, steps = g.set_loopmix_tempo(150, midi_manager)
+        self.assertEqual((initial, tempo), (120, 150))
+        self.assertGreater(steps, 30)
+        self.assertGreater(midi_manager.tempo_step_spacing, 0)
+        self.assertEqual(stored_tempo(emulator), [1, 22])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from support import EmulatorTestCase, MODEL_ID, g
+
+LEVEL = "PartLevel(CC#7)"
+
+class MonitorTest(EmulatorTestCase):
+    def start_monitor(self):
+        monitor = g.ParamMonitor(self.midi_manager, MODEL_ID)
+        self.addCleanup(monitor.close)
+        return monitor
+
+    def panel_edit(self, addr, data, model_id=MODEL_ID):
+        """Makes the emulated keyboard send a DT1 by itself, as after an edit on its panel."""
+        self.emulator.reply(g.construct_dt1_command(model_id, addr, data))
+
+    def test_changes_are_reported_with_old_values(self):
+        addr = g.calculate_part_address(3)
+        level = g.get_params(g.PART_MODEL, addr, MODEL_ID, self.midi_manager)[LEVEL] # the old value, known before monitoring
+        monitor = self.start_monitor()
+        self.panel_edit(g.slice_to_7bit(g.reassemble_from_7bit(addr) + 7), [87])
+        self.assertEqual(list(monitor.events(timeout=0.5)), [g.ParamEvent("part", 3, LEVEL, level, 87)])
+
+    def test_controllers(self):
+        monitor = self.start_monitor()
+        self.emulator.reply([0xB2, 7, 90])
+        self.emulator.reply([0xB2, 7, 91])
+        self.assertEqual(list(monitor.events(timeout=0.5)), [g.ParamEvent("cc", 3, "CC#7", None, 90), g.ParamEvent("cc", 3, "CC#7", 90, 91)])
+
+    def test_other_models_are_ignored(self):
+        monitor = self.start_monitor()
+        addr = g.calculate_part_address(3)
+        self.panel_edit(addr, [1], g.MODEL_IDS['GP'])
+        self.panel_edit(addr, [1], '00000042')
+        self.assertEqual(list(monitor.events(timeout=0.2)), [])
+
+    def test_model_from_the_identity_reply(self):
+        self.midi_manager.identity = g.request_identity(self.midi_manager).result(timeout=5)
+        with g.ParamMonitor(self.midi_manager) as monitor:
+            self.assertEqual(monitor.model_ids, {MODEL_ID})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import contextlib, io, socket, struct, time, unittest
+
+from support import EmulatorTestCase, MODEL_ID, device_bytes, g
+
+def osc_string(value):
+    data = value.encode() + b"\0"
+    return data + b"\0" * (-len(data) % 4)
+
+def osc_packet(address, *args):
+    """Encodes an OSC message the way a controller app sends it."""
+    tags = "," + "".join("i" if isinstance(arg, int) else "f" if isinstance(arg, float) else "s" for arg in args)
+    data = b"".join(struct.pack(">i", arg) if isinstance(arg, int) else struct.pack(">f", arg) if isinstance(arg, float)
+                    else osc_string(arg) for arg in args)
+    return osc_string(address) + osc_string(tags) + data
+
+def osc_bundle(*packets):
+    return b"#bundle\0" + bytes(8) + b"".join(struct.pack(">i", len(packet)) + packet for packet in packets)
+
+class OscTest(EmulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        self.server = g.OscServer(("127.0.0.1", 0), self.midi_manager, MODEL_ID, tick=3600) # ticks are run by hand
+        self.addCleanup(self.server.server_close)
+
+    def receive(self, *packets):
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            for packet in packets:
+                self.server.receive(packet)
+        return output.getvalue()
+
+    def tick(self):
+        pending, self.server.pending = self.server.pending, {}
+        self.server.apply(pending.values())
+        self.midi_manager.tx.flush()
+
+    def part(self, num):
+        return g.ParamBlock.from_bytes(g.PART_MODEL, device_bytes(self.emulator, g.calculate_part_address(num), g.PART_SIZE))
+
+    def test_floats_are_scaled_to_the_range(self):
+        self.receive(osc_packet("/part/1/level", 0.5), osc_packet("/part/2/octave", 0.0), osc_packet("/part/3/octave", 1.0))
+        self.tick()
+        self.assertEqual(self.part(1)["PartLevel(CC#7)"], 64)
+        self.assertEqual((self.part(2)["PartOctaveShift"], self.part(3)["PartOctaveShift"]), (-3, 3))
+
+    def test_integers(self):
+        self.receive(osc_bundle(osc_packet("/part/1/level", 90), osc_packet("/zone/2/low", 60), osc_packet("/zone/2/on", 1)))
+        self.tick()
+        self.assertEqual(self.part(1)["PartLevel(CC#7)"], 90)
+        zone = g.ParamBlock.from_bytes(g.ZONE_MODEL, device_bytes(self.emulator, g.calculate_zone_address(2), g.ZONE_SIZE))
+        self.assertEqual((zone["KbdRangeLower"], zone["ZoneSw"]), (60, 1))
+
+    def test_patch_by_name_or_number(self):
+        patch = g.patch_catalog().by_name("JUNO Piano 1")
+        self.receive(osc_packet("/part/1/patch", "JUNO Piano 1"), osc_packet("/part/2/patch", patch.msb, patch.lsb, patch.pc))
+        self.tick()
+        for num in (1, 2):
+            part = self.part(num)
+            self.assertEqual((part["PatchBankSelMSB(CC#0)"], part["PatchBankSelLSB(CC#32)"], part["PatchProgramNum(PC)"] + 1),
+                             (patch.msb, patch.lsb, patch.pc))
+
+    def test_out_of_range_integers_are_rejected(self):
+        for packet in (osc_packet("/zone/1/low", -1), osc_packet("/zone/1/high", 128), osc_packet("/part/17/level", 1),
+                       osc_packet("/loopmix/play", 6, 1), osc_packet("/part/1/level", 128)):
+            self.assertIn("Ignored OSC packet", self.receive(packet))
+        self.assertEqual(self.server.pending, {})
+
+    def test_only_the_latest_value_is_sent(self):
+        self.receive(*(osc_packet("/part/1/level", level) for level in range(100)))
+        self.receive(osc_packet("/part/2/level", 5))
+        self.assertEqual(len(self.server.pending), 2)
+        self.midi_manager.stats.reset()
+        self.tick()
+        self.assertEqual(self.midi_manager.stats.counters["dt1 sent"], 2)
+        self.assertEqual((self.part(1)["PartLevel(CC#7)"], self.part(2)["PartLevel(CC#7)"]), (99, 5))
+
+class OscSocketTest(EmulatorTestCase):
+    def test_packets_are_applied_every_tick(self):
+        server = g.OscServer(("127.0.0.1", 0), self.midi_manager, MODEL_ID, tick=0.01)
+        self.addCleanup(server.server_close)
+        thread = g.threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+        thread.start()
+        self.addCleanup(server.shutdown)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as client:
+            client.sendto(osc_packet("/part/4/level", 33), server.server_address)
+        addr = g.calculate_part_address(4)
+        deadline = time.monotonic() + 5
+        while device_bytes(self.emulator, addr, g.PART_SIZE)[7] != 33 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(device_bytes(self.emulator, addr, g.PART_SIZE)[7], 33)
+
+if __name__ == "__main__":
+    unittest.main()
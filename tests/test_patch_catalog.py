@@ -0,0 +1,54 @@
+import os, runpy, tempfile, unittest
+
+from support import g
+
+PATCHES = [
+    ("JUNO Piano 1", "PNO", 87, 64, 1),
+    ("JUNO Piano 2", "PNO", 87, 64, 2),
+    ("Grand Piano", "PNO", 87, 64, 3),
+    ("Piano Pad", "SYN", 87, 65, 1),
+    ("JUNO Strings", "STR", 87, 67, 1),
+    ("Full Strings", "STR", 87, 67, 2),
+    ("Jazz Organ", "ORG", 87, 66, 1),
+]
+
+class PatchCatalogTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "patches.py")
+            g.write_patch_catalog(PATCHES, path, "the test")
+            module = runpy.run_path(path)
+        cls.catalog = g.PatchCatalog(module["PATCHES"], module["NAME_INDEX"], module["CATEGORY_INDEX"], module["NUMBER_INDEX"])
+
+    def names(self, query, **options):
+        return [patch.name for patch in self.catalog.find(query, **options)]
+
+    def test_lookup(self):
+        self.assertEqual(self.catalog.lookup(87, 67, 2).name, "Full Strings")
+        self.assertIsNone(self.catalog.lookup(87, 67, 3))
+        self.assertEqual(self.catalog.by_name("juno-piano 1").pc, 1)
+
+    def test_prefix_first(self):
+        self.assertEqual(self.names("juno"), ["JUNO Piano 1", "JUNO Piano 2", "JUNO Strings"])
+        self.assertEqual(self.names("piano")[0], "Piano Pad") # prefix before substring
+
+    def test_substring(self):
+        self.assertEqual(self.names("strings"), ["Full Strings", "JUNO Strings"])
+
+    def test_letters_in_order(self):
+        self.assertEqual(self.names("jnopno"), ["JUNO Piano 1", "JUNO Piano 2"])
+
+    def test_category_filter(self):
+        self.assertEqual(self.names("piano", category="PNO"), ["Grand Piano", "JUNO Piano 1", "JUNO Piano 2"])
+        self.assertEqual(self.names("", category="STR"), ["JUNO Strings", "Full Strings"])
+        self.assertEqual(self.names("piano", category="BRS"), [])
+
+    def test_typos(self):
+        self.assertEqual(self.names("grnad piano")[0], "Grand Piano")
+        self.assertEqual(self.names("jazz orgna"), ["Jazz Organ"])
+        self.assertEqual(self.names("qzxv"), [])
+        self.assertEqual(self.names("grnad piano", category="STR"), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import os, tempfile, unittest
+
+from support import EmulatorTestCase, MODEL_ID, device_bytes, g, set_device_bytes
+
+SCENE = {"parts": {"1": {"level": 80, "octave_shift": -1}}, "zones": {"2": {"on": True, "low_key": "C4"}}}
+
+class SceneTest(EmulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "scenes.json")
+
+    def test_scene_apply(self):
+        g.store_scenes({"split": SCENE}, self.path)
+        messages, _ = g.apply_scene(g.load_scenes(self.path)["split"], MODEL_ID, self.midi_manager)
+        self.assertGreater(messages, 0)
+        self.midi_manager.tx.flush()
+        part = g.ParamBlock.from_bytes(g.PART_MODEL, device_bytes(self.emulator, g.calculate_part_address(1), g.PART_SIZE))
+        zone = g.ParamBlock.from_bytes(g.ZONE_MODEL, device_bytes(self.emulator, g.calculate_zone_address(2), g.ZONE_SIZE))
+        self.assertEqual((part["PartLevel(CC#7)"], part["PartOctaveShift"]), (80, -1))
+        self.assertEqual((zone["ZoneSw"], zone["KbdRangeLower"]), (1, g.KEYS.index("C4")))
+        self.assertEqual(g.apply_scene(SCENE, MODEL_ID, self.midi_manager), (0, 0)) # nothing left to change
+
+    def test_scene_apply_after_a_panel_edit(self):
+        g.apply_scene(SCENE, MODEL_ID, self.midi_manager)
+        self.midi_manager.tx.flush()
+        addr = g.calculate_part_address(1)
+        set_device_bytes(self.emulator, addr, 7, 5) # level changed on the keyboard, the shadow still holds 80
+        self.assertEqual(g.apply_scene(SCENE, MODEL_ID, self.midi_manager)[0], 1)
+        self.midi_manager.tx.flush()
+        self.assertEqual(device_bytes(self.emulator, addr, g.PART_SIZE)[7], 80)
+
+if __name__ == "__main__":
+    unittest.main()
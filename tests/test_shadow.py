@@ -0,0 +1,33 @@
+import unittest
+
+from support import EmulatorTestCase, MODEL_ID, device_bytes, g, set_device_bytes
+
+LEVEL = "PartLevel(CC#7)"
+LEVEL_OFFSET = 7
+
+class ShadowTest(EmulatorTestCase):
+    def test_reads_are_answered_from_the_shadow(self):
+        addr = g.calculate_part_address(1)
+        data = g.read_map_data(addr, g.PART_SIZE, MODEL_ID, self.midi_manager)
+        self.assertEqual(self.midi_manager.shadow.get(MODEL_ID, addr, g.PART_SIZE), data)
+        self.assertEqual(g.read_map_data(addr, g.PART_SIZE, MODEL_ID, self.midi_manager), data)
+        self.assertEqual(self.midi_manager.stats.counters["shadow hits"], 1)
+
+    def test_writes_update_the_shadow(self):
+        addr = g.calculate_part_address(1)
+        g.write_map_data(addr, [1, 2], MODEL_ID, self.midi_manager).result(timeout=5)
+        self.assertEqual(self.midi_manager.shadow.get(MODEL_ID, addr, 2), [1, 2])
+
+class NoShadowTest(EmulatorTestCase):
+    emulator_options = {"use_shadow": False}
+
+    def test_update_params_reads_the_device(self):
+        addr = g.calculate_part_address(1)
+        level = g.get_params(g.PART_MODEL, addr, MODEL_ID, self.midi_manager)[LEVEL]
+        set_device_bytes(self.emulator, addr, LEVEL_OFFSET, 5) # changed on the keyboard, the shadow still holds the old level
+        g.update_params(g.PART_MODEL, addr, {LEVEL: level}, MODEL_ID, self.midi_manager)
+        self.midi_manager.tx.flush()
+        self.assertEqual(device_bytes(self.emulator, addr, g.PART_SIZE)[LEVEL_OFFSET], level)
+
+if __name__ == "__main__":
+    unittest.main()
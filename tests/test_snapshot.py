@@ -0,0 +1,37 @@
+import contextlib, io, json, os, tempfile, types, unittest
+
+from support import EmulatorTestCase, MODEL_ID, device_bytes, g, set_device_bytes
+
+class SnapshotTest(EmulatorTestCase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.args = types.SimpleNamespace(model='GK', file=os.path.join(directory.name, "snapshot.json"))
+
+    def save(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            g.snapshot_save(self.args, self.midi_manager)
+        with open(self.args.file) as f:
+            return {int(block["address"], 16): list(bytes.fromhex(block["data"])) for block in json.load(f)["blocks"]}
+
+    def test_snapshot_round_trip(self):
+        saved = self.save()
+        self.assertEqual(saved, {addr: device_bytes(self.emulator, addr, g.codec_for(data_model).size) for _, addr, data_model in g.device_blocks()})
+        set_device_bytes(self.emulator, g.calculate_part_address(2), 7, 5) # changed on the keyboard, unknown to the shadow
+        set_device_bytes(self.emulator, g.calculate_zone_address(3), 12, 40)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            g.snapshot_load(self.args, self.midi_manager)
+        self.assertIn(f"2 of {len(saved)} blocks differed", output.getvalue())
+        self.midi_manager.tx.flush()
+        for addr, data in saved.items():
+            self.assertEqual(device_bytes(self.emulator, addr, len(data)), data, f"block at {addr:08X}")
+
+    def test_save_reads_the_device(self):
+        self.save()
+        addr = g.calculate_part_address(2)
+        set_device_bytes(self.emulator, addr, 7, 5) # the shadow still holds the level of the first save
+        self.assertEqual(self.save()[addr][7], 5)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import contextlib, io, os, tempfile, types, unittest
+
+from support import EmulatorTestCase, MODEL_ID, g
+
+START = g.calculate_part_address(1)
+SIZE = 2 * g.MAX_RQ1_SIZE + 100 # three chunks, the last one short
+
+def expected_bytes(emulator, start, size):
+    memory = emulator.memory[MODEL_ID]
+    base = g.reassemble_from_7bit(start)
+    return bytes(memory.get(base + i, 0) for i in range(size))
+
+class StreamDropTest(EmulatorTestCase):
+    emulator_options = {"drop": 0.3, "timeout": 0.05, "retries": 20, "use_shadow": False}
+
+    def test_large_read_despite_drops(self):
+        data = g.read_map_large(START, SIZE, MODEL_ID, self.midi_manager, chunk_size=0x100)
+        self.assertEqual(bytes(data), expected_bytes(self.emulator, START, SIZE))
+        self.assertGreater(self.midi_manager.stats.counters["retries"], 0)
+
+class StreamOrderTest(EmulatorTestCase):
+    def test_chunks_arrive_in_order(self):
+        chunks = list(g.read_map_stream(START, SIZE, MODEL_ID, self.midi_manager, chunk_size=0x200, window=3))
+        self.assertEqual([addr for addr, _ in chunks], [g.slice_to_7bit(g.reassemble_from_7bit(START) + offset) for offset in range(0, SIZE, 0x200)])
+        self.assertEqual(b"".join(map(bytes, (data for _, data in chunks))), expected_bytes(self.emulator, START, SIZE))
+
+    def test_sys_dump_to_a_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            args = types.SimpleNamespace(model='GK', address=START, size=SIZE, chunk=g.MAX_RQ1_SIZE, output=os.path.join(directory, "dump.bin"))
+            with contextlib.redirect_stdout(io.StringIO()):
+                g.sys_dump(args, self.midi_manager)
+            with open(args.output, "rb") as f:
+                self.assertEqual(f.read(), expected_bytes(self.emulator, START, SIZE))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import time, unittest
+
+from support import MODEL_ID, g, open_emulated
+
+class RecordingPort:
+    """MIDI output remembering when each message was handed over."""
+    def __init__(self):
+        self.sent_at = []
+    def send_message(self, message):
+        self.sent_at.append(time.monotonic())
+
+class FailingPort:
+    """MIDI output that breaks after a few messages, like an unplugged keyboard."""
+    def __init__(self, working=2):
+        self.working = working
+    def send_message(self, message):
+        if self.working == 0:
+            raise OSError("port closed")
+        self.working -= 1
+
+MESSAGE = bytes(31) # a DT1 of about the size part set sends
+
+class PacingTest(unittest.TestCase):
+    def send_burst(self, **options):
+        port = RecordingPort()
+        tx = g.TxScheduler(port, **options)
+        self.addCleanup(tx.close)
+        tx.send_many([MESSAGE] * 10).result(timeout=5)
+        return port.sent_at[-1] - port.sent_at[0]
+
+    def test_no_rate_limit_by_default(self):
+        self.assertIsNone(g.DEFAULT_TX_RATE)
+        self.assertLess(self.send_burst(), 0.05)
+
+    def test_rate_limit(self):
+        self.assertGreaterEqual(self.send_burst(rate=g.DIN_TX_RATE), 9 * len(MESSAGE) / g.DIN_TX_RATE)
+
+    def test_gap(self):
+        self.assertGreaterEqual(self.send_burst(gap=0.01), 0.09)
+
+class FailureTest(unittest.TestCase):
+    def test_send_failure_fails_queued_messages(self):
+        tx = g.TxScheduler(FailingPort())
+        sent = [tx.send(bytes((0xB0, 7, value))) for value in range(10)]
+        with self.assertRaises(OSError):
+            tx.flush()
+        self.assertEqual([future.exception() is None for future in sent], [True, True] + [False] * 8)
+        self.assertIsInstance(tx.send(bytes((0xB0, 7, 0))).exception(timeout=1), OSError)
+        with self.assertRaises(OSError):
+            tx.close()
+        self.assertFalse(tx.thread.is_alive())
+
+    def test_requests_fail_when_the_port_breaks(self):
+        midi_manager, emulator = open_emulated()
+        self.addCleanup(emulator.close)
+        midi_manager.tx.midi_out = FailingPort(0)
+        start = time.monotonic()
+        with self.assertRaises(OSError):
+            midi_manager.request_read(g.SETUP, g.SETUP_SIZE, MODEL_ID).result(timeout=10)
+        self.assertLess(time.monotonic() - start, 1.0) # failed at once, not after retries
+        with self.assertRaises(OSError):
+            midi_manager.close_devices()
+
+if __name__ == "__main__":
+    unittest.main()